@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Glossary Rewrite Benchmark
+
+Measures wall time and peak memory of rewriting a markdown file with its
+glossary links, comparing the single-pass ``apply_edits`` rewrite with the
+previous per-link string splicing.
+
+By default the largest markdown file under docs/ is used.
+
+Usage:
+    python benchmarks/bench_apply_edits.py [--file docs/path/to/page.md]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_term_matcher import load_linker_module
+
+DOCS_ROOT = Path(__file__).resolve().parent.parent / 'docs'
+
+
+def splice_rewrite(content, edits):
+    """Previous rewrite strategy: one full-string copy per link."""
+    for start, end, link in sorted(edits, reverse=True):
+        content = content[:start] + link + content[end:]
+    return content
+
+
+def measure(func, *args, repeat=5):
+    """Return (result, best wall time, peak traced memory) for func(*args)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark glossary link rewriting')
+    parser.add_argument('--file', type=Path,
+                        help='Markdown file to rewrite (default: largest file under docs/)')
+    parser.add_argument('--docs-root', type=Path, default=DOCS_ROOT)
+    args = parser.parse_args()
+
+    linker_module = load_linker_module()
+    linker = linker_module.GlossaryLinker(args.docs_root)
+    linker.terms = linker.load_glossary_terms()
+
+    file_path = args.file
+    if file_path is None:
+        file_path = max(args.docs_root.rglob('*.md'), key=lambda path: path.stat().st_size)
+    file_path = file_path.resolve()
+
+    content = file_path.read_text(encoding='utf-8')
+    edits = [
+        (start, end, linker.create_glossary_link(text, anchor, file_path))
+        for text, start, end, anchor, _ in linker.find_linkable_terms(content)
+    ]
+
+    spliced, splice_time, splice_peak = measure(splice_rewrite, content, edits)
+    applied, apply_time, apply_peak = measure(linker_module.apply_edits, content, edits)
+
+    print(f"File:            {file_path} ({len(content) / 1024:.0f} KB, {len(edits)} links)")
+    print(f"Per-link splice: {splice_time * 1000:.2f} ms, peak {splice_peak / 1024:.0f} KB")
+    print(f"apply_edits:     {apply_time * 1000:.2f} ms, peak {apply_peak / 1024:.0f} KB")
+    print(f"Identical output: {spliced == applied}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
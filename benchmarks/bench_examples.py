@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Code Example Validator Benchmark
+
+Generates a docs tree whose pages contain C, JavaScript and JSON code
+blocks drawn from a small pool of snippets (so most blocks are copies of
+others, as in the real docs), some of them with a known syntax error.
+
+The blocks are validated with scripts/example_validator.py cold and with a
+warm cache, and with the previous approach of one compiler launch per block
+(``gcc -fsyntax-only`` for C and ``node --check`` for JavaScript, like
+tools/test-examples.js). The run also checks that exactly the blocks with
+an injected error are reported, and exits with status 1 if not. Compilers
+that are not installed are left out.
+
+Usage:
+    python benchmarks/bench_examples.py [--pages 100] [--blocks 10] [--snippets 60]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / 'scripts'))
+
+from docs_corpus import DocsCorpus  # noqa: E402
+from example_validator import C_PRELUDE, ExampleValidator  # noqa: E402
+
+# What the C snippets need from prop.h to compile on their own
+PROP_H = ('typedef struct prop prop_t; enum { PROP_SET_INT };\n'
+          'void prop_set(prop_t *p, const char *name, int how, ...);')
+
+
+def make_snippet(language: str, index: int, broken: bool) -> str:
+    """Return a snippet; broken ones have one syntax error."""
+    if language == 'c':
+        return '\n'.join([
+            '#include "prop.h"',
+            f'static int handler_{index}(prop_t *p, int value)',
+            '{',
+            f'  int total = value * {index};',
+            '  prop_set(p, "count", PROP_SET_INT, total)' + ('' if broken else ';'),
+            '  return total;',
+            '}',
+        ])
+    if language == 'javascript':
+        return '\n'.join([
+            f'var page{index} = require("movian/page");',
+            f'new page{index}.Route("example:{index}", function(page) {{',
+            '  page.type = "directory";',
+            '  page.appendItem("", "separator", { title: "Items" ' + ('' if broken else '}') + ');',
+            '});',
+        ])
+    data = {'id': f'plugin.{index}', 'version': '1.0.0', 'type': 'ecmascript'}
+    text = json.dumps(data, indent=2)
+    return text.replace(',', '', 1) if broken else text
+
+
+def generate_docs(docs_root: Path, languages, pages: int, blocks: int, snippets: int,
+                  error_rate: float, rng: random.Random):
+    """Write pages of code blocks; return {(page, fence line): broken}."""
+    pool = [(language, make_snippet(language, index, rng.random() < error_rate))
+            for index in range(snippets) for language in languages]
+    expectations = {}
+    docs_root.mkdir(parents=True)
+    for page_index in range(pages):
+        page = f"page-{page_index:03d}.md"
+        lines = ['# Examples', '']
+        for _ in range(blocks):
+            language, code = rng.choice(pool)
+            lines.append('Example:')
+            lines.append('')
+            expectations[(page, len(lines) + 1)] = code
+            lines.append(f'```{language}')
+            lines.extend(code.split('\n'))
+            lines.append('```')
+            lines.append('')
+        (docs_root / page).write_text('\n'.join(lines), encoding='utf-8')
+    return expectations
+
+
+def one_at_a_time(blocks, directory: Path) -> int:
+    """Launch a compiler per block, like tools/test-examples.js; return failures."""
+    failures = 0
+    for _, (language, _, code) in blocks:
+        if language == 'json':
+            try:
+                json.loads(code)
+            except ValueError:
+                failures += 1
+            continue
+        path = directory / ('example.c' if language == 'c' else 'example.js')
+        if language == 'c':
+            code = C_PRELUDE + code.replace('#include "prop.h"', PROP_H)
+            command = ['gcc', '-fsyntax-only', '-w', str(path)]
+        else:
+            command = ['node', '--check', str(path)]
+        path.write_text(code, encoding='utf-8')
+        if subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode:
+            failures += 1
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark code example validation')
+    parser.add_argument('--pages', type=int, default=100, help='Pages in the docs tree')
+    parser.add_argument('--blocks', type=int, default=10, help='Code blocks per page')
+    parser.add_argument('--snippets', type=int, default=60,
+                        help='Distinct snippets per language')
+    parser.add_argument('--errors', type=float, default=0.1,
+                        help='Fraction of snippets with a syntax error')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    languages = ['json'] + [language for language, tool in (('c', 'gcc'), ('javascript', 'node'))
+                            if shutil.which(tool)]
+    rng = random.Random(42)
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_root = Path(tmp) / 'docs'
+        cache_path = Path(tmp) / 'example-validation-cache.json'
+        expectations = generate_docs(docs_root, languages, args.pages, args.blocks,
+                                     args.snippets, args.errors, rng)
+        blocks = list(DocsCorpus(docs_root).code_blocks())
+        broken = {key for key, code in expectations.items()
+                  if code in {make_snippet(language, index, True)
+                              for index in range(args.snippets) for language in languages}}
+
+        start = time.perf_counter()
+        naive_failures = one_at_a_time(blocks, Path(tmp))
+        naive_time = time.perf_counter() - start
+
+        cold = ExampleValidator(cache_path, jobs=args.jobs)
+        start = time.perf_counter()
+        issues = cold.validate(blocks)
+        cold_time = time.perf_counter() - start
+        cold.save_cache()
+
+        warm = ExampleValidator(cache_path, jobs=args.jobs)
+        start = time.perf_counter()
+        warm_issues = warm.validate(blocks)
+        warm_time = time.perf_counter() - start
+        if warm.checked or warm_issues != issues:
+            failures.append(f"warm run checked {warm.checked} blocks")
+
+        reported = {(issue['file'], issue['block']) for issue in issues}
+        if reported != broken:
+            failures.append(f"reported {len(reported)} broken blocks, expected {len(broken)} "
+                            f"({len(reported - broken)} wrong, {len(broken - reported)} missed)")
+        if naive_failures != len(broken):
+            failures.append(f"one at a time found {naive_failures} broken blocks, "
+                            f"expected {len(broken)}")
+
+    print(f"Blocks:               {len(blocks)} ({', '.join(languages)}), "
+          f"{cold.unique} unique, {len(broken)} broken")
+    print(f"One launch per block: {naive_time * 1000:.1f} ms")
+    print(f"Batched (cold):       {cold_time * 1000:.1f} ms, {cold.checked} checked")
+    print(f"Batched (cached):     {warm_time * 1000:.1f} ms, {warm.cache_hits} cached")
+    print(f"Speedup:              {naive_time / cold_time:.1f}x cold, "
+          f"{naive_time / warm_time:.1f}x cached")
+
+    if failures:
+        print("\nFailures:")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        return 1
+
+    print("\nAll broken examples reported as expected")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Glossary Plugin Benchmark
+
+Measures what glossary linking adds to a ``mkdocs build`` of the docs tree
+(161 pages) in two ways:
+
+- running scripts/link-glossary-terms.py before the build, as a separate
+  process that rewrites the copied source files (with no link manifest, and
+  again with a warm one)
+- the glossary plugin (scripts/glossary_plugin.py) linking pages in memory:
+  ``on_config`` plus ``on_page_markdown`` for every page of a first build,
+  and for a ``mkdocs serve`` rebuild after one page was edited
+
+The plugin events are called directly rather than through full builds, as
+the rest of a build takes the same time either way and would only add
+noise. The run also checks that the plugin produces the same markdown the
+script writes for every page, and that the rebuild relinks only the edited
+page, and exits with status 1 if not.
+
+Usage:
+    python benchmarks/bench_glossary_plugin.py [--docs-root docs] [--repeat 5]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from docs_corpus import iter_markdown_files  # noqa: E402
+from glossary_plugin import GlossaryLinkPlugin  # noqa: E402
+
+
+def read_pages(docs_root: Path):
+    """Return (page, markdown) pairs for every page, as MkDocs would pass them."""
+    pages = []
+    for path in sorted(iter_markdown_files(docs_root)):
+        src_uri = path.relative_to(docs_root).as_posix()
+        page = SimpleNamespace(file=SimpleNamespace(abs_src_path=str(path), src_uri=src_uri))
+        pages.append((page, path.read_text(encoding='utf-8')))
+    return pages
+
+
+def build(plugin: GlossaryLinkPlugin, docs_root: Path, pages):
+    """Run the plugin events of one build; return the linked markdown by page."""
+    config = {'docs_dir': str(docs_root)}
+    plugin.on_config(config)
+    return {page.file.src_uri: plugin.on_page_markdown(markdown, page=page, config=config,
+                                                       files=None)
+            for page, markdown in pages}
+
+
+def run_script(docs_root: Path, cache: Path = None) -> float:
+    """Run link-glossary-terms.py over docs_root; return its wall time."""
+    command = [sys.executable, str(SCRIPTS_DIR / 'link-glossary-terms.py'),
+               '--docs-root', str(docs_root), '--no-index']
+    command += ['--cache', str(cache)] if cache else ['--no-cache']
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def best_of(repeat: int, measure) -> float:
+    return min(measure() for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the glossary MkDocs plugin')
+    parser.add_argument('--docs-root', type=Path, default=BENCH_DIR.parent / 'docs',
+                        help='Docs tree to link (default: docs/)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per measurement; the fastest is reported')
+    args = parser.parse_args()
+
+    pages = read_pages(args.docs_root)
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        def fresh_copy() -> Path:
+            target = tmp / 'docs'
+            shutil.rmtree(target, ignore_errors=True)
+            shutil.copytree(args.docs_root, target)
+            return target
+
+        def script_cold() -> float:
+            return run_script(fresh_copy())
+
+        def script_warm() -> float:
+            cache = tmp / 'glossary-link-cache.json'
+            cache.unlink(missing_ok=True)
+            docs_root = fresh_copy()
+            run_script(docs_root, cache)
+            return run_script(docs_root, cache)
+
+        cold_script_time = best_of(args.repeat, script_cold)
+        warm_script_time = best_of(args.repeat, script_warm)
+
+        # What the script writes, to compare with the plugin output
+        docs_root = fresh_copy()
+        run_script(docs_root)
+        expected = {page.file.src_uri: (docs_root / page.file.src_uri).read_text(encoding='utf-8')
+                    for page, _ in pages}
+
+    def plugin_cold() -> float:
+        start = time.perf_counter()
+        build(GlossaryLinkPlugin(), args.docs_root, pages)
+        return time.perf_counter() - start
+
+    cold_plugin_time = best_of(args.repeat, plugin_cold)
+
+    plugin = GlossaryLinkPlugin()
+    linked = build(plugin, args.docs_root, pages)
+    mismatched = [uri for uri, markdown in linked.items() if markdown != expected[uri]]
+    if mismatched:
+        failures.append(f"{len(mismatched)} pages differ from the script output, "
+                        f"e.g. {mismatched[0]}")
+
+    # Edit the largest page, as when it is saved during mkdocs serve
+    edited = max(range(len(pages)), key=lambda index: len(pages[index][1]))
+    page, markdown = pages[edited]
+    rebuild_times = []
+    for revision in range(args.repeat):
+        pages[edited] = (page, markdown + f"\nEdited {revision}: the Plugin API.\n")
+        start = time.perf_counter()
+        build(plugin, args.docs_root, pages)
+        rebuild_times.append(time.perf_counter() - start)
+        if plugin.pages_linked != 1:
+            failures.append(f"rebuild {revision} relinked {plugin.pages_linked} pages")
+    rebuild_time = min(rebuild_times)
+
+    print(f"Pages:                      {len(pages)} ({plugin.pages_cached} cached on rebuild)")
+    print(f"Links:                      {sum(link[2] for link in plugin.pages.values())}")
+    print(f"Script first (no manifest): {cold_script_time * 1000:.1f} ms")
+    print(f"Script first (manifest):    {warm_script_time * 1000:.1f} ms")
+    print(f"Plugin (first build):       {cold_plugin_time * 1000:.1f} ms")
+    print(f"Plugin (serve rebuild):     {rebuild_time * 1000:.1f} ms, "
+          f"relinked {pages[edited][0].file.src_uri}")
+    print(f"Speedup:                    {cold_script_time / cold_plugin_time:.1f}x first build, "
+          f"{warm_script_time / rebuild_time:.1f}x rebuild")
+
+    if failures:
+        print("\nFailures:")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        return 1
+
+    print("\nPlugin output matches the script on every page")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+External Link Checker Benchmark
+
+Checks a batch of URLs served by local HTTP stand-in servers (one per
+simulated host, each adding a fixed response latency) with the async
+ExternalLinkChecker from scripts/link_validator.py, and compares it with
+checking the URLs one at a time as tools/check-links.js does.
+
+The stand-in servers answer with known outcomes (200, 404, HEAD rejected
+with 405, redirects, timeouts), so the run also verifies every result, the
+per-host connection limit and that a second run is served from the cache.
+The script exits with status 1 if any of these checks fail.
+
+Usage:
+    python benchmarks/bench_link_validator.py [--urls 200] [--hosts 4] [--latency 0.05]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / 'scripts'))
+
+from link_validator import ExternalLinkChecker  # noqa: E402
+
+# Path prefix -> expected outcome
+EXPECTED = {
+    'ok': True,
+    'missing': False,
+    'nohead': True,
+    'redirect': True,
+    'slow': False,
+}
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float, slow_delay: float):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.latency = latency
+        self.slow_delay = slow_delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, send_body: bool):
+        server = self.server
+        kind = self.path.strip('/').split('/')[0]
+        # Timed-out requests keep sleeping after the client gave up; leave them out
+        counted = kind != 'slow'
+        if counted:
+            with server.lock:
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.latency)
+
+            if kind == 'slow':
+                time.sleep(server.slow_delay)
+                status, headers = 200, {}
+            elif kind == 'missing':
+                status, headers = 404, {}
+            elif kind == 'nohead' and not send_body:
+                status, headers = 405, {}
+            elif kind == 'redirect':
+                status, headers = 301, {'Location': self.path.replace('/redirect/', '/ok/', 1)}
+            else:
+                status, headers = 200, {}
+
+            body = f"{status} {self.path}\n".encode('utf-8')
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+        finally:
+            if counted:
+                with server.lock:
+                    server.in_flight -= 1
+
+
+def sequential_check(urls, timeout):
+    """Check URLs one at a time, a new connection per request."""
+    results = {}
+    for url in urls:
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method='HEAD'),
+                                        timeout=timeout) as response:
+                results[url] = 200 <= response.status < 300
+        except urllib.error.HTTPError as e:
+            if e.code == 405:
+                try:
+                    with urllib.request.urlopen(url, timeout=timeout) as response:
+                        results[url] = 200 <= response.status < 300
+                        continue
+                except (urllib.error.URLError, OSError):
+                    pass
+            results[url] = False
+        except (urllib.error.URLError, OSError):
+            results[url] = False
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark external link checking')
+    parser.add_argument('--urls', type=int, default=200, help='Number of URLs to check')
+    parser.add_argument('--hosts', type=int, default=4, help='Number of stand-in servers')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Seconds each stand-in response is delayed')
+    parser.add_argument('--per-host', type=int, default=4,
+                        help='Connection limit per host for the async checker')
+    parser.add_argument('--skip-sequential', action='store_true',
+                        help='Do not run the one-at-a-time baseline')
+    args = parser.parse_args()
+
+    timeout = 1.0
+    servers = [StandInServer(args.latency, slow_delay=timeout * 2) for _ in range(args.hosts)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    kinds = list(EXPECTED)
+    urls = []
+    for index in range(args.urls):
+        server = servers[index % len(servers)]
+        # Only a few deliberately slow URLs, so timeouts do not dominate
+        kind = kinds[index % (len(kinds) - 1)] if index % 50 else 'slow'
+        urls.append(f"http://127.0.0.1:{server.server_address[1]}/{kind}/{index}")
+
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / 'link-cache.json'
+        checker = ExternalLinkChecker(cache_path=cache_path, per_host=args.per_host,
+                                      timeout=timeout)
+        start = time.perf_counter()
+        results = checker.check(urls)
+        async_time = time.perf_counter() - start
+        checker.save_cache()
+
+        for url, result in results.items():
+            kind = url.split('/')[3]
+            if result['ok'] != EXPECTED[kind]:
+                failures.append(f"{url}: expected ok={EXPECTED[kind]}, got {result}")
+
+        max_in_flight = max(server.max_in_flight for server in servers)
+        if max_in_flight > args.per_host:
+            failures.append(f"{max_in_flight} concurrent requests to one host "
+                            f"(limit {args.per_host})")
+
+        cached_checker = ExternalLinkChecker(cache_path=cache_path, per_host=args.per_host,
+                                             timeout=timeout)
+        start = time.perf_counter()
+        cached_results = cached_checker.check(urls)
+        cached_time = time.perf_counter() - start
+        if cached_checker.requests or cached_results != results:
+            failures.append(f"cached run made {cached_checker.requests} requests")
+
+    print(f"URLs:                 {len(urls)} across {len(servers)} hosts, "
+          f"{args.latency * 1000:.0f} ms latency")
+    print(f"Async checker:        {async_time:.2f} s, {checker.requests} requests over "
+          f"{checker.connections} connections (max {max_in_flight} in flight per host)")
+    print(f"Cached rerun:         {cached_time * 1000:.1f} ms, {cached_checker.requests} requests")
+
+    if not args.skip_sequential:
+        start = time.perf_counter()
+        sequential = sequential_check(urls, timeout)
+        sequential_time = time.perf_counter() - start
+        print(f"One at a time:        {sequential_time:.2f} s")
+        print(f"Speedup:              {sequential_time / async_time:.1f}x")
+        mismatched = [url for url in urls if sequential[url] != results[url]['ok']]
+        if mismatched:
+            failures.append(f"{len(mismatched)} results differ from the sequential check, "
+                            f"e.g. {mismatched[0]}")
+
+    for server in servers:
+        server.shutdown()
+
+    if failures:
+        print("\nFailures:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    print("\nAll results match the stand-in servers")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Parallel Glossary Relink Benchmark
+
+Runs a full dry-run relink of a synthetic docs tree with an increasing
+number of worker processes and reports speedup and parallel efficiency.
+
+Usage:
+    python benchmarks/bench_parallel_relink.py [--files 2000] [--max-jobs 16]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_term_matcher import load_linker_module
+from synthetic_corpus import generate_docs_tree, generate_terms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parallel glossary relinking')
+    parser.add_argument('--terms', type=int, default=1000,
+                        help='Number of synthetic glossary entries')
+    parser.add_argument('--files', type=int, default=2000,
+                        help='Number of synthetic markdown files')
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1,
+                        help='Largest worker count to measure')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    linker_module = load_linker_module()
+    term_names = generate_terms(args.terms, args.seed)
+
+    job_counts = [1]
+    while job_counts[-1] * 2 <= args.max_jobs:
+        job_counts.append(job_counts[-1] * 2)
+    if job_counts[-1] != args.max_jobs:
+        job_counts.append(args.max_jobs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_root = Path(tmp)
+        generate_docs_tree(docs_root, term_names, args.files, seed=args.seed)
+
+        print(f"{'jobs':>5} {'time (s)':>9} {'speedup':>8} {'efficiency':>11}")
+        baseline = None
+        for jobs in job_counts:
+            linker = linker_module.GlossaryLinker(docs_root)
+            start = time.perf_counter()
+            linker.process_all_files(dry_run=True, jobs=jobs)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = elapsed
+            speedup = baseline / elapsed
+            print(f"{jobs:>5} {elapsed:>9.2f} {speedup:>7.2f}x {speedup / jobs:>10.0%}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
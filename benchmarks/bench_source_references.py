@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Source Reference Validator Benchmark
+
+Generates a stand-in Movian checkout (C files full of functions, some with
+prototypes) and a docs tree whose pages reference those functions as
+"`fn()` in `movian/src/...c:START-END`", then shifts some source files down
+so their references drift, and adds references past the end of a file and
+to missing files.
+
+The references are validated with scripts/source_reference_validator.py
+cold and with a warm cache, and with the previous approach of reading the
+whole source file again for every reference. The run also checks that
+exactly the expected errors and drift warnings (with the right distance)
+are reported, and exits with status 1 if not. The stand-in tree is a git
+checkout (the shifted files are uncommitted changes) unless --no-git is
+given.
+
+Usage:
+    python benchmarks/bench_source_references.py [--files 2000] [--references 3000] [--no-git]
+"""
+
+import argparse
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / 'scripts'))
+
+from docs_corpus import DocsCorpus  # noqa: E402
+from source_reference_validator import SourceReferenceValidator  # noqa: E402
+
+SHIFT = 100  # Lines inserted at the top of drifted files
+
+
+def generate_source_tree(root: Path, file_count: int, functions: int, rng: random.Random):
+    """Write stand-in C files; return {file: {function: (start, end)}}."""
+    layout = {}
+    for index in range(file_count):
+        file = f"src/mod_{index // 100:02d}/file_{index:04d}.c"
+        lines = ['#include "main.h"', '']
+        names = [f"fn_{index}_{k}" for k in range(functions)]
+        lines.extend(f"static int {name}(int a, int b);" for name in names[::3])
+        lines.append('')
+
+        spans = {}
+        for name in names:
+            start = len(lines) + 1
+            lines.append('static int')
+            lines.append(f'{name}(int a, int b)')
+            lines.append('{')
+            for step in range(rng.randint(5, 40)):
+                lines.append(f'  a = a * {step} + b; /* {name} */')
+            lines.append('  return a;')
+            lines.append('}')
+            spans[name] = (start + 1, len(lines))
+            lines.append('')
+
+        path = root / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        layout[file] = spans
+    return layout
+
+
+def generate_docs(docs_root: Path, layout, reference_count: int, rng: random.Random):
+    """Write pages referencing functions; return (doc line, expectation) per reference."""
+    files = sorted(layout)
+    expectations = []
+    pages = {}
+
+    for index in range(reference_count):
+        page = f"page-{index % 200:03d}.md"
+        lines = pages.setdefault(page, ['# Page', ''])
+        file = rng.choice(files)
+        name, (start, end) = rng.choice(sorted(layout[file].items()))
+
+        if index % 97 == 0:
+            reference, expected = f"src/missing/file_{index}.c:{start}", 'missing'
+        elif index % 89 == 0:
+            reference, expected = f"{file}:{start + 100000}", 'range'
+        else:
+            reference, expected = f"{file}:{start}-{end}", file
+
+        lines.append(f"**Source Reference:** `{name}()` in `movian/{reference}`")
+        lines.append('')
+        expectations.append((page, len(lines) - 1, expected))
+
+    docs_root.mkdir(parents=True)
+    for page, lines in pages.items():
+        (docs_root / page).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return expectations
+
+
+def commit_tree(root: Path):
+    """Make the stand-in tree a git checkout, like a real Movian clone."""
+    git = ['git', '-c', 'user.name=bench', '-c', 'user.email=bench@localhost']
+    for command in (['init', '-q'], ['add', '-A'], ['commit', '-q', '-m', 'stand-in']):
+        subprocess.run(git + command, cwd=root, check=True)
+
+
+def shift_files(root: Path, files):
+    for file in files:
+        path = root / file
+        path.write_text('/* moved */\n' * SHIFT + path.read_text(encoding='utf-8'),
+                        encoding='utf-8')
+
+
+def naive_validate(source_root: Path, references):
+    """Read the whole file for every reference, like tools/validate-references.js."""
+    issues = 0
+    for _, (file, start, end, _, symbol) in references:
+        path = source_root / file
+        if not path.exists():
+            issues += 1
+            continue
+        content = path.read_text(encoding='utf-8')
+        lines = content.split('\n')
+        if start > len(lines) or (end and end > len(lines)):
+            issues += 1
+            continue
+        match = re.search(r'^' + re.escape(symbol) + r'\(', content, re.MULTILINE)
+        if match and not start <= content.count('\n', 0, match.start()) + 1 <= (end or start):
+            issues += 1
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark source reference validation')
+    parser.add_argument('--files', type=int, default=2000, help='Stand-in source files')
+    parser.add_argument('--functions', type=int, default=40, help='Functions per source file')
+    parser.add_argument('--references', type=int, default=3000, help='References in the docs')
+    parser.add_argument('--drift', type=float, default=0.05,
+                        help='Fraction of source files shifted down')
+    parser.add_argument('--no-git', action='store_true',
+                        help='Do not make the stand-in tree a git checkout')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_root = Path(tmp) / 'movian'
+        docs_root = Path(tmp) / 'docs'
+        cache_path = Path(tmp) / 'source-reference-cache.json'
+
+        layout = generate_source_tree(source_root, args.files, args.functions, rng)
+        expectations = generate_docs(docs_root, layout, args.references, rng)
+        if not args.no_git:
+            commit_tree(source_root)
+        shifted = set(rng.sample(sorted(layout), int(len(layout) * args.drift)))
+        shift_files(source_root, shifted)
+
+        references = list(DocsCorpus(docs_root).source_references())
+        if len(references) != len(expectations):
+            failures.append(f"corpus found {len(references)} references, "
+                            f"expected {len(expectations)}")
+
+        start = time.perf_counter()
+        naive_validate(source_root, references)
+        naive_time = time.perf_counter() - start
+
+        cold = SourceReferenceValidator(source_root, cache_path)
+        start = time.perf_counter()
+        issues = cold.validate(references)
+        cold_time = time.perf_counter() - start
+        cold.save_cache()
+
+        warm = SourceReferenceValidator(source_root, cache_path)
+        start = time.perf_counter()
+        warm_issues = warm.validate(references)
+        warm_time = time.perf_counter() - start
+        if warm.files_indexed or warm_issues != issues:
+            failures.append(f"warm run indexed {warm.files_indexed} files")
+
+        reported = {(issue['file'], issue['line']): issue for issue in issues}
+        for page, line, expected in expectations:
+            issue = reported.pop((page, line), None)
+            if expected == 'missing':
+                ok = issue is not None and issue['message'].startswith('File does not exist')
+            elif expected == 'range':
+                ok = issue is not None and 'exceeds file length' in issue['message']
+            elif expected in shifted:
+                ok = issue is not None and issue.get('drift') == SHIFT
+            else:
+                ok = issue is None
+            if not ok:
+                failures.append(f"{page}:{line}: expected {expected}, got {issue}")
+        failures.extend(f"unexpected issue: {issue}" for issue in reported.values())
+
+    print(f"References:           {len(references)} into {len({r[1][0] for r in references})} "
+          f"of {args.files} files ({len(shifted)} files shifted by {SHIFT} lines)")
+    print(f"Issues:               {len(issues)}")
+    print(f"Whole file per ref:   {naive_time * 1000:.1f} ms")
+    print(f"Line index (cold):    {cold_time * 1000:.1f} ms, {cold.files_indexed} files indexed")
+    print(f"Line index (cached):  {warm_time * 1000:.1f} ms, {warm.cache_hits} cached")
+    print(f"Speedup:              {naive_time / cold_time:.1f}x cold, "
+          f"{naive_time / warm_time:.1f}x cached")
+
+    if failures:
+        print("\nFailures:")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        return 1
+
+    print("\nAll references reported as expected")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
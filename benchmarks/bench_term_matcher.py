@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Glossary Term Matcher Benchmark
+
+Measures GlossaryLinker term matching throughput against a synthetic
+glossary and docs tree, and compares it with the previous approach of
+running one regular expression per term.
+
+Usage:
+    python benchmarks/bench_term_matcher.py [--terms 5000] [--files 10000]
+"""
+
+import argparse
+import importlib.util
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from synthetic_corpus import generate_docs_tree, generate_terms  # noqa: E402
+
+
+def load_linker_module():
+    """Import scripts/link-glossary-terms.py (not importable by name)."""
+    spec = importlib.util.spec_from_file_location(
+        'link_glossary_terms', SCRIPTS_DIR / 'link-glossary-terms.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Register the module so worker processes can unpickle its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def per_term_regex_scan(terms, text):
+    """Previous matching strategy: one regex pass per term."""
+    matches = []
+    for term_lower in terms:
+        pattern = r'\b' + re.escape(term_lower) + r'\b'
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            matches.append((match.start(), match.end(), term_lower))
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark glossary term matching')
+    parser.add_argument('--terms', type=int, default=5000,
+                        help='Number of synthetic glossary entries')
+    parser.add_argument('--files', type=int, default=10000,
+                        help='Number of synthetic markdown files')
+    parser.add_argument('--file-size', type=int, default=4096,
+                        help='Approximate size of each file in characters')
+    parser.add_argument('--baseline-files', type=int, default=20,
+                        help='Files to scan with the per-term regex baseline')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    linker_module = load_linker_module()
+    term_names = generate_terms(args.terms, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_root = Path(tmp)
+        print(f"Generating {args.files} files with {args.terms} glossary terms...")
+        files = generate_docs_tree(docs_root, term_names, args.files,
+                                   file_size=args.file_size, seed=args.seed)
+
+        linker = linker_module.GlossaryLinker(docs_root)
+        linker.terms = linker.load_glossary_terms()
+
+        start = time.perf_counter()
+        linker.matcher = linker_module.TermMatcher(linker.terms)
+        build_time = time.perf_counter() - start
+
+        texts = [path.read_text(encoding='utf-8') for path in files]
+        total_bytes = sum(len(text) for text in texts)
+
+        start = time.perf_counter()
+        total_matches = 0
+        for text in texts:
+            total_matches += len(linker.find_linkable_terms(text))
+        scan_time = time.perf_counter() - start
+
+        sample = texts[:args.baseline_files]
+        sample_bytes = sum(len(text) for text in sample)
+        start = time.perf_counter()
+        for text in sample:
+            per_term_regex_scan(linker.terms, text)
+        baseline_time = time.perf_counter() - start
+
+    mb = 1024 * 1024
+    matcher_rate = total_bytes / mb / scan_time
+    baseline_rate = sample_bytes / mb / baseline_time if baseline_time else 0.0
+
+    print(f"Glossary entries:        {args.terms} ({len(linker.terms)} terms with variations)")
+    print(f"Corpus:                  {len(files)} files, {total_bytes / mb:.1f} MB")
+    print(f"Matcher build time:      {build_time * 1000:.1f} ms")
+    print(f"Single-scan matcher:     {scan_time:.2f} s, {matcher_rate:.2f} MB/s, "
+          f"{total_matches} links")
+    print(f"Per-term regex baseline: {baseline_rate:.4f} MB/s "
+          f"(measured on {len(sample)} files)")
+    if baseline_rate:
+        print(f"Speedup:                 {matcher_rate / baseline_rate:.0f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
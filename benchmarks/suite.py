@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Documentation Scripts Benchmark Suite
+
+Runs a fixed set of benchmarks over the Python documentation scripts and
+compares the results with stored baseline numbers:
+
+- glossary linker matching, section splitting, rewriting and a full dry run
+  (scripts/link-glossary-terms.py) on a seeded synthetic docs tree
+- task report creation (scripts/create-task-report.py), one at a time and
+  in batch mode, and rendering of the compiled report template
+- progress index queries (scripts/progress_index.py) on an unchanged copy of
+  PROGRESS.md and task-reports/
+- parsing every .view file under docs/ with scripts/glw_view.py
+- revalidating one edited skin theme.view with the macro index
+  (scripts/macro_index.py) over a copy of the example skins
+- DependencyChecker runs (docs/tests/dependency-check.py) against stub
+  ``pkg-config`` and compiler binaries, with and without a warm probe cache
+
+Each benchmark is timed ``--repeat`` times after a warm-up call, and the
+median and run-to-run spread (median absolute deviation) are compared with
+the baseline. The suite exits with status 1 when a median is slower than
+its baseline by more than ``--threshold`` and by more than ``--noise``
+times the spread. Baselines are local to a machine: they are recorded with
+``--save-baseline`` and not committed, and a baseline recorded on another
+machine or Python is not compared against.
+
+Usage:
+    python benchmarks/suite.py [--filter linker] [--threshold 0.5]
+    python benchmarks/suite.py --save-baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from bench_term_matcher import load_linker_module
+from synthetic_corpus import generate_docs_tree, generate_document, generate_terms
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+DEFAULT_BASELINE = BENCH_DIR / 'baselines.json'
+
+# name -> setup(workdir) returning the callable to time
+BENCHMARKS: Dict[str, Callable[[Path], Callable[[], None]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function."""
+    def register(setup: Callable[[Path], Callable[[], None]]):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def load_script(name: str, path: Path):
+    """Import a script whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _linker_fixture(workdir: Path, file_count: int = 200, file_size: int = 4096,
+                    term_density: float = 0.05, code_ratio: float = 0.1):
+    """Generate a seeded docs tree and a linker with its glossary loaded."""
+    linker_module = load_linker_module()
+    terms = generate_terms(500, seed=42)
+    files = generate_docs_tree(workdir, terms, file_count, file_size=file_size,
+                               term_density=term_density, code_ratio=code_ratio, seed=42)
+
+    linker = linker_module.GlossaryLinker(workdir)
+    linker.terms = linker.load_glossary_terms()
+    linker.matcher = linker_module.TermMatcher(linker.terms)
+    texts = [path.read_text(encoding='utf-8') for path in files]
+    return linker, texts
+
+
+# Glossary linker
+
+@benchmark('linker.match')
+def bench_linker_match(workdir: Path):
+    linker, texts = _linker_fixture(workdir)
+
+    def run():
+        for text in texts:
+            linker.find_linkable_terms(text)
+    return run
+
+
+@benchmark('linker.match_dense')
+def bench_linker_match_dense(workdir: Path):
+    linker, _ = _linker_fixture(workdir, file_count=1)
+    text = generate_document(random.Random(42), generate_terms(500, seed=42),
+                             256 * 1024, term_density=0.2)
+
+    return lambda: linker.find_linkable_terms(text)
+
+
+@benchmark('linker.split')
+def bench_linker_split(workdir: Path):
+    linker, texts = _linker_fixture(workdir, code_ratio=0.3)
+
+    def run():
+        for text in texts:
+            for _ in linker._split_content_sections(text):
+                pass
+    return run
+
+
+@benchmark('linker.rewrite')
+def bench_linker_rewrite(workdir: Path):
+    linker, texts = _linker_fixture(workdir, term_density=0.1)
+    from text_edits import apply_edits
+
+    page = workdir / 'section-00' / 'page-00000.md'
+    matches = [(text, linker.find_linkable_terms(text)) for text in texts]
+
+    def run():
+        for text, linkable_terms in matches:
+            apply_edits(text, [
+                (start, end, linker.create_glossary_link(matched_text, anchor, page))
+                for matched_text, start, end, anchor, _ in linkable_terms
+            ])
+    return run
+
+
+@benchmark('linker.dry_run')
+def bench_linker_dry_run(workdir: Path):
+    linker, _ = _linker_fixture(workdir)
+
+    return lambda: linker.process_all_files(dry_run=True)
+
+
+# Task reports
+
+@benchmark('task_report.create')
+def bench_task_report_create(workdir: Path):
+    module = load_script('create_task_report', REPO_ROOT / 'scripts' / 'create-task-report.py')
+    template = (REPO_ROOT / 'task-reports' / 'TEMPLATE.md').read_text(encoding='utf-8')
+    progress = '# Progress\n\n## Completed Tasks\n'
+    reports_dir = workdir / 'task-reports'
+    reports_dir.mkdir()
+    (reports_dir / 'TEMPLATE.md').write_text(template, encoding='utf-8')
+    runs = iter(range(1000000))
+
+    def run():
+        # A fresh task id range per call, so no report exists yet
+        batch = next(runs)
+        (workdir / 'PROGRESS.md').write_text(progress, encoding='utf-8')
+        previous_dir = os.getcwd()
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for index in range(50):
+                    task_id = f"{batch}.{index}"
+                    module.create_task_report(task_id, f"Benchmark task {index}")
+                    module.update_progress_file(task_id, f"Benchmark task {index}")
+        finally:
+            os.chdir(previous_dir)
+    return run
+
+
+@benchmark('task_report.batch')
+def bench_task_report_batch(workdir: Path):
+    module = load_script('create_task_report', REPO_ROOT / 'scripts' / 'create-task-report.py')
+    progress = (REPO_ROOT / 'PROGRESS.md').read_text(encoding='utf-8')
+    reports_dir = workdir / 'task-reports'
+    reports_dir.mkdir()
+    shutil.copy(REPO_ROOT / 'task-reports' / 'TEMPLATE.md', reports_dir / 'TEMPLATE.md')
+    runs = iter(range(1000000))
+
+    def run():
+        # 500 new tasks per call, all added to PROGRESS.md in one rewrite
+        batch = next(runs)
+        (workdir / 'PROGRESS.md').write_text(progress, encoding='utf-8')
+        previous_dir = os.getcwd()
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                module.create_task_reports(
+                    [(f"{batch}.{index}", f"Benchmark task {index}") for index in range(500)]
+                )
+        finally:
+            os.chdir(previous_dir)
+    return run
+
+
+@benchmark('task_report.render')
+def bench_task_report_render(workdir: Path):
+    module = load_script('create_task_report', REPO_ROOT / 'scripts' / 'create-task-report.py')
+    template = module.load_template(str(REPO_ROOT / 'task-reports' / 'TEMPLATE.md'))
+    fields = {
+        'status': 'Completed ✅',
+        'duration': '~2 hours',
+        'files_created': [{'path': f'docs/page-{index}.md', 'description': 'New page'}
+                          for index in range(20)],
+        'files_modified': [{'path': f'docs/old-{index}.md', 'description': 'Updated'}
+                           for index in range(20)],
+        'related_tasks': [{'id': f'{index}.1', 'description': 'Related'} for index in range(5)],
+    }
+
+    def run():
+        for index in range(1000):
+            module.render_report(template, f"bench.{index}", "Render benchmark",
+                                 '2024-01-01', fields)
+    return run
+
+
+@benchmark('progress_index.query')
+def bench_progress_index_query(workdir: Path):
+    sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+    from progress_index import ProgressIndex
+
+    shutil.copy(REPO_ROOT / 'PROGRESS.md', workdir / 'PROGRESS.md')
+    shutil.copytree(REPO_ROOT / 'task-reports', workdir / 'task-reports')
+    index = ProgressIndex(workdir, workdir / 'progress-index.sqlite')
+    index.update()
+
+    def run():
+        for _ in range(100):
+            index.update()
+            index.tasks(since='2024-11-06', until='2024-11-07', prefix='7')
+            index.missing('report-file')
+            index.missing('entry')
+    return run
+
+
+@benchmark('glw_view.parse')
+def bench_glw_view_parse(workdir: Path):
+    sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+    from glw_view import iter_view_files, parse_view
+
+    texts = [path.read_text(encoding='utf-8') for path in iter_view_files(REPO_ROOT / 'docs')]
+
+    def run():
+        for text in texts:
+            parse_view(text)
+    return run
+
+
+@benchmark('macro_index.revalidate')
+def bench_macro_index_revalidate(workdir: Path):
+    sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+    from macro_index import MacroIndex
+
+    root = workdir / 'examples'
+    shutil.copytree(REPO_ROOT / 'docs' / 'ui' / 'theming' / 'examples', root)
+    theme = root / 'advanced-skin' / 'theme.view'
+    original = theme.read_text(encoding='utf-8')
+    # Alternate between two versions of the file; the second renames a macro
+    edits = [original, original.replace('#define PageHeader(', '#define PageHeader2(') + '\n']
+    index = MacroIndex(root)
+    index.update()
+
+    def run():
+        for i in range(10):
+            theme.write_text(edits[i % 2], encoding='utf-8')
+            index.revalidate(theme)
+    return run
+
+
+# Dependency checker
+
+STUB_PKG_CONFIG = '''#!/bin/sh
+case "$1" in
+    --version) echo 1.8.1 ;;
+    --modversion)
+        case "$2" in
+            freetype2|fontconfig|x11|xext|openssl|gl|sqlite3) echo 1.0.0 ;;
+            *) exit 1 ;;
+        esac ;;
+    --cflags) echo "-I/usr/include/$2" ;;
+    --libs) echo "-l$2" ;;
+    --variable) echo /nonexistent/pkgconfig ;;
+esac
+'''
+
+STUB_TOOL = '''#!/bin/sh
+case "$1" in
+    --version) echo "$(basename "$0") (stub) 1.0" ;;
+    *) exec /bin/cat > /dev/null ;;
+esac
+'''
+
+
+@contextlib.contextmanager
+def _stub_path(bin_dir: Path):
+    previous_path = os.environ.get('PATH', '')
+    os.environ['PATH'] = str(bin_dir)
+    try:
+        yield
+    finally:
+        os.environ['PATH'] = previous_path
+
+
+def _dependency_fixture(workdir: Path):
+    """Load dependency-check.py and create stub tools in workdir/bin."""
+    module = load_script('dependency_check', REPO_ROOT / 'docs' / 'tests' / 'dependency-check.py')
+
+    bin_dir = workdir / 'bin'
+    bin_dir.mkdir()
+    for tool, script in (('pkg-config', STUB_PKG_CONFIG), ('gcc', STUB_TOOL),
+                         ('g++', STUB_TOOL), ('git', STUB_TOOL), ('make', STUB_TOOL),
+                         ('yasm', STUB_TOOL)):
+        path = bin_dir / tool
+        path.write_text(script)
+        path.chmod(0o755)
+    return module, bin_dir
+
+
+def _run_checker(module, cache=None):
+    checker = module.DependencyChecker(cache=cache)
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker.run_all_checks()
+    return checker
+
+
+@benchmark('depcheck.cold')
+def bench_depcheck_cold(workdir: Path):
+    module, bin_dir = _dependency_fixture(workdir)
+
+    def run():
+        with _stub_path(bin_dir):
+            _run_checker(module)
+    return run
+
+
+@benchmark('depcheck.warm_cache')
+def bench_depcheck_warm_cache(workdir: Path):
+    module, bin_dir = _dependency_fixture(workdir)
+    cache_path = workdir / 'depcheck.json'
+    with _stub_path(bin_dir):
+        _run_checker(module, module.ProbeCache(cache_path))
+
+    def run():
+        with _stub_path(bin_dir):
+            _run_checker(module, module.ProbeCache(cache_path))
+    return run
+
+
+def run_benchmark(name: str, repeat: int) -> Dict[str, float]:
+    """Set up a benchmark in a scratch directory and time it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run = BENCHMARKS[name](Path(tmp))
+        run()  # Warm-up
+
+        times = []
+        # Like timeit, keep garbage collection pauses out of the measurement
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+                gc.collect()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    median = statistics.median(times)
+    return {
+        'min': min(times),
+        'median': median,
+        # Median absolute deviation: how far runs typically stray from the median
+        'spread': statistics.median(abs(sample - median) for sample in times),
+    }
+
+
+def load_baseline(path: Path) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def machine_info() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]], baseline: Dict):
+    """Merge results into the baseline file, keeping benchmarks that were not run."""
+    stored = baseline.get('results', {}) if baseline.get('machine') == machine_info() else {}
+    stored.update({
+        name: {'median': round(timing['median'], 6), 'spread': round(timing['spread'], 6)}
+        for name, timing in results.items()
+    })
+
+    data = {'machine': machine_info(), 'results': dict(sorted(stored.items()))}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def is_regression(timing: Dict[str, float], reference: Dict[str, float],
+                  threshold: float, noise: float) -> bool:
+    """Return True if timing is slower than reference beyond threshold and noise.
+
+    The medians are compared, and the slowdown must also exceed ``noise``
+    times the larger spread of the two, so a jittery benchmark needs a
+    proportionally larger slowdown to be flagged.
+    """
+    slowdown = timing['median'] - reference['median']
+    spread = max(timing['spread'], reference['spread'])
+    return slowdown > threshold * reference['median'] and slowdown > noise * spread
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the documentation scripts benchmark suite')
+    parser.add_argument('--filter', default='',
+                        help='Only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='Timed runs per benchmark (the median is compared)')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='Allowed slowdown of the median against the baseline (0.5 = 50%%)')
+    parser.add_argument('--noise', type=float, default=3.0,
+                        help='A slowdown must also exceed this many times the run-to-run '
+                             'spread (median absolute deviation) to count')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='Local baseline file (default: benchmarks/baselines.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Record the results as the new baseline instead of comparing')
+    parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+    args = parser.parse_args()
+
+    names: List[str] = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print('\n'.join(names))
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    baseline_results = {}
+    if baseline.get('machine') == machine_info():
+        baseline_results = baseline.get('results', {})
+    elif not args.save_baseline:
+        if baseline:
+            print(f"Baseline in {args.baseline} was recorded on another machine or Python; "
+                  f"record one here with --save-baseline\n")
+        else:
+            print(f"No baseline at {args.baseline}; record one on this machine "
+                  f"with --save-baseline\n")
+
+    print(f"{'benchmark':<22} {'min (ms)':>10} {'median (ms)':>12} {'baseline':>10} {'change':>8}")
+    results = {}
+    regressions = []
+    for name in names:
+        timing = results[name] = run_benchmark(name, args.repeat)
+        line = f"{name:<22} {timing['min'] * 1000:>10.2f} {timing['median'] * 1000:>12.2f}"
+
+        reference = baseline_results.get(name)
+        if isinstance(reference, dict):
+            change = timing['median'] / reference['median'] - 1
+            line += f" {reference['median'] * 1000:>10.2f} {change:>+8.1%}"
+            if is_regression(timing, reference, args.threshold, args.noise):
+                line += '  REGRESSION'
+                regressions.append(name)
+        print(line)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"\nSaved baseline for {len(results)} benchmarks to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than "
+              f"{args.threshold:.0%} and {args.noise:g}x their run-to-run spread: "
+              f"{', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
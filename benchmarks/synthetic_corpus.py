@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Synthetic Documentation Corpus Generator
+
+Generates seeded, reproducible glossaries and markdown documentation trees
+for benchmarking the documentation scripts.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+SYLLABLES = [
+    'ka', 'lo', 'mi', 'ne', 'ru', 'so', 'ta', 'vi', 'xe', 'zo',
+    'bar', 'con', 'del', 'fen', 'gor', 'hal', 'jun', 'lin', 'mor', 'pex',
+    'qua', 'rix', 'sul', 'tor', 'ump', 'vel', 'wex', 'yor', 'zen', 'dra',
+]
+
+FILLER_WORDS = [
+    'the', 'a', 'of', 'to', 'and', 'in', 'is', 'for', 'with', 'that',
+    'this', 'uses', 'when', 'each', 'from', 'into', 'which', 'handles',
+    'returns', 'provides', 'values', 'thread', 'request', 'page', 'item',
+]
+
+
+def _make_word(rng: random.Random) -> str:
+    """Create a pronounceable pseudo-word."""
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def generate_terms(count: int, seed: int = 42) -> List[str]:
+    """Generate unique glossary term names (some with acronyms in parentheses)."""
+    rng = random.Random(seed)
+    terms = []
+    seen = set()
+
+    while len(terms) < count:
+        words = [_make_word(rng).capitalize() for _ in range(rng.randint(1, 3))]
+        name = ' '.join(words)
+        if rng.random() < 0.1 and len(words) > 1:
+            name += ' (' + ''.join(word[0] for word in words).upper() + ')'
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        terms.append(name)
+
+    return terms
+
+
+def render_glossary(terms: List[str]) -> str:
+    """Render terms as a glossary.md with one ``###`` entry per term."""
+    lines = ['# Technical Glossary', '']
+    for term in terms:
+        lines.append(f'### {term}')
+        lines.append(f'Definition of {term}.')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_document(rng: random.Random, terms: List[str], size: int = 4096,
+                      term_density: float = 0.05, code_ratio: float = 0.1) -> str:
+    """Generate one markdown document of roughly ``size`` characters.
+
+    ``term_density`` is the fraction of words that are glossary terms and
+    ``code_ratio`` the fraction of paragraphs emitted as fenced code blocks.
+    """
+    parts = [f'# {_make_word(rng).capitalize()} Guide', '']
+    length = 0
+
+    while length < size:
+        if rng.random() < code_ratio:
+            body = ' '.join(rng.choice(terms) for _ in range(5))
+            block = f'```javascript\nvar x = "{body}";\n```'
+        else:
+            words = []
+            for _ in range(rng.randint(30, 80)):
+                if terms and rng.random() < term_density:
+                    words.append(rng.choice(terms))
+                elif rng.random() < 0.02:
+                    words.append(f'`{_make_word(rng)}()`')
+                elif rng.random() < 0.01:
+                    words.append(f'[{_make_word(rng)}](other.md)')
+                else:
+                    words.append(rng.choice(FILLER_WORDS))
+            block = ' '.join(words) + '.'
+
+        parts.append(block)
+        parts.append('')
+        length += len(block) + 2
+
+    return '\n'.join(parts)
+
+
+def generate_docs_tree(root: Path, terms: List[str], file_count: int,
+                       file_size: int = 4096, term_density: float = 0.05,
+                       code_ratio: float = 0.1, seed: int = 42) -> List[Path]:
+    """Write a docs tree (including reference/glossary.md) under root."""
+    rng = random.Random(seed)
+
+    glossary_path = root / 'reference' / 'glossary.md'
+    glossary_path.parent.mkdir(parents=True, exist_ok=True)
+    glossary_path.write_text(render_glossary(terms), encoding='utf-8')
+
+    files = []
+    for index in range(file_count):
+        section = root / f'section-{index % 20:02d}'
+        section.mkdir(exist_ok=True)
+        path = section / f'page-{index:05d}.md'
+        path.write_text(
+            generate_document(rng, terms, file_size, term_density, code_ratio),
+            encoding='utf-8'
+        )
+        files.append(path)
+
+    return files
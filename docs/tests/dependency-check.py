@@ -8,11 +8,16 @@ for building Movian on the current platform.
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
 import json
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -23,10 +28,262 @@ class Colors:
     BOLD = '\033[1m'
     NC = '\033[0m'  # No Color
 
+class ProbeCache:
+    """Persistent cache of probe results
+    
+    Each result is stored with the key inputs it was computed from (binary
+    paths and modification times, PATH, PKG_CONFIG_PATH, ...). A cached
+    result is only reused while its key inputs are unchanged. With refresh,
+    nothing is read from the cache; results are still written to it.
+    
+    Probes run concurrently, so the counters and memoized identities are
+    updated under a lock.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, path: Path, refresh: bool = False):
+        self.path = path
+        self.entries = {}
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._binaries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        
+        if not refresh:
+            self._load()
+    
+    @staticmethod
+    def default_path() -> Path:
+        """Return ~/.cache/movian-docs/depcheck.json (honouring XDG_CACHE_HOME)"""
+        cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(cache_home) / 'movian-docs' / 'depcheck.json'
+    
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if data.get('version') == self.VERSION:
+            self.entries = data.get('entries', {})
+    
+    def save(self):
+        """Write the cache atomically"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, f, indent=1)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+    
+    def get(self, name: str, key: Dict) -> Optional[Dict]:
+        """Return the cached result for name if it was computed with the same key"""
+        entry = None if self.refresh else self.entries.get(name)
+        with self._lock:
+            if entry is not None and entry['key'] == key:
+                self.hits += 1
+                return entry['result']
+            
+            self.misses += 1
+            return None
+    
+    def put(self, name: str, key: Dict, result: Dict):
+        with self._lock:
+            self.entries[name] = {'key': key, 'result': result}
+    
+    def binary_identity(self, name: str) -> Dict[str, any]:
+        """Identify an executable on PATH by resolved path, mtime and size"""
+        identity = self._binaries.get(name)
+        if identity is None:
+            path = shutil.which(name)
+            identity = {'path': None}
+            if path is not None:
+                real_path = os.path.realpath(path)
+                try:
+                    stat = os.stat(real_path)
+                    identity = {'path': real_path, 'mtime_ns': stat.st_mtime_ns,
+                                'size': stat.st_size}
+                except OSError:
+                    pass
+            with self._lock:
+                self._binaries[name] = identity
+        return identity
+    
+    def binary_version(self, name: str) -> Optional[str]:
+        """Return the first line of ``name --version``, run once per process
+        
+        Compilers are often wrapper scripts or symlinks that are switched
+        (ccache, update-alternatives) without touching the resolved binary,
+        so probes key on what the compiler reports as well.
+        """
+        version = self._versions.get(name)
+        if version is None:
+            try:
+                result = subprocess.run([name, '--version'], capture_output=True,
+                                        text=True, timeout=30)
+                version = result.stdout.split('\n')[0].strip() if result.returncode == 0 else ''
+            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+                version = ''
+            with self._lock:
+                self._versions[name] = version
+        return version or None
+
+class CompilerProbe(NamedTuple):
+    """A compiler feature test
+    
+    The source is fed to the compiler on stdin. Probes that do not need the
+    linker only run the front end (-fsyntax-only). A probe passes when the
+    compile succeeds, or fails if expect_success is False. Failed required
+    probes are reported as errors, failed optional probes as warnings.
+    """
+    name: str
+    compiler: str
+    language: str
+    flags: Tuple[str, ...]
+    source: str
+    description: str
+    required: bool = True
+    link: bool = False
+    expect_success: bool = True
+    arches: Optional[Tuple[str, ...]] = None  # platform.machine() values, None = all
+
+COMPILER_PROBES = [
+    CompilerProbe(
+        name='gcc_c99', compiler='gcc', language='c', flags=('-std=c99',),
+        source='''
+        #include <stdio.h>
+        int main() {
+            for (int i = 0; i < 1; i++) {
+                printf("C99 support OK\\n");
+            }
+            return 0;
+        }
+        ''',
+        description="GCC does not support C99"),
+    CompilerProbe(
+        name='gxx_cpp11', compiler='g++', language='c++', flags=('-std=c++11',),
+        source='''
+        #include <iostream>
+        #include <vector>
+        int main() {
+            auto vec = std::vector<int>{1, 2, 3};
+            for (auto& item : vec) {
+                std::cout << item << std::endl;
+            }
+            return 0;
+        }
+        ''',
+        description="G++ does not support C++11"),
+    CompilerProbe(
+        name='gcc_sync_builtins', compiler='gcc', language='c', flags=(), link=True,
+        source='''
+        int counter;
+        int main() {
+            __sync_add_and_fetch(&counter, 1);
+            return __sync_fetch_and_sub(&counter, 1) - 1;
+        }
+        ''',
+        description="GCC does not provide __sync atomic builtins"),
+    CompilerProbe(
+        name='gcc_pthread', compiler='gcc', language='c', flags=('-pthread',), link=True,
+        source='''
+        #include <pthread.h>
+        static void *run(void *arg) { return arg; }
+        int main() {
+            pthread_t tid;
+            if (pthread_create(&tid, NULL, run, NULL))
+                return 1;
+            return pthread_join(tid, NULL);
+        }
+        ''',
+        description="GCC cannot build and link with -pthread"),
+    CompilerProbe(
+        name='gcc_c11_atomics', compiler='gcc', language='c', flags=('-std=gnu11',),
+        required=False,
+        source='''
+        #include <stdatomic.h>
+        atomic_int counter;
+        int main() {
+            return atomic_fetch_add(&counter, 1);
+        }
+        ''',
+        description="GCC does not support C11 <stdatomic.h>"),
+    CompilerProbe(
+        name='gcc_werror', compiler='gcc', language='c',
+        flags=('-Werror=implicit-function-declaration',),
+        required=False, expect_success=False,
+        source='''
+        int main() {
+            return undeclared_function();
+        }
+        ''',
+        description="GCC ignores -Werror, feature probes may be unreliable"),
+    CompilerProbe(
+        name='gcc_sse2', compiler='gcc', language='c', flags=('-msse2',),
+        required=False, arches=('x86_64', 'AMD64', 'i386', 'i686'),
+        source='''
+        #include <emmintrin.h>
+        int main() {
+            __m128i v = _mm_set1_epi32(1);
+            return _mm_cvtsi128_si32(_mm_add_epi32(v, v)) - 2;
+        }
+        ''',
+        description="GCC cannot target SSE2"),
+    CompilerProbe(
+        name='gcc_neon_armv7', compiler='gcc', language='c', flags=('-mfpu=neon',),
+        required=False, arches=('armv7l',),
+        source='''
+        #include <arm_neon.h>
+        int main() {
+            int32x4_t v = vdupq_n_s32(1);
+            return vgetq_lane_s32(vaddq_s32(v, v), 0) - 2;
+        }
+        ''',
+        description="GCC cannot target NEON"),
+    CompilerProbe(
+        name='gcc_neon_aarch64', compiler='gcc', language='c', flags=(),
+        required=False, arches=('aarch64', 'arm64'),
+        source='''
+        #include <arm_neon.h>
+        int main() {
+            int32x4_t v = vdupq_n_s32(1);
+            return vgetq_lane_s32(vaddq_s32(v, v), 0) - 2;
+        }
+        ''',
+        description="GCC cannot target NEON"),
+    CompilerProbe(
+        name='gcc_lto', compiler='gcc', language='c', flags=('-O2', '-flto'), link=True,
+        required=False,
+        source='''
+        int main() {
+            return 0;
+        }
+        ''',
+        description="GCC does not support link-time optimization (-flto)"),
+]
+
+# Probe names key the results and the probe cache, so they must be unique
+assert len({probe.name for probe in COMPILER_PROBES}) == len(COMPILER_PROBES), \
+    "duplicate CompilerProbe names in COMPILER_PROBES"
+
 class DependencyChecker:
-    """Main dependency checking class"""
+    """Main dependency checking class
+    
+    Progress and results are printed to output (default: sys.stdout), so a
+    caller can capture them without redirecting the process-wide stdout.
+    """
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, cache: Optional[ProbeCache] = None,
+                 output: Optional[TextIO] = None):
+        self.max_workers = max_workers
+        self.cache = cache
+        self.output = output if output is not None else sys.stdout
         self.platform_info = self._detect_platform()
         self.results = {
             'platform': self.platform_info,
@@ -34,7 +291,8 @@ class DependencyChecker:
             'libraries': {},
             'optional': {},
             'errors': [],
-            'warnings': []
+            'warnings': [],
+            'timing': {}
         }
     
     def _detect_platform(self) -> Dict[str, str]:
@@ -101,41 +359,93 @@ class DependencyChecker:
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
             return False, ""
     
+    def _run_parallel(self, func, items: List) -> List:
+        """Run func over items concurrently, returning results in item order"""
+        if len(items) <= 1 or self.max_workers == 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+    
     def check_tool(self, tool: str, version_flag: str = '--version') -> Dict[str, any]:
         """Check if a tool is available and get its version"""
+        if self.cache is not None:
+            cache_name = f"tool:{tool}:{version_flag}"
+            key = {'binary': self.cache.binary_identity(tool), 'PATH': os.environ.get('PATH')}
+            cached = self.cache.get(cache_name, key)
+            if cached is not None:
+                return cached
+        
         success, output = self._run_command([tool, version_flag])
         
         result = {
             'available': success,
             'version': output.split('\n')[0] if success else None,
-            'path': None
+            'path': shutil.which(tool) if success else None
         }
         
-        if success:
-            path_success, path_output = self._run_command(['which', tool])
-            if path_success:
-                result['path'] = path_output
+        if self.cache is not None:
+            self.cache.put(cache_name, key, result)
         
         return result
     
+    def _pkg_config_search_path(self) -> List[str]:
+        """Return the directories pkg-config searches for .pc files"""
+        search_path = os.environ.get('PKG_CONFIG_PATH', '').split(os.pathsep)
+        
+        libdir = os.environ.get('PKG_CONFIG_LIBDIR')
+        if libdir is None:
+            # The built-in search path only changes with the pkg-config binary
+            key = {'binary': self.cache.binary_identity('pkg-config')}
+            cached = self.cache.get('pkg-config:pc_path', key)
+            if cached is None:
+                _, pc_path = self._run_command(['pkg-config', '--variable', 'pc_path', 'pkg-config'])
+                cached = {'pc_path': pc_path}
+                self.cache.put('pkg-config:pc_path', key, cached)
+            libdir = cached['pc_path']
+        
+        search_path.extend(libdir.split(os.pathsep))
+        return [directory for directory in search_path if directory]
+    
+    def _pkg_config_key(self, library: str) -> Dict[str, any]:
+        """Return the cache key inputs for a pkg-config library probe"""
+        pc_file = None
+        for directory in self._pkg_config_search_path():
+            candidate = os.path.join(directory, library + '.pc')
+            try:
+                stat = os.stat(candidate)
+            except OSError:
+                continue
+            pc_file = {'path': candidate, 'mtime_ns': stat.st_mtime_ns}
+            break
+        
+        return {
+            'binary': self.cache.binary_identity('pkg-config'),
+            'PKG_CONFIG_PATH': os.environ.get('PKG_CONFIG_PATH'),
+            'PKG_CONFIG_LIBDIR': os.environ.get('PKG_CONFIG_LIBDIR'),
+            'pc_file': pc_file
+        }
+    
     def check_pkg_config_library(self, library: str) -> Dict[str, any]:
         """Check if a library is available via pkg-config"""
-        # Check existence
-        exists_success, _ = self._run_command(['pkg-config', '--exists', library])
+        if self.cache is not None:
+            cache_name = f"pkg-config:{library}"
+            key = self._pkg_config_key(library)
+            cached = self.cache.get(cache_name, key)
+            if cached is not None:
+                return cached
+        
+        # --modversion fails for unknown packages, so it doubles as the existence check
+        exists_success, version_output = self._run_command(['pkg-config', '--modversion', library])
         
         result = {
             'available': exists_success,
-            'version': None,
+            'version': version_output if exists_success else None,
             'cflags': None,
             'libs': None
         }
         
         if exists_success:
-            # Get version
-            version_success, version_output = self._run_command(['pkg-config', '--modversion', library])
-            if version_success:
-                result['version'] = version_output
-            
             # Get compile flags
             cflags_success, cflags_output = self._run_command(['pkg-config', '--cflags', library])
             if cflags_success:
@@ -146,6 +456,9 @@ class DependencyChecker:
             if libs_success:
                 result['libs'] = libs_output
         
+        if self.cache is not None:
+            self.cache.put(cache_name, key, result)
+        
         return result
     
     def check_header_file(self, header: str, include_paths: List[str] = None) -> bool:
@@ -178,8 +491,12 @@ class DependencyChecker:
                 'brew': {'version_flag': '--version', 'required': False},
             })
         
-        for tool, config in tools.items():
-            result = self.check_tool(tool, config['version_flag'])
+        probe_results = self._run_parallel(
+            lambda tool: self.check_tool(tool, tools[tool]['version_flag']),
+            list(tools)
+        )
+        
+        for (tool, config), result in zip(tools.items(), probe_results):
             self.results['tools'][tool] = result
             
             if config['required'] and not result['available']:
@@ -209,9 +526,16 @@ class DependencyChecker:
             required_libraries.extend(['x11', 'xext'])
             optional_libraries.extend(['libvdpau', 'libxss', 'libxxf86vm', 'libxv'])
         
+        # Probe every library concurrently (x11/xext may be listed twice on Linux)
+        all_libraries = list(dict.fromkeys(required_libraries + optional_libraries))
+        probe_results = dict(zip(
+            all_libraries,
+            self._run_parallel(self.check_pkg_config_library, all_libraries)
+        ))
+        
         # Check required libraries
         for lib in required_libraries:
-            result = self.check_pkg_config_library(lib)
+            result = probe_results[lib]
             self.results['libraries'][lib] = result
             
             if not result['available']:
@@ -219,7 +543,7 @@ class DependencyChecker:
         
         # Check optional libraries
         for lib in optional_libraries:
-            result = self.check_pkg_config_library(lib)
+            result = probe_results[lib]
             self.results['optional'][lib] = result
             
             if not result['available']:
@@ -227,65 +551,54 @@ class DependencyChecker:
     
     def check_compiler_features(self):
         """Check compiler support for required features"""
-        # Test C99 support
-        c99_test = '''
-        #include <stdio.h>
-        int main() {
-            // C99 features
-            for (int i = 0; i < 1; i++) {
-                printf("C99 support OK\\n");
-            }
-            return 0;
-        }
-        '''
+        probes = [probe for probe in COMPILER_PROBES
+                  if probe.arches is None or self.platform_info['machine'] in probe.arches]
         
-        # Test C++11 support
-        cpp11_test = '''
-        #include <iostream>
-        #include <vector>
-        int main() {
-            // C++11 features
-            auto vec = std::vector<int>{1, 2, 3};
-            for (auto& item : vec) {
-                std::cout << "C++11 support OK" << std::endl;
+        for probe, available in zip(probes, self._run_parallel(self._check_compiler_probe, probes)):
+            self.results['tools'][probe.name] = {'available': available}
+            
+            if not available:
+                if probe.required:
+                    self.results['errors'].append(probe.description)
+                else:
+                    self.results['warnings'].append(probe.description)
+    
+    def _check_compiler_probe(self, probe: 'CompilerProbe') -> bool:
+        """Run a compiler probe, reusing a cached outcome when possible"""
+        if self.cache is not None:
+            cache_name = f"compiler:{probe.name}"
+            key = {
+                'binary': self.cache.binary_identity(probe.compiler),
+                'version': self.cache.binary_version(probe.compiler),
+                'PATH': os.environ.get('PATH'),
+                'probe': hashlib.sha256(repr(probe).encode('utf-8')).hexdigest()
             }
-            return 0;
-        }
-        '''
+            cached = self.cache.get(cache_name, key)
+            if cached is not None:
+                return cached['available']
         
-        # Create temporary files and test compilation
-        import tempfile
+        available = self._run_compiler_probe(probe)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.c', delete=False) as f:
-            f.write(c99_test)
-            c_file = f.name
+        if self.cache is not None:
+            self.cache.put(cache_name, key, {'available': available})
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as f:
-            f.write(cpp11_test)
-            cpp_file = f.name
+        return available
+    
+    def _run_compiler_probe(self, probe: 'CompilerProbe') -> bool:
+        """Compile a probe's source from stdin and compare with the expected outcome"""
+        cmd = [probe.compiler] + list(probe.flags) + ['-x', probe.language, '-']
+        if probe.link:
+            cmd += ['-o', os.devnull]
+        else:
+            cmd.append('-fsyntax-only')
         
         try:
-            # Test C99
-            c99_success, _ = self._run_command(['gcc', '-std=c99', '-o', '/dev/null', c_file])
-            self.results['tools']['gcc_c99'] = {'available': c99_success}
-            
-            if not c99_success:
-                self.results['errors'].append("GCC does not support C99")
-            
-            # Test C++11
-            cpp11_success, _ = self._run_command(['g++', '-std=c++11', '-o', '/dev/null', cpp_file])
-            self.results['tools']['gxx_cpp11'] = {'available': cpp11_success}
-            
-            if not cpp11_success:
-                self.results['errors'].append("G++ does not support C++11")
+            result = subprocess.run(cmd, input=probe.source, capture_output=True,
+                                    text=True, timeout=30)
+        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+            return False
         
-        finally:
-            # Clean up temporary files
-            try:
-                os.unlink(c_file)
-                os.unlink(cpp_file)
-            except OSError:
-                pass
+        return (result.returncode == 0) == probe.expect_success
     
     def generate_install_commands(self) -> Dict[str, List[str]]:
         """Generate platform-specific installation commands for missing dependencies"""
@@ -410,82 +723,107 @@ class DependencyChecker:
         
         return commands
     
+    def _print(self, *args):
+        print(*args, file=self.output)
+    
     def print_results(self):
         """Print formatted results"""
-        print(f"{Colors.BOLD}Movian Dependency Check Results{Colors.NC}")
-        print("=" * 50)
+        self._print(f"{Colors.BOLD}Movian Dependency Check Results{Colors.NC}")
+        self._print("=" * 50)
         
         # Platform info
-        print(f"{Colors.BLUE}Platform:{Colors.NC} {self.platform_info['system']} "
+        self._print(f"{Colors.BLUE}Platform:{Colors.NC} {self.platform_info['system']} "
               f"({self.platform_info['distribution']} {self.platform_info['version']})")
-        print(f"{Colors.BLUE}Architecture:{Colors.NC} {self.platform_info['machine']}")
-        print()
+        self._print(f"{Colors.BLUE}Architecture:{Colors.NC} {self.platform_info['machine']}")
+        self._print()
         
         # Tools
-        print(f"{Colors.BOLD}Build Tools:{Colors.NC}")
+        self._print(f"{Colors.BOLD}Build Tools:{Colors.NC}")
         for tool, result in self.results['tools'].items():
             status = f"{Colors.GREEN}✓{Colors.NC}" if result['available'] else f"{Colors.RED}✗{Colors.NC}"
             version = f" ({result.get('version', 'unknown')})" if result['available'] else ""
-            print(f"  {status} {tool}{version}")
-        print()
+            self._print(f"  {status} {tool}{version}")
+        self._print()
         
         # Required libraries
-        print(f"{Colors.BOLD}Required Libraries:{Colors.NC}")
+        self._print(f"{Colors.BOLD}Required Libraries:{Colors.NC}")
         for lib, result in self.results['libraries'].items():
             status = f"{Colors.GREEN}✓{Colors.NC}" if result['available'] else f"{Colors.RED}✗{Colors.NC}"
             version = f" ({result.get('version', 'unknown')})" if result['available'] else ""
-            print(f"  {status} {lib}{version}")
-        print()
+            self._print(f"  {status} {lib}{version}")
+        self._print()
         
         # Optional libraries
-        print(f"{Colors.BOLD}Optional Libraries:{Colors.NC}")
+        self._print(f"{Colors.BOLD}Optional Libraries:{Colors.NC}")
         for lib, result in self.results['optional'].items():
             status = f"{Colors.GREEN}✓{Colors.NC}" if result['available'] else f"{Colors.YELLOW}○{Colors.NC}"
             version = f" ({result.get('version', 'unknown')})" if result['available'] else ""
-            print(f"  {status} {lib}{version}")
-        print()
+            self._print(f"  {status} {lib}{version}")
+        self._print()
         
         # Errors and warnings
         if self.results['errors']:
-            print(f"{Colors.RED}{Colors.BOLD}Errors:{Colors.NC}")
+            self._print(f"{Colors.RED}{Colors.BOLD}Errors:{Colors.NC}")
             for error in self.results['errors']:
-                print(f"  {Colors.RED}✗{Colors.NC} {error}")
-            print()
+                self._print(f"  {Colors.RED}✗{Colors.NC} {error}")
+            self._print()
         
         if self.results['warnings']:
-            print(f"{Colors.YELLOW}{Colors.BOLD}Warnings:{Colors.NC}")
+            self._print(f"{Colors.YELLOW}{Colors.BOLD}Warnings:{Colors.NC}")
             for warning in self.results['warnings']:
-                print(f"  {Colors.YELLOW}!{Colors.NC} {warning}")
-            print()
+                self._print(f"  {Colors.YELLOW}!{Colors.NC} {warning}")
+            self._print()
         
         # Installation commands
         install_commands = self.generate_install_commands()
         if install_commands:
-            print(f"{Colors.BOLD}Suggested Installation Commands:{Colors.NC}")
+            self._print(f"{Colors.BOLD}Suggested Installation Commands:{Colors.NC}")
             for platform, commands in install_commands.items():
-                print(f"\n{Colors.BLUE}{platform.title()}:{Colors.NC}")
+                self._print(f"\n{Colors.BLUE}{platform.title()}:{Colors.NC}")
                 for cmd in commands:
-                    print(f"  {cmd}")
-            print()
+                    self._print(f"  {cmd}")
+            self._print()
         
         # Summary
         total_errors = len(self.results['errors'])
         total_warnings = len(self.results['warnings'])
         
         if total_errors == 0:
-            print(f"{Colors.GREEN}{Colors.BOLD}✓ Ready to build Movian!{Colors.NC}")
+            self._print(f"{Colors.GREEN}{Colors.BOLD}✓ Ready to build Movian!{Colors.NC}")
         else:
-            print(f"{Colors.RED}{Colors.BOLD}✗ {total_errors} error(s) must be resolved before building{Colors.NC}")
+            self._print(f"{Colors.RED}{Colors.BOLD}✗ {total_errors} error(s) must be resolved before building{Colors.NC}")
         
         if total_warnings > 0:
-            print(f"{Colors.YELLOW}! {total_warnings} warning(s) - some features may be disabled{Colors.NC}")
+            self._print(f"{Colors.YELLOW}! {total_warnings} warning(s) - some features may be disabled{Colors.NC}")
+        
+        timing = self.results['timing']
+        if timing:
+            self._print(f"{Colors.BLUE}Completed in {timing['total']:.2f}s{Colors.NC} "
+                  f"(tools {timing['build_tools']:.2f}s, libraries {timing['libraries']:.2f}s, "
+                  f"compiler {timing['compiler_features']:.2f}s)")
+        
+        if 'cache' in self.results:
+            cache = self.results['cache']
+            self._print(f"Probe cache: {cache['hits']} hit(s), {cache['misses']} miss(es)")
     
     def run_all_checks(self):
         """Run all dependency checks"""
-        print("Checking build dependencies...")
-        self.check_build_tools()
-        self.check_libraries()
-        self.check_compiler_features()
+        self._print("Checking build dependencies...")
+        timing = self.results['timing']
+        start = time.perf_counter()
+        
+        for stage, check in (('build_tools', self.check_build_tools),
+                             ('libraries', self.check_libraries),
+                             ('compiler_features', self.check_compiler_features)):
+            stage_start = time.perf_counter()
+            check()
+            timing[stage] = round(time.perf_counter() - stage_start, 3)
+        
+        timing['total'] = round(time.perf_counter() - start, 3)
+        
+        if self.cache is not None:
+            self.cache.save()
+            self.results['cache'] = {'hits': self.cache.hits, 'misses': self.cache.misses}
     
     def save_results(self, filename: str):
         """Save results to JSON file"""
@@ -499,10 +837,20 @@ def main():
     parser = argparse.ArgumentParser(description='Check Movian build dependencies')
     parser.add_argument('--json', help='Save results to JSON file')
     parser.add_argument('--quiet', action='store_true', help='Only show errors')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Maximum concurrent probes (default: automatic, 1 = sequential)')
+    
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached probe results and probe everything again')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not read or write the probe cache')
+    parser.add_argument('--cache-file', type=Path, default=ProbeCache.default_path(),
+                        help='Probe cache location (default: %(default)s)')
     
     args = parser.parse_args()
     
-    checker = DependencyChecker()
+    cache = None if args.no_cache else ProbeCache(args.cache_file, refresh=args.refresh)
+    checker = DependencyChecker(max_workers=args.jobs, cache=cache)
     checker.run_all_checks()
     
     if not args.quiet:
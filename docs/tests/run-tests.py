@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+Movian Documentation Test Orchestrator
+
+Runs the stages of run-tests.sh and run-qa-validation.sh as a task graph
+instead of one after another. Each stage declares the stages it needs, the
+files it reads (glob patterns relative to the repository root) and the
+files it writes; stages whose needs are met run concurrently, up to
+``--jobs`` at a time.
+
+- The ``dependencies`` stage runs DependencyChecker (dependency-check.py)
+  once, including the tools the selected stages use (node, npm, bash).
+  Its results decide whether those stages can run: a stage whose tools are
+  missing is skipped, and build validation is skipped while required build
+  dependencies are missing.
+- A stage is skipped as cached when its input files, command and the
+  dependency results it uses hash to the same key as its last successful
+  run and its outputs still exist (cache: .test-run-cache.json).
+- A stage whose needed stage failed or was skipped is skipped too.
+
+One combined report is written to results/test-run.json and
+results/test-run.junit.xml, with per-stage timings and the critical path
+(the chain of dependent stages that bounds the total run time).
+
+Usage:
+    python run-tests.py [STAGE ...] [--skip build] [--jobs 4]
+    python run-tests.py --list
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from glob import glob
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+TESTS_DIR = Path(__file__).resolve().parent
+DOCS_DIR = TESTS_DIR.parent
+REPO_ROOT = DOCS_DIR.parent
+RESULTS_DIR = TESTS_DIR / 'results'
+MOVIAN_ROOT = REPO_ROOT.parent.parent / 'movian'
+CACHE_VERSION = 1
+
+# Files run-tests.sh requires to exist
+REQUIRED_DOCS = (
+    'README.md',
+    'installation/README.md',
+    'installation/linux.md',
+    'installation/macos.md',
+    'installation/troubleshooting.md',
+    'installation/build-system.md',
+)
+
+# Lines of stage output kept in the JSON report
+OUTPUT_TAIL = 40
+
+
+class Colors:
+    """ANSI color codes for terminal output"""
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    BLUE = '\033[0;34m'
+    BOLD = '\033[1m'
+    NC = '\033[0m'  # No Color
+
+
+class Stage(NamedTuple):
+    """One node of the test graph.
+
+    ``command`` is either an argument list run in the tests directory or a
+    function called with the orchestrator that returns (exit code, output).
+    """
+    name: str
+    description: str
+    command: object
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    needs: Tuple[str, ...] = ()
+    tools: Tuple[str, ...] = ()
+    skip_if: Optional[Callable[['Orchestrator'], Optional[str]]] = None
+    cacheable: bool = True
+
+
+def check_dependencies(orchestrator: 'Orchestrator') -> Tuple[int, str]:
+    """Run DependencyChecker, plus the tools the other stages use."""
+    spec = importlib.util.spec_from_file_location('dependency_check',
+                                                  TESTS_DIR / 'dependency-check.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    cache = None if orchestrator.no_cache else module.ProbeCache(module.ProbeCache.default_path())
+    # Stages run on worker threads, so the output is captured by passing a
+    # stream rather than by redirecting sys.stdout for the whole process
+    output = io.StringIO()
+    checker = module.DependencyChecker(cache=cache, output=output)
+    checker.run_all_checks()
+    for tool in sorted(orchestrator.tools - set(checker.results['tools'])):
+        checker.results['tools'][tool] = checker.check_tool(tool)
+    if cache is not None:
+        cache.save()
+    checker.print_results()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    checker.save_results(str(RESULTS_DIR / 'dependency-check.json'))
+    orchestrator.dependencies = checker.results
+    return (1 if checker.results['errors'] else 0), output.getvalue()
+
+
+def check_markdown(orchestrator: 'Orchestrator') -> Tuple[int, str]:
+    """Required files exist and every Markdown file has balanced code fences."""
+    lines = []
+    errors = 0
+    for name in REQUIRED_DOCS:
+        if not (DOCS_DIR / name).is_file():
+            lines.append(f"Missing required file: {name}")
+            errors += 1
+
+    for path in sorted(DOCS_DIR.rglob('*.md')):
+        relative = path.relative_to(DOCS_DIR)
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as error:
+            lines.append(f"Error reading {relative}: {error}")
+            errors += 1
+            continue
+        if content.count('```') % 2 != 0:
+            lines.append(f"Unmatched code blocks in {relative}")
+            errors += 1
+        if re.search(r'\]\(\s*\)', content):
+            lines.append(f"Warning: Empty links in {relative}")
+
+    lines.append(f"Documentation validation {'failed' if errors else 'passed'} ({errors} errors)")
+    return (1 if errors else 0), '\n'.join(lines) + '\n'
+
+
+def _missing_build_dependencies(orchestrator: 'Orchestrator') -> Optional[str]:
+    errors = (orchestrator.dependencies or {}).get('errors')
+    if errors:
+        return f"{len(errors)} missing build dependencies ({errors[0]})"
+    return None
+
+
+def _missing_movian_source(orchestrator: 'Orchestrator') -> Optional[str]:
+    if not MOVIAN_ROOT.is_dir():
+        return f"Movian source not found at {MOVIAN_ROOT}"
+    return None
+
+
+def default_stages(performance: bool = False) -> List[Stage]:
+    """The stages of run-tests.sh and run-qa-validation.sh."""
+    python = sys.executable
+    markdown = ('docs/**/*.md',)
+    skins = ('docs/ui/theming/examples/**/*',)
+    return [
+        Stage('dependencies', 'Dependency check', check_dependencies,
+              inputs=('docs/tests/dependency-check.py',),
+              outputs=('results/dependency-check.json',), cacheable=False),
+        Stage('build', 'Build validation',
+              ['bash', 'build-validation.sh'] + (['--performance'] if performance else []),
+              inputs=('docs/tests/build-validation.sh', 'docs/installation/**/*'),
+              tools=('bash', 'git'), skip_if=_missing_build_dependencies),
+        Stage('markdown', 'Documentation validation', check_markdown, inputs=markdown),
+        Stage('npm-install', 'Node.js test dependencies', ['npm', 'install', '--silent'],
+              inputs=('docs/tests/package.json', 'docs/tests/package-lock.json'),
+              outputs=('node_modules',), tools=('npm',)),
+        Stage('plugins', 'Plugin integration tests', ['node', 'plugin-integration-tests.js'],
+              inputs=('docs/tests/plugin-integration-tests.js', 'docs/tests/movian-mock/**/*',
+                      'docs/plugins/**/*'),
+              outputs=('results/integration-test-report.json',),
+              needs=('npm-install',), tools=('node',)),
+        Stage('links', 'Link validation', ['node', 'link-validator.js'],
+              inputs=('docs/tests/link-validator.js',) + markdown,
+              outputs=('results/link-validation.json',), tools=('node',)),
+        Stage('cross-references', 'Cross-reference validation',
+              ['node', 'cross-reference-validator.js'],
+              inputs=('docs/tests/cross-reference-validator.js',) + markdown,
+              outputs=('results/cross-reference-validation.json',), tools=('node',)),
+        Stage('file-references', 'File reference validation',
+              ['node', 'file-reference-validator.js', f'--movian-root={MOVIAN_ROOT}'],
+              inputs=('docs/tests/file-reference-validator.js',) + markdown,
+              outputs=('results/file-reference-validation.json',), tools=('node',),
+              skip_if=_missing_movian_source),
+        Stage('view-syntax', 'View syntax validation', ['node', 'view-syntax-validator.js'],
+              inputs=('docs/tests/view-syntax-validator.js', 'docs/tests/view-syntax-tests/*'),
+              outputs=('results/view-syntax-validation-report.json',), tools=('node',)),
+        Stage('view-syntax-tree', 'View syntax validation (syntax trees)',
+              [python, 'view-syntax-validator.py'],
+              inputs=('docs/tests/view-syntax-validator.py', 'docs/tests/view-syntax-tests/*',
+                      'scripts/glw_view.py')),
+        Stage('macros', 'Macro validation', ['node', 'macro-validator.js'],
+              inputs=('docs/tests/macro-validator.js',) + skins,
+              outputs=('results/macro-validation-report.json',), tools=('node',)),
+        Stage('macro-index', 'Macro index validation',
+              [python, str(REPO_ROOT / 'scripts' / 'macro_index.py'), '--no-cache'],
+              inputs=('scripts/macro_index.py', 'scripts/glw_view.py') + skins),
+        Stage('skin-structure', 'Skin structure validation',
+              ['node', 'skin-structure-validator.js'],
+              inputs=('docs/tests/skin-structure-validator.js',) + skins,
+              outputs=('results/skin-structure-validation-report.json',), tools=('node',)),
+    ]
+
+
+class Orchestrator:
+    """Runs a graph of stages concurrently and records their results."""
+
+    def __init__(self, stages: List[Stage], jobs: Optional[int] = None,
+                 cache_path: Optional[Path] = None, verbose: bool = False):
+        self.stages = {stage.name: stage for stage in stages}
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.no_cache = cache_path is None
+        self.verbose = verbose
+        self.tools: Set[str] = {tool for stage in stages for tool in stage.tools}
+        self.dependencies: Optional[Dict] = None
+        self.results: Dict[str, Dict] = {}
+        self._file_hashes: Dict[str, str] = {}
+        self._cache = self._load_cache()
+
+        for stage in stages:
+            unknown = [name for name in stage.needs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} needs unknown stage {unknown[0]}")
+        self.order = self._topological_order()
+
+    def waits_for(self, stage: Stage) -> Tuple[str, ...]:
+        """Stages that must finish first: its needs, and the dependency check
+        if the stage uses its results."""
+        waits = stage.needs
+        if (stage.tools or stage.skip_if) and 'dependencies' in self.stages \
+                and stage.name != 'dependencies':
+            waits += ('dependencies',)
+        return waits
+
+    def _topological_order(self) -> List[str]:
+        order, state = [], {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Stage dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = 'visiting'
+            for other in self.waits_for(self.stages[name]):
+                visit(other, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    # Input hashing and the result cache
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('stages', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'stages': self._cache}, f, indent=1)
+        os.replace(temp_path, self.cache_path)
+
+    def _hash_file(self, relative: str) -> str:
+        digest = self._file_hashes.get(relative)
+        if digest is None:
+            with open(REPO_ROOT / relative, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self._file_hashes[relative] = digest
+        return digest
+
+    def input_files(self, stage: Stage) -> List[str]:
+        files = set()
+        for pattern in stage.inputs:
+            for match in glob(str(REPO_ROOT / pattern), recursive=True):
+                if os.path.isfile(match) and '__pycache__' not in match:
+                    files.add(Path(match).relative_to(REPO_ROOT).as_posix())
+        return sorted(files)
+
+    def cache_key(self, stage: Stage) -> str:
+        """Hash of everything a stage's result depends on."""
+        key = hashlib.sha256()
+        command = stage.command if isinstance(stage.command, list) else stage.command.__name__
+        key.update(json.dumps(command).encode())
+        for relative in self.input_files(stage):
+            key.update(f"{relative}\0{self._hash_file(relative)}\n".encode())
+        # Only stages that wait for the dependency check see its results
+        if self.dependencies is not None and (stage.tools or stage.skip_if):
+            tools = self.dependencies['tools']
+            key.update(json.dumps({tool: tools.get(tool, {}).get('version')
+                                   for tool in stage.tools}, sort_keys=True).encode())
+            if stage.skip_if is not None:
+                key.update(json.dumps([self.dependencies.get(section) for section in
+                                       ('tools', 'libraries', 'errors')],
+                                      sort_keys=True).encode())
+        return key.hexdigest()
+
+    def _is_cached(self, stage: Stage, key: str) -> bool:
+        entry = self._cache.get(stage.name)
+        return stage.cacheable and entry is not None and entry['key'] == key and \
+            all((TESTS_DIR / output).exists() for output in stage.outputs)
+
+    # Running
+
+    def tool_available(self, tool: str) -> bool:
+        if self.dependencies is not None and tool in self.dependencies['tools']:
+            return self.dependencies['tools'][tool]['available']
+        return shutil.which(tool) is not None
+
+    def _skip_reason(self, stage: Stage) -> Optional[str]:
+        for need in stage.needs:
+            status = self.results[need]['status']
+            if status in ('failed', 'skipped'):
+                return f"{need} {status}"
+        missing = [tool for tool in stage.tools if not self.tool_available(tool)]
+        if missing:
+            return f"{', '.join(missing)} not available"
+        return stage.skip_if(self) if stage.skip_if is not None else None
+
+    def _execute(self, stage: Stage) -> Tuple[int, str, float, float]:
+        """Run a stage in a worker; return its result and when it started and ended.
+
+        The times are taken in the worker, relative to the start of the run,
+        so time spent waiting for a free worker is not counted.
+        """
+        started = time.perf_counter() - self.start
+        returncode, output = self._run_command(stage)
+        return returncode, output, started, time.perf_counter() - self.start
+
+    def _run_command(self, stage: Stage) -> Tuple[int, str]:
+        if callable(stage.command):
+            try:
+                return stage.command(self)
+            except Exception as error:  # a broken stage must not stop the run
+                return 1, f"{type(error).__name__}: {error}\n"
+        try:
+            process = subprocess.run(stage.command, cwd=TESTS_DIR, stdout=subprocess.PIPE,
+                                     stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+        except OSError as error:
+            return 127, f"{error}\n"
+        return process.returncode, process.stdout.decode('utf-8', errors='replace')
+
+    def _record(self, stage: Stage, status: str, started: float = 0.0, duration: float = 0.0,
+                returncode: Optional[int] = None, output: str = '', reason: Optional[str] = None):
+        self.results[stage.name] = {
+            'name': stage.name,
+            'description': stage.description,
+            'status': status,
+            'start': round(started, 3),
+            'duration': round(duration, 3),
+            'returncode': returncode,
+            'reason': reason,
+            'output': output,
+        }
+        color = {'passed': Colors.GREEN, 'failed': Colors.RED}.get(status, Colors.YELLOW)
+        detail = f"{duration:.2f}s" if status in ('passed', 'failed') else reason
+        print(f"{color}[{status.upper():7}]{Colors.NC} {stage.name}: {stage.description} ({detail})")
+        if output and (self.verbose or status == 'failed'):
+            lines = output.rstrip('\n').split('\n')
+            for line in lines[-OUTPUT_TAIL:] if not self.verbose else lines:
+                print(f"    {line}")
+
+    def run(self) -> Dict[str, Dict]:
+        """Run every stage; return the results by stage name."""
+        pending = list(self.order)
+        running = {}
+        self.start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            while pending or running:
+                for name in list(pending):
+                    stage = self.stages[name]
+                    if any(other not in self.results for other in self.waits_for(stage)):
+                        continue
+                    pending.remove(name)
+                    now = time.perf_counter() - self.start
+
+                    reason = self._skip_reason(stage)
+                    if reason:
+                        self._record(stage, 'skipped', now, reason=reason)
+                        continue
+                    key = self.cache_key(stage) if stage.cacheable else None
+                    if key is not None and self._is_cached(stage, key):
+                        self._record(stage, 'cached', now, reason=f"inputs unchanged since "
+                                     f"{self._cache[stage.name]['finished']}")
+                        continue
+                    running[executor.submit(self._execute, stage)] = (stage, key)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, key = running.pop(future)
+                    returncode, output, started, finished = future.result()
+                    duration = finished - started
+                    status = 'passed' if returncode == 0 else 'failed'
+                    self._record(stage, status, started, duration, returncode, output)
+                    if key is not None and status == 'passed':
+                        self._cache[stage.name] = {
+                            'key': key,
+                            'duration': round(duration, 3),
+                            'finished': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                        }
+
+        self.wall_time = time.perf_counter() - self.start
+        self._save_cache()
+        return self.results
+
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """Return the longest chain of dependent stages by run time."""
+        finish, previous = {}, {}
+        for name in self.order:
+            waits = self.waits_for(self.stages[name])
+            before = max(waits, key=lambda other: finish[other], default=None)
+            finish[name] = self.results[name]['duration'] + (finish[before] if before else 0.0)
+            previous[name] = before
+        if not finish:
+            return 0.0, []
+        name = max(finish, key=finish.get)
+        total, path = finish[name], []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return total, path[::-1]
+
+    # Reports
+
+    def summary(self) -> Dict:
+        counts = {status: 0 for status in ('passed', 'failed', 'skipped', 'cached')}
+        for result in self.results.values():
+            counts[result['status']] += 1
+        length, path = self.critical_path()
+        return {
+            'total': len(self.results),
+            **counts,
+            'wallTime': round(self.wall_time, 3),
+            'serialTime': round(sum(r['duration'] for r in self.results.values()), 3),
+            'criticalPath': {'stages': path, 'time': round(length, 3)},
+            'jobs': self.jobs,
+        }
+
+    def save_json(self, path: Path):
+        report = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'summary': self.summary(),
+            'stages': [dict(self.results[name], output=_tail(self.results[name]['output']))
+                       for name in self.order],
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    def save_junit(self, path: Path):
+        summary = self.summary()
+        suites = ET.Element('testsuites', name='movian-docs', tests=str(summary['total']),
+                            failures=str(summary['failed']), time=str(summary['wallTime']))
+        suite = ET.SubElement(suites, 'testsuite', name='docs.tests', tests=str(summary['total']),
+                              failures=str(summary['failed']),
+                              skipped=str(summary['skipped'] + summary['cached']),
+                              time=str(summary['wallTime']),
+                              timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        for name in self.order:
+            result = self.results[name]
+            case = ET.SubElement(suite, 'testcase', classname='docs.tests', name=name,
+                                 time=str(result['duration']))
+            if result['status'] == 'failed':
+                failure = ET.SubElement(case, 'failure',
+                                        message=f"exit status {result['returncode']}")
+                failure.text = _tail(result['output'])
+            elif result['status'] in ('skipped', 'cached'):
+                ET.SubElement(case, 'skipped', message=result['reason'] or result['status'])
+            if result['output']:
+                ET.SubElement(case, 'system-out').text = result['output']
+        ET.indent(suites)
+        ET.ElementTree(suites).write(path, encoding='utf-8', xml_declaration=True)
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"\n{Colors.BOLD}Test Summary{Colors.NC}")
+        print("============")
+        print(f"Stages: {summary['total']} ({summary['passed']} passed, {summary['failed']} failed, "
+              f"{summary['cached']} cached, {summary['skipped']} skipped)")
+        print(f"Wall time: {summary['wallTime']:.2f}s with {summary['jobs']} workers "
+              f"(stages add up to {summary['serialTime']:.2f}s)")
+        critical = summary['criticalPath']
+        print(f"Critical path: {' -> '.join(critical['stages'])} ({critical['time']:.2f}s)")
+        for name in sorted(self.results, key=lambda n: -self.results[n]['duration']):
+            result = self.results[name]
+            if result['duration']:
+                print(f"  {name:20} {result['duration']:7.2f}s")
+
+
+def _tail(output: str) -> str:
+    return '\n'.join(output.rstrip('\n').split('\n')[-OUTPUT_TAIL:]) if output else ''
+
+
+def select_stages(stages: List[Stage], names: List[str], skip: List[str]) -> List[Stage]:
+    """Return the named stages and the stages they need (all stages if none
+    are named), without the skipped ones."""
+    by_name = {stage.name: stage for stage in stages}
+    for name in names + skip:
+        if name not in by_name:
+            raise ValueError(f"Unknown stage: {name} (see --list)")
+
+    if names:
+        selected, stack = set(), list(names)
+        while stack:
+            name = stack.pop()
+            if name not in selected:
+                selected.add(name)
+                stack.extend(by_name[name].needs)
+                if by_name[name].tools or by_name[name].skip_if:
+                    stack.append('dependencies')
+    else:
+        selected = set(by_name)
+    selected -= set(skip)
+    # Drop needs on skipped stages so the rest can still run
+    return [stage._replace(needs=tuple(n for n in stage.needs if n in selected))
+            for stage in stages if stage.name in selected]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the documentation tests as a parallel task graph')
+    parser.add_argument('stages', nargs='*', help='Stages to run, with the stages they need '
+                        '(default: all)')
+    parser.add_argument('--skip', action='append', default=[], metavar='STAGE',
+                        help='Do not run a stage (repeatable)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Maximum concurrent stages (default: CPU count)')
+    parser.add_argument('--performance', action='store_true',
+                        help='Include performance tests in build validation')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Run every stage even if its inputs are unchanged')
+    parser.add_argument('--cache-file', type=Path, default=REPO_ROOT / '.test-run-cache.json',
+                        help='Stage result cache (default: %(default)s)')
+    parser.add_argument('--verbose', action='store_true', help='Show the output of every stage')
+    parser.add_argument('--list', action='store_true', help='List the stages and exit')
+    args = parser.parse_args()
+
+    try:
+        stages = select_stages(default_stages(args.performance), args.stages, args.skip)
+        orchestrator = Orchestrator(stages, jobs=args.jobs,
+                                    cache_path=None if args.no_cache else args.cache_file,
+                                    verbose=args.verbose)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
+
+    if args.list:
+        for name in orchestrator.order:
+            waits = orchestrator.waits_for(orchestrator.stages[name])
+            print(f"{name:20} {orchestrator.stages[name].description}"
+                  + (f" (after {', '.join(waits)})" if waits else ''))
+        return 0
+
+    print(f"{Colors.BOLD}Movian Documentation Test Suite{Colors.NC}")
+    print(f"{Colors.BLUE}[INFO]{Colors.NC} {len(stages)} stages, {orchestrator.jobs} workers\n")
+    orchestrator.run()
+    orchestrator.print_summary()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    orchestrator.save_json(RESULTS_DIR / 'test-run.json')
+    orchestrator.save_junit(RESULTS_DIR / 'test-run.junit.xml')
+    print(f"\nReports saved to: {RESULTS_DIR / 'test-run.json'}, "
+          f"{RESULTS_DIR / 'test-run.junit.xml'}")
+
+    return 1 if any(r['status'] == 'failed' for r in orchestrator.results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
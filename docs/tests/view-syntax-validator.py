@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+GLW View File Syntax Validator (syntax tree based)
+
+Runs the checks of view-syntax-validator.js against the test view files,
+but on the syntax trees built by scripts/glw_view.py instead of regexes
+over the file text: each file is parsed once (memoized by content hash)
+and every check is a query on its tree. "Valid syntax" means the file
+parses, and a failure names the line and column of the error.
+
+With --docs, every .view file under docs/ is parsed as well.
+
+Usage:
+    python view-syntax-validator.py [--verbose] [--docs] [--json FILE]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+TESTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TESTS_DIR.parent.parent / 'scripts'))
+
+from glw_view import Node, ParsedView, ViewCache, iter_view_files  # noqa: E402
+
+TEST_DIR = TESTS_DIR / 'view-syntax-tests'
+TEST_FILES = {
+    'lexical': 'test-lexical-elements.view',
+    'operators': 'test-operators.view',
+    'expressions': 'test-expressions.view',
+    'properties': 'test-properties.view',
+    'widgets': 'test-widgets.view',
+    'preprocessor': 'test-preprocessor.view',
+    'macros': 'test-macros.view',
+    'advanced': 'test-advanced.view',
+}
+HEX_COLOR_RE = re.compile(r'#[0-9A-Fa-f]{3,6}$')
+
+
+class Colors:
+    """ANSI color codes for terminal output"""
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    BLUE = '\033[0;34m'
+    CYAN = '\033[0;36m'
+    BOLD = '\033[1m'
+    NC = '\033[0m'  # No Color
+
+
+class CheckFailed(Exception):
+    pass
+
+
+class ViewSyntaxValidator:
+    """Runs named checks against parsed test views and records the results."""
+
+    def __init__(self, verbose: bool = False):
+        self.cache = ViewCache()
+        self.verbose = verbose
+        self.results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
+
+    def view(self, name: str) -> ParsedView:
+        path = TEST_DIR / TEST_FILES[name]
+        if not path.exists():
+            raise CheckFailed(f"File does not exist: {path}")
+        return self.cache.parse_file(path)
+
+    def section(self, title: str):
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{title}{Colors.NC}")
+        print(f"{Colors.BLUE}{'=' * len(title)}{Colors.NC}")
+
+    def check(self, name: str, test: Callable[[], None]):
+        self.results['total'] += 1
+        try:
+            test()
+        except CheckFailed as error:
+            self.results['failed'] += 1
+            self.results['errors'].append({'test': name, 'error': str(error)})
+            print(f"{Colors.RED}✗ {name}: {error}{Colors.NC}")
+        else:
+            self.results['passed'] += 1
+            print(f"{Colors.GREEN}✓ {name}{Colors.NC}")
+
+    def suite(self, title: str, name: str, checks: Dict[str, Callable[[ParsedView], bool]]):
+        """Run a test file's checks; each returns True when the tree has the feature."""
+        self.section(title)
+        self.check(f"{name.capitalize()} test file exists", lambda: self.view(name))
+
+        for description, predicate in checks.items():
+            def test(predicate=predicate, description=description):
+                view = self.view(name)
+                if not view.ok:
+                    raise CheckFailed(f"{view.name} does not parse ({view.error})")
+                if not predicate(view):
+                    raise CheckFailed(f"{view.name} should contain {description}")
+            self.check(f"Contains {description}", test)
+
+        self.check('Valid syntax structure', lambda: self.assert_valid(self.view(name)))
+
+    def assert_valid(self, view: ParsedView):
+        if not view.ok:
+            raise CheckFailed(f"{view.name}:{view.error}")
+        if self.verbose:
+            print(f"{Colors.CYAN}  {len(view.nodes('widget'))} widgets, "
+                  f"{len(view.nodes('assign'))} assignments{Colors.NC}")
+
+    def run(self):
+        self.suite('Testing Lexical Elements', 'lexical', {
+            'single-line comments': lambda v: any(c.startswith('//') for c in v.comments),
+            'multi-line comments': lambda v: any(c.startswith('/*') for c in v.comments),
+            'double-quoted strings': lambda v: bool(v.nodes('string')),
+            'single-quoted strings': lambda v: bool(v.nodes('rich_string')),
+            'integer literals': lambda v: any(isinstance(n.value, int) for n in v.nodes('number')),
+            'float literals': lambda v: any(isinstance(n.value, float) for n in v.nodes('number')),
+            'EM unit literals': lambda v: bool(v.nodes('em')),
+            'true constant': lambda v: _has(v, 'constant', 'true'),
+            'false constant': lambda v: _has(v, 'constant', 'false'),
+        })
+        self.suite('Testing Operators', 'operators', {
+            'standard assignment': lambda v: _has(v, 'assign', '='),
+            'conditional assignment': lambda v: _has(v, 'assign', '?='),
+            'link assignment': lambda v: _has(v, 'assign', '<-'),
+            'arithmetic operators': lambda v: all(_has(v, 'binary', op) for op in '+-*/'),
+            'comparison operators': lambda v: all(_has(v, 'binary', op)
+                                                  for op in ('==', '!=', '<', '>')),
+            'logical operators': lambda v: _has(v, 'binary', '&&') and
+            _has(v, 'binary', '||') and _has(v, 'unary', '!'),
+            'ternary operator': lambda v: bool(v.nodes('ternary')),
+            'null coalescing': lambda v: _has(v, 'binary', '??'),
+        })
+        self.suite('Testing Expressions', 'expressions', {
+            'arithmetic expressions': lambda v: any(
+                n.value in ('+', '-', '*', '/') and all(c.kind == 'number' for c in n.children)
+                for n in v.nodes('binary')),
+            'property references': lambda v: bool(v.properties()),
+            'hex colors': lambda v: any(HEX_COLOR_RE.match(n.value) for n in v.nodes('string')),
+            'RGB vectors': lambda v: any(
+                len(n.children) == 3 and all(c.kind == 'number' for c in n.children)
+                for n in v.nodes('vector')),
+            'nested ternary': lambda v: any(
+                any(c.kind == 'ternary' for c in n.children) for n in v.nodes('ternary')),
+        })
+        self.suite('Testing Property References', 'properties', {
+            'basic property reference': lambda v: bool(v.properties()),
+            'property chain': lambda v: any(len(n.value) > 1 for n in v.properties()),
+            '$self reference': lambda v: _has_root(v, 'self'),
+            '$parent reference': lambda v: _has_root(v, 'parent'),
+            '$page reference': lambda v: _has_root(v, 'page'),
+        })
+        self.suite('Testing Widget Definitions', 'widgets', {
+            'container_x, container_y and container_z': lambda v: all(
+                v.widgets(name) for name in ('container_x', 'container_y', 'container_z')),
+            'label and image widgets': lambda v: bool(v.widgets('label') and v.widgets('image')),
+            'list widgets': lambda v: bool(v.widgets('list_x') or v.widgets('list_y')),
+            'caption, width and alpha attributes': lambda v: all(
+                v.assignments(name) for name in ('caption', 'width', 'alpha')),
+            'nested widget definitions': lambda v: any(
+                any(c.kind == 'widget' for c in n.children)
+                for n in v.widgets() if n.value.startswith('container_')),
+        })
+        self.suite('Testing Preprocessor Directives', 'preprocessor', {
+            '#include directive': lambda v: any(n.value.endswith('.view')
+                                                for n in v.nodes('include')),
+            '#import directive': lambda v: any(n.value.endswith('.view')
+                                               for n in v.nodes('import')),
+        })
+        self.suite('Testing Macros', 'macros', {
+            'macro definition': lambda v: any(n.children and n.children[-1].kind == 'block'
+                                              for n in v.defines()),
+            'macro invocations': lambda v: bool(_macro_calls(v)),
+            'macro with defaults': lambda v: any(
+                param.kind == 'param' and param.children
+                for n in v.defines() for param in n.children),
+        })
+        self.suite('Testing Advanced Features', 'advanced', {
+            'cloner widget': lambda v: bool(v.widgets('cloner')),
+            '$self in cloner context': lambda v: any(
+                n.value[0] == 'self' for cloner in v.widgets('cloner')
+                for n in cloner.find('property')),
+            'event handler': lambda v: bool(v.calls('onEvent')),
+            'loader widget': lambda v: bool(v.widgets('loader')),
+        })
+
+    def run_docs(self, docs_root: Path):
+        """Parse every .view file under the docs tree."""
+        self.section('Testing Documentation View Files')
+        for path in iter_view_files(docs_root):
+            relative = path.relative_to(docs_root.parent)
+            self.check(f"{relative} parses", lambda path=path: self.assert_valid(
+                self.cache.parse_file(path)))
+
+    def print_summary(self):
+        self.section('Test Summary')
+        results = self.results
+        print(f"{Colors.BOLD}Total Tests: {results['total']}{Colors.NC}")
+        print(f"{Colors.GREEN}Passed: {results['passed']}{Colors.NC}")
+        print(f"{Colors.RED if results['failed'] else Colors.GREEN}"
+              f"Failed: {results['failed']}{Colors.NC}")
+        print(f"Files parsed: {self.cache.parsed} ({self.cache.hits} cached lookups)")
+
+
+def _has(view: ParsedView, kind: str, value) -> bool:
+    return any(node.value == value for node in view.nodes(kind))
+
+
+def _has_root(view: ParsedView, root: str) -> bool:
+    return any(node.value[0] == root for node in view.properties())
+
+
+def _macro_calls(view: ParsedView) -> List[Node]:
+    defined = {node.value for node in view.defines()}
+    return [node for node in view.calls() if node.value in defined]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate GLW view syntax on parsed trees')
+    parser.add_argument('--verbose', action='store_true', help='Show tree statistics')
+    parser.add_argument('--docs', action='store_true',
+                        help='Also parse every .view file under docs/')
+    parser.add_argument('--json', type=Path, help='Save results to JSON file')
+    args = parser.parse_args()
+
+    if not TEST_DIR.exists():
+        print(f"Test directory not found: {TEST_DIR}")
+        return 1
+
+    validator = ViewSyntaxValidator(verbose=args.verbose)
+    validator.run()
+    if args.docs:
+        validator.run_docs(TESTS_DIR.parent)
+    validator.print_summary()
+
+    if args.json:
+        results = validator.results
+        report = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'summary': {
+                'total': results['total'],
+                'passed': results['passed'],
+                'failed': results['failed'],
+                'passRate': round(100 * results['passed'] / max(results['total'], 1), 1),
+            },
+            'errors': results['errors'],
+        }
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nReport saved to: {args.json}")
+
+    return 1 if validator.results['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Heading Anchor Index
+
+Precomputed ``{file: {anchor: line}}`` map of every heading anchor in the
+documentation, so checking a ``page.md#anchor`` link target is a dictionary
+lookup instead of a re-parse of the target page.
+
+Anchors are computed the way MkDocs renders them (Python-Markdown ``toc``
+with its default slugify): explicit ``{#id}`` attributes, ASCII slugs of the
+rendered heading text and ``_1``, ``_2`` suffixes for duplicates. Headings
+inside code blocks and HTML blocks are ignored.
+
+The map is saved as JSON and updated incrementally: only files whose
+modification time or size changed are read again, and deleted files are
+dropped.
+
+``--verify-toc`` checks the heading rules against ``TOC_CASES``, headings
+whose anchors were once computed differently from ``toc``, and against
+Python-Markdown itself when it is installed.
+
+Usage:
+    python scripts/anchor_index.py [--docs-root docs] [--check page.md#anchor ...]
+    python scripts/anchor_index.py --verify-toc
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from docs_corpus import extract_headings, iter_markdown_files
+
+INDEX_VERSION = 2
+
+# (heading, anchor rendered by Python-Markdown toc)
+TOC_CASES = [
+    ('#### `-p <path>`', '-p-path'),                            # HTML-like code span
+    ('### Image Flags (GLW_IMAGE_*)', 'image-flags-glw_image_'),  # trailing underscore
+    ('## `__init__` and *emphasis*', '__init__-and-emphasis'),
+    ('## Options {#custom-id}', 'custom-id'),
+]
+
+
+class AnchorIndex:
+    """Heading anchors of every markdown file, keyed by docs-relative path."""
+
+    def __init__(self, docs_root: Path, path: Optional[Path] = None):
+        self.docs_root = docs_root
+        self.path = path
+        self._entries = {}  # relative path -> {'mtime_ns', 'size', 'anchors'}
+        self.files_read = 0
+
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == INDEX_VERSION:
+            self._entries = data.get('files', {})
+
+    def save(self):
+        """Write the index (atomically)."""
+        if self.path is None:
+            return
+
+        data = {'version': INDEX_VERSION, 'files': dict(sorted(self._entries.items()))}
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def key(self, file_path: Path) -> str:
+        """Return the index key (docs-root relative POSIX path) of a file."""
+        return Path(os.path.relpath(file_path, self.docs_root)).as_posix()
+
+    def update(self) -> int:
+        """Bring the index up to date with the docs tree; return files re-read."""
+        before = self.files_read
+        seen = set()
+        for file_path in iter_markdown_files(self.docs_root):
+            seen.add(self.update_file(file_path))
+
+        for key in self._entries.keys() - seen:
+            del self._entries[key]
+        return self.files_read - before
+
+    def update_file(self, file_path: Path) -> str:
+        """Refresh the anchors of one file if it changed; return its key."""
+        key = self.key(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            self._entries.pop(key, None)
+            return key
+
+        entry = self._entries.get(key)
+        if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self.files_read += 1
+            self._entries[key] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'anchors': {anchor: line for _, _, anchor, line in extract_headings(content)},
+            }
+        return key
+
+    def anchors(self, file_path: Path) -> Dict[str, int]:
+        """Return ``{anchor: line}`` for a file (empty if it is not indexed)."""
+        entry = self._entries.get(self.key(file_path))
+        return entry['anchors'] if entry is not None else {}
+
+    def line(self, file_path: Path, anchor: str) -> Optional[int]:
+        """Return the line of a heading anchor, or None if the page has no such anchor."""
+        return self.anchors(file_path).get(anchor)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Return the plain ``{file: {anchor: line}}`` map."""
+        return {key: entry['anchors'] for key, entry in sorted(self._entries.items())}
+
+
+def verify_toc() -> List[str]:
+    """Check TOC_CASES against extract_headings (and Python-Markdown); return failures."""
+    try:
+        import markdown
+    except ImportError:
+        markdown = None
+
+    failures = []
+    for heading, expected in TOC_CASES:
+        anchor = extract_headings(heading)[0][2]
+        if anchor != expected:
+            failures.append(f"{heading!r}: anchor {anchor!r}, expected {expected!r}")
+        if markdown is not None:
+            md = markdown.Markdown(extensions=['toc', 'attr_list'])
+            md.convert(heading)
+            rendered = md.toc_tokens[0]['id']
+            if rendered != expected:
+                failures.append(f"{heading!r}: toc renders {rendered!r}, expected {expected!r}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the heading anchor index')
+    parser.add_argument('--docs-root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs',
+                        help='Root directory of documentation')
+    parser.add_argument('--index', type=Path,
+                        default=Path(__file__).parent.parent / '.docs-anchor-index.json',
+                        help='Anchor index file')
+    parser.add_argument('--check', nargs='+', metavar='PAGE#ANCHOR',
+                        help='Look up anchors (paths relative to the docs root)')
+    parser.add_argument('--verify-toc', action='store_true',
+                        help='Check the heading rules against known toc anchors and exit')
+    args = parser.parse_args()
+
+    if args.verify_toc:
+        failures = verify_toc()
+        for failure in failures:
+            print(failure)
+        if failures:
+            print(f"{len(failures)} toc mismatches")
+            return 1
+        print(f"All {len(TOC_CASES)} toc cases match")
+        return 0
+
+    if not args.docs_root.exists():
+        print(f"Error: Documentation root not found: {args.docs_root}")
+        return 1
+
+    index = AnchorIndex(args.docs_root, args.index)
+    files_read = index.update()
+    index.save()
+
+    if args.check:
+        missing = 0
+        for target in args.check:
+            page, _, anchor = target.partition('#')
+            line = index.line(args.docs_root / page, anchor)
+            if line is None:
+                missing += 1
+                print(f"{target}: not found")
+            else:
+                print(f"{target}: {page}:{line}")
+        return 1 if missing else 0
+
+    anchors = sum(len(entry) for entry in index.to_dict().values())
+    print(f"Files:   {len(index)} ({files_read} read)")
+    print(f"Anchors: {anchors}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,120 +1,421 @@
 #!/usr/bin/env python3
 """
 Script to create a new task completion report from template.
-Usage: python create-task-report.py <task-id> [task-description]
+Usage: python create-task-report.py <task-id> [task-description] [--if-exists POLICY]
+       python create-task-report.py --batch tasks.csv|tasks.jsonl [--if-exists POLICY]
+
+In batch mode every task of the CSV or JSONL file gets its report, and all
+PROGRESS.md entries are added in a single read-modify-write. PROGRESS.md is
+always updated under an advisory file lock and replaced atomically, so
+concurrent runs cannot lose each other's entries. Whether a task already
+has an entry is decided under the same lock, so a task never gets two.
+
+Reports are rendered from task-reports/TEMPLATE.md, compiled once per run
+(see report_template.py). Extra JSONL fields such as ``status``,
+``duration`` or ``files_created`` lists fill the matching template fields
+and sections.
+
+An existing report is handled by the --if-exists policy: ask (the default
+on a terminal), skip (the default otherwise and in batch mode), overwrite
+or fail. Only ask ever waits for input. An overwritten report keeps its
+existing PROGRESS.md entry.
+
+Task IDs are used in report file names, so only IDs like ``3.3``,
+``11.1.1`` or ``user-001`` are accepted.
 """
 
+import argparse
+import contextlib
+import csv
+import json
 import sys
 import os
+import re
+import tempfile
 from datetime import datetime
-import shutil
 
-def create_task_report(task_id, task_description=""):
+from report_template import TemplateError, compile_template
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+TEMPLATE_PATH = "task-reports/TEMPLATE.md"
+PROGRESS_PATH = "PROGRESS.md"
+COMPLETED_HEADING = "## Completed Tasks"
+COMPLETED_HEADING_RE = re.compile(r'^[ \t]*' + re.escape(COMPLETED_HEADING) + r'[ \t]*\r?(?:\n|$)',
+                                  re.MULTILINE)
+TASK_ENTRY_RE = re.compile(r'^### Task (\S+)', re.MULTILINE)
+
+# Column / key names accepted for batch input, in order of preference
+ID_FIELDS = ('task_id', 'id', 'request_id')
+DESCRIPTION_FIELDS = ('task_description', 'description', 'title')
+
+IF_EXISTS_POLICIES = ('ask', 'skip', 'overwrite', 'fail')
+
+# Task IDs become part of report file names: dotted numbers (3.3, 11.1.1) or
+# request IDs (user-001), never path separators or '..'
+TASK_ID_RE = re.compile(r'[A-Za-z0-9]+(?:[._-][A-Za-z0-9]+)*')
+
+_compiled_templates = {}  # template path -> (mtime_ns, Template)
+
+
+def atomic_write(path, content):
+    """Replace a file with new content via a temporary file and rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        else:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive advisory lock on ``<path>.lock`` while the block runs.
+
+    The lock lives on a separate file because the locked file itself is
+    replaced by rename, which would leave other processes waiting on a lock
+    of the old inode.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(f"{path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_template(template_path=TEMPLATE_PATH):
+    """Return the compiled report template, compiling it once per change."""
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    cached = _compiled_templates.get(template_path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            cached = (mtime_ns, compile_template(f.read()))
+        _compiled_templates[template_path] = cached
+    return cached[1]
+
+
+def render_report(template, task_id, task_description, current_date, fields=None):
+    """Render one report from a compiled template.
+
+    ``fields`` holds any extra template fields (status, duration,
+    files_created, ...); the task ID, description and date always win.
+    """
+    context = dict(fields or {})
+    context.update({
+        'task_id': task_id,
+        'description': task_description or f"Task {task_id} completion",
+        'date': current_date,
+    })
+    return template.render(context)
+
+
+def check_task_id(task_id):
+    """Raise ValueError unless task_id is a valid task ID."""
+    if not TASK_ID_RE.fullmatch(task_id):
+        raise ValueError(f"invalid task ID {task_id!r} (expected e.g. 3.3 or user-001)")
+
+
+def report_path_for(task_id):
+    check_task_id(task_id)
+    return f"task-reports/task-{task_id}-report.md"
+
+
+def default_if_exists():
+    """Ask only when someone can answer; never block a script or CI job."""
+    return 'ask' if sys.stdin is not None and sys.stdin.isatty() else 'skip'
+
+
+def create_task_report(task_id, task_description="", if_exists=None, fields=None):
     """Create a new task report from template."""
-    
+
     # Paths
-    template_path = "task-reports/TEMPLATE.md"
-    report_path = f"task-reports/task-{task_id}-report.md"
-    
+    template_path = TEMPLATE_PATH
+    report_path = report_path_for(task_id)
+
     # Check if template exists
     if not os.path.exists(template_path):
         print(f"Error: Template file {template_path} not found!")
         return False
-    
+
     # Check if report already exists
     if os.path.exists(report_path):
-        response = input(f"Report {report_path} already exists. Overwrite? (y/N): ")
-        if response.lower() != 'y':
-            print("Cancelled.")
+        policy = if_exists or default_if_exists()
+        if policy == 'ask':
+            response = input(f"Report {report_path} already exists. Overwrite? (y/N): ")
+            if response.lower() != 'y':
+                print("Cancelled.")
+                return False
+        elif policy == 'skip':
+            print(f"⏭️  Report {report_path} already exists, skipped (use --if-exists overwrite)")
+            return False
+        elif policy == 'fail':
+            print(f"Error: Report {report_path} already exists!")
             return False
-    
-    # Read template
-    with open(template_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Replace placeholders
+
+    # Render the compiled template
+    try:
+        template = load_template(template_path)
+    except TemplateError as e:
+        print(f"Error: {template_path}: {e}")
+        return False
     current_date = datetime.now().strftime("%Y-%m-%d")
-    
-    replacements = {
-        '[ID]': task_id,
-        '[YYYY-MM-DD]': current_date,
-        '[Brief description of the completed task from the task list]': task_description or f"Task {task_id} completion"
-    }
-    
-    for placeholder, replacement in replacements.items():
-        content = content.replace(placeholder, replacement)
-    
+    content = render_report(template, task_id, task_description, current_date, fields)
+
     # Write new report
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+    atomic_write(report_path, content)
+
     print(f"✅ Created task report: {report_path}")
     print(f"📝 Please edit the file to add specific details about task {task_id}")
-    
+
     return True
 
-def update_progress_file(task_id, task_description=""):
-    """Add entry to PROGRESS.md file."""
-    
-    progress_path = "PROGRESS.md"
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    
-    if not os.path.exists(progress_path):
-        print(f"Warning: {progress_path} not found!")
-        return False
-    
-    # Read current progress file
-    with open(progress_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Find insertion point (after "## Completed Tasks")
-    insert_index = -1
-    for i, line in enumerate(lines):
-        if line.strip() == "## Completed Tasks":
-            insert_index = i + 1
-            break
-    
-    if insert_index == -1:
-        print("Warning: Could not find '## Completed Tasks' section in PROGRESS.md")
-        return False
-    
-    # Create new entry
-    new_entry = f"""
+
+def progress_entry(task_id, task_description, current_date):
+    """Return the PROGRESS.md entry for one completed task."""
+    return f"""
 ### Task {task_id} - {task_description} ✅
 - **Completed**: {current_date}
 - **Duration**: [UPDATE DURATION]
 - **Deliverables**: [UPDATE DELIVERABLES]
 - **Report**: [Task {task_id} Report](task-reports/task-{task_id}-report.md)
 """
-    
-    # Insert new entry
-    lines.insert(insert_index, new_entry)
-    
-    # Write updated file
-    with open(progress_path, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
-    
-    print(f"✅ Updated {progress_path} with task {task_id} entry")
+
+
+def add_progress_entries(tasks, progress_path=PROGRESS_PATH):
+    """Add entries for ``(task_id, task_description)`` pairs in one locked rewrite.
+
+    Entries go directly below "## Completed Tasks", newest first, exactly
+    as if the tasks had been added one at a time in the given order. Tasks
+    that already have an entry are left alone; the check happens under the
+    lock, so concurrent runs cannot both add one. Returns the IDs of the
+    tasks that got an entry, or None if PROGRESS.md could not be updated.
+    """
+    if not os.path.exists(progress_path):
+        print(f"Warning: {progress_path} not found!")
+        return None
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+
+    with file_lock(progress_path):
+        # Read current progress file
+        with open(progress_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Find insertion point (the line after "## Completed Tasks")
+        heading = COMPLETED_HEADING_RE.search(content)
+        if heading is None:
+            print(f"Warning: Could not find '{COMPLETED_HEADING}' section in {progress_path}")
+            return None
+        insert_index = heading.end()
+
+        listed = set(TASK_ENTRY_RE.findall(content))
+        added = []
+        for task_id, task_description in tasks:
+            if task_id not in listed:
+                listed.add(task_id)
+                added.append((task_id, task_description))
+        if not added:
+            return []
+
+        entries = ''.join(progress_entry(task_id, task_description, current_date)
+                          for task_id, task_description in reversed(added))
+        atomic_write(progress_path, content[:insert_index] + entries + content[insert_index:])
+
+    return [task_id for task_id, _ in added]
+
+
+def update_progress_file(task_id, task_description=""):
+    """Add entry to PROGRESS.md file, unless the task already has one."""
+
+    added = add_progress_entries([(task_id, task_description)])
+    if added is None:
+        return False
+
+    if not added:
+        print(f"ℹ️  Kept the existing {PROGRESS_PATH} entry for task {task_id}")
+        return True
+
+    print(f"✅ Updated {PROGRESS_PATH} with task {task_id} entry")
     print(f"📝 Please edit PROGRESS.md to add specific details")
-    
+
     return True
 
+
+def _pick(record, fields):
+    for field in fields:
+        value = record.get(field)
+        if value not in (None, ''):
+            return str(value).strip()
+    return ''
+
+
+def _task_from_record(record):
+    """Split a record into ``(task_id, task_description, extra fields)``."""
+    extra = {key: value for key, value in record.items()
+             if key not in ID_FIELDS and key not in DESCRIPTION_FIELDS}
+    return _pick(record, ID_FIELDS), _pick(record, DESCRIPTION_FIELDS), extra
+
+
+def load_tasks(path):
+    """Read ``(task_id, task_description, fields)`` tuples from a CSV or JSONL file.
+
+    JSONL records and CSV rows with a header use ``task_id``, ``id`` or
+    ``request_id`` for the ID and ``task_description``, ``description`` or
+    ``title`` for the description; their other keys or columns become extra
+    template fields. A CSV file without a recognised header is read as
+    ``task-id,description`` rows. Raises ValueError for an invalid task ID.
+    """
+    tasks = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith(('.jsonl', '.json')):
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON: {e}")
+                task = _task_from_record(record) if isinstance(record, dict) else None
+                if not task or not task[0]:
+                    raise ValueError(f"{path}:{line_number}: no task ID field")
+                try:
+                    check_task_id(task[0])
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: {e}")
+                tasks.append(task)
+        else:
+            rows = list(csv.reader(f))
+            header = [name.strip().lower() for name in rows[0]] if rows else []
+            if any(field in header for field in ID_FIELDS):
+                for row in rows[1:]:
+                    task = _task_from_record(dict(zip(header, row)))
+                    if task[0]:
+                        tasks.append(task)
+            else:
+                for row in rows:
+                    if row and row[0].strip():
+                        tasks.append((row[0].strip(), row[1].strip() if len(row) > 1 else '', {}))
+            for task in tasks:
+                try:
+                    check_task_id(task[0])
+                except ValueError as e:
+                    raise ValueError(f"{path}: {e}")
+    return tasks
+
+
+def create_task_reports(tasks, if_exists='skip'):
+    """Create reports for many tasks and add their PROGRESS.md entries at once.
+
+    ``tasks`` holds ``(task_id, task_description)`` pairs or
+    ``(task_id, task_description, fields)`` tuples. Existing reports are
+    skipped, rewritten ('overwrite', without a second progress entry) or
+    stop the whole batch before anything is written ('fail'). Returns the
+    IDs of the reports written.
+    """
+    if not os.path.exists(TEMPLATE_PATH):
+        print(f"Error: Template file {TEMPLATE_PATH} not found!")
+        return []
+    try:
+        template = load_template(TEMPLATE_PATH)
+    except TemplateError as e:
+        print(f"Error: {TEMPLATE_PATH}: {e}")
+        return []
+    current_date = datetime.now().strftime("%Y-%m-%d")
+
+    if if_exists == 'fail':
+        existing = [task[0] for task in tasks if os.path.exists(report_path_for(task[0]))]
+        if existing:
+            print(f"Error: {len(existing)} reports already exist (e.g. task {existing[0]}), "
+                  f"nothing written")
+            return []
+
+    written = []
+    entries = []
+    seen = set()
+    for task_id, task_description, *extra in tasks:
+        report_path = report_path_for(task_id)
+        if task_id in seen or (if_exists != 'overwrite' and os.path.exists(report_path)):
+            print(f"⏭️  Skipped task {task_id}: {report_path} already exists")
+            continue
+        seen.add(task_id)
+        atomic_write(report_path, render_report(template, task_id, task_description,
+                                                current_date, extra[0] if extra else None))
+        written.append(task_id)
+        entries.append((task_id, task_description))
+
+    added = add_progress_entries(entries) if entries else []
+    if added is None:
+        print(f"❌ Wrote {len(written)} reports but could not update {PROGRESS_PATH}")
+        return written
+
+    print(f"✅ Wrote {len(written)} task reports and added {len(added)} "
+          f"{PROGRESS_PATH} entries ({len(tasks) - len(written)} skipped)")
+    return written
+
+
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(
+        description='Create task completion reports and PROGRESS.md entries',
+        epilog="Example: python create-task-report.py 3.3 'Create comprehensive glossary'"
+    )
+    parser.add_argument('task_id', nargs='?', help='Task ID, e.g. 3.3')
+    parser.add_argument('task_description', nargs='?', default='', help='Task description')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='Create reports for every task in a CSV or JSONL file')
+    parser.add_argument('--if-exists', choices=IF_EXISTS_POLICIES,
+                        help='What to do when a report already exists (default: ask on a '
+                             'terminal, otherwise skip; batch mode never asks)')
+    args = parser.parse_args()
+
+    if args.batch:
+        if args.task_id:
+            parser.error("--batch cannot be combined with a task ID")
+        if args.if_exists == 'ask':
+            parser.error("--if-exists ask is not available in batch mode")
+        try:
+            tasks = load_tasks(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        print(f"Creating task reports for {len(tasks)} tasks from {args.batch}...")
+        create_task_reports(tasks, args.if_exists or 'skip')
+        return
+
+    if not args.task_id:
         print("Usage: python create-task-report.py <task-id> [task-description]")
         print("Example: python create-task-report.py 3.3 'Create comprehensive glossary'")
         sys.exit(1)
-    
-    task_id = sys.argv[1]
-    task_description = sys.argv[2] if len(sys.argv) > 2 else ""
-    
+
+    task_id = args.task_id
+    task_description = args.task_description
+    try:
+        check_task_id(task_id)
+    except ValueError as e:
+        parser.error(str(e))
+
     print(f"Creating task report for Task {task_id}...")
-    
+
     # Create report
-    if create_task_report(task_id, task_description):
-        # Update progress file
+    if create_task_report(task_id, task_description, args.if_exists):
+        # Update progress file; an overwritten report keeps its existing entry
         update_progress_file(task_id, task_description)
-        
+
         print(f"\n🎉 Task {task_id} report setup complete!")
         print(f"Next steps:")
         print(f"1. Edit task-reports/task-{task_id}-report.md with specific details")
@@ -125,4 +426,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
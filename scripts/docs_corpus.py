@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Documentation Corpus
+
+Parses every markdown file of the documentation once into a structured
+record (headings and anchors, links, code blocks and Movian source
+references) and keeps the records in an on-disk cache, so the linker and
+the validators all query the same parsed store instead of re-reading and
+re-parsing the files themselves.
+
+Cache entries are keyed by file modification time and size, and confirmed
+with a SHA-256 of the content when those change. The cache is a plain JSON
+file so tools in other languages can read it too.
+
+Usage:
+    python scripts/docs_corpus.py [--docs-root docs] [--no-cache]
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import html
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from markdown_lexer import iter_spans
+
+CORPUS_VERSION = 5
+
+SKIP_DIRS = {'.git', '.kiro', 'node_modules', '__pycache__'}
+
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$', re.MULTILINE)
+HEADING_ID_RE = re.compile(r'\s*\{[^{}]*#([\w-]+)[^{}]*\}\s*$')
+REFERENCE_DEFINITION_RE = re.compile(r'\s*\[([^\]]+)\]:\s*<?([^\s>]+)>?')
+SOURCE_REFERENCE_RE = re.compile(
+    r'((?:src/[^:\s`\'")\]]+\.[ch])|(?:res/ecmascript/[^:\s`\'")\]]+\.js)|'
+    r'(?:glwskins/[^:\s`\'")\]]+\.view))(?::(\d+)(?:-(\d+))?)?'
+)
+# Code span naming the symbol a source reference points at, e.g. (`glwf_iir`)
+REFERENCE_SYMBOL_RE = re.compile(r'`([A-Za-z_$][\w$.]*?)(?:\(\))?`')
+FENCE_OPEN_RE = re.compile(r'[ \t]*(`{3,}|~{3,})[ \t]*([^\s`{]*)')
+ATTR_LIST_RE = re.compile(r'\s*\{:?[^{}]*\}\s*$')
+ANCHOR_COUNT_RE = re.compile(r'^(.*)_([0-9]+)$')
+
+# Code spans render their content literally; it is set aside (replaced by a
+# placeholder) before the other inline markup is removed
+HEADING_CODE_SPAN_RE = re.compile(r'(`+)(.+?)\1')
+CODE_SPAN_PLACEHOLDER_RE = re.compile('\x02([0-9]+)\x03')
+
+# Inline markup removed to get the rendered heading text, in order
+HEADING_INLINE_RES = [
+    (re.compile(r'!\[[^\]]*\](?:\([^)]*\)|\[[^\]]*\])'), ''),          # images
+    (re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])'), r'\1'),      # links
+    (re.compile(r'<[^>]+>'), ''),                                        # raw HTML tags
+    (re.compile(r'\\([\\`*_{}\[\]()#+\-.!])'), r'\1'),                   # backslash escapes
+    # Paired emphasis markers; underscores only at word boundaries, as
+    # intraword underscores (GLW_IMAGE_*) are literal
+    (re.compile(r'(\*{1,3})(?!\s)(.+?)(?<!\s)\1'), r'\2'),
+    (re.compile(r'(?<!\w)(_{1,3})(?!\s)(.+?)(?<!\s)\1(?!\w)'), r'\2'),
+]
+
+# Span types whose content is never rendered as headings
+OPAQUE_BLOCKS = {'code_block', 'html', 'front_matter'}
+
+
+def slugify(text: str) -> str:
+    """Create a URL anchor from heading text (Python-Markdown ``toc`` default rule)."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    return re.sub(r'[-\s]+', '-', text)
+
+
+def heading_text(markdown: str) -> str:
+    """Return the text a heading renders to, without inline markup."""
+    code_spans = []
+
+    def set_aside(match) -> str:
+        code_spans.append(match.group(2).strip())
+        return f'\x02{len(code_spans) - 1}\x03'
+
+    markdown = HEADING_CODE_SPAN_RE.sub(set_aside, markdown)
+    for pattern, replacement in HEADING_INLINE_RES:
+        markdown = pattern.sub(replacement, markdown)
+    markdown = html.unescape(markdown)
+    return CODE_SPAN_PLACEHOLDER_RE.sub(lambda match: code_spans[int(match.group(1))],
+                                        markdown).strip()
+
+
+def unique_anchor(anchor: str, used: Set[str]) -> str:
+    """Make anchor unique the way ``toc`` does, appending ``_1``, ``_2``... as needed."""
+    while anchor in used or not anchor:
+        match = ANCHOR_COUNT_RE.match(anchor)
+        if match:
+            anchor = f"{match.group(1)}_{int(match.group(2)) + 1}"
+        else:
+            anchor = f"{anchor}_1"
+    used.add(anchor)
+    return anchor
+
+
+def extract_headings(content: str, spans: Optional[List[Tuple[str, int, int]]] = None
+                     ) -> List[List]:
+    """Return ``[level, text, anchor, line]`` for every heading of a document.
+
+    Anchors are the ids MkDocs assigns: explicit ``{#id}`` attributes are
+    kept and reserved first, every other heading gets the ``toc`` slug of
+    its rendered text, with a numeric suffix when that slug is taken.
+    """
+    if spans is None:
+        spans = list(iter_spans(content))
+    opaque = [(start, end) for span_type, start, end in spans if span_type in OPAQUE_BLOCKS]
+    opaque_starts = [start for start, _ in opaque]
+
+    headings = []
+    line = 1
+    position = 0
+    for match in HEADING_RE.finditer(content):
+        index = bisect.bisect_right(opaque_starts, match.start()) - 1
+        if index >= 0 and match.start() < opaque[index][1]:
+            continue
+
+        line += content.count('\n', position, match.start())
+        position = match.start()
+
+        text = match.group(2)
+        explicit_id = HEADING_ID_RE.search(text)
+        attributes = explicit_id or ATTR_LIST_RE.search(text)
+        if attributes:
+            text = text[:attributes.start()]
+        headings.append([len(match.group(1)), text,
+                         explicit_id.group(1) if explicit_id else None, line])
+
+    used = {anchor for _, _, anchor, _ in headings if anchor is not None}
+    for heading in headings:
+        if heading[2] is None:
+            heading[2] = unique_anchor(slugify(heading_text(heading[1])), used)
+    return headings
+
+
+def iter_markdown_files(docs_root: Path) -> Iterator[Path]:
+    """Yield every markdown file under docs_root in sorted order."""
+    for file_path in sorted(docs_root.rglob('*.md')):
+        if not any(part in SKIP_DIRS for part in file_path.relative_to(docs_root).parts):
+            yield file_path
+
+
+class Document:
+    """Parsed view of a single markdown file.
+
+    - headings: ``[level, text, anchor, line]``
+    - links: ``[kind, target, text, line]`` with kind link, image or autolink
+    - code_blocks: ``[language, line, code]`` (language is '' if not given)
+    - source_refs: ``[file, start_line, end_line, line, symbol]`` (line numbers and
+      symbol may be None; symbol is the code span next to the reference)
+    """
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'sha256',
+                 'headings', 'links', 'code_blocks', 'source_refs')
+
+    def __init__(self, path: str, mtime_ns: int = 0, size: int = 0, sha256: str = ''):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha256 = sha256
+        self.headings = []
+        self.links = []
+        self.code_blocks = []
+        self.source_refs = []
+
+    @property
+    def anchors(self) -> Dict[str, int]:
+        """Map each heading anchor to its line number."""
+        return {anchor: line for _, _, anchor, line in self.headings}
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Document':
+        document = cls(data['path'])
+        for name in cls.__slots__:
+            setattr(document, name, data[name])
+        return document
+
+
+def parse_document(path: str, content: str) -> Document:
+    """Parse markdown content into a Document."""
+    document = Document(path, size=len(content.encode('utf-8')),
+                        sha256=hashlib.sha256(content.encode('utf-8')).hexdigest())
+
+    line_starts = [0]
+    line_starts.extend(match.end() for match in re.finditer('\n', content))
+
+    def line_of(offset: int) -> int:
+        return bisect.bisect_right(line_starts, offset)
+
+    spans = list(iter_spans(content))
+
+    # Reference definitions are needed to resolve reference-style links
+    references = {}
+    for span_type, start, end in spans:
+        if span_type == 'reference_definition':
+            definition = REFERENCE_DEFINITION_RE.match(content, start, end)
+            if definition:
+                references[definition.group(1).lower()] = definition.group(2)
+
+    document.headings = extract_headings(content, spans)
+
+    for span_type, start, end in spans:
+        if span_type in ('link', 'image'):
+            link = _parse_link_span(content[start:end], references)
+            if link:
+                document.links.append([span_type, link[0], link[1], line_of(start)])
+        elif span_type == 'autolink':
+            target = content[start:end].strip('<>')
+            document.links.append(['autolink', target, target, line_of(start)])
+        elif span_type == 'code_block':
+            language, code = _parse_code_block(content[start:end])
+            document.code_blocks.append([language, line_of(start), code])
+
+    for match in SOURCE_REFERENCE_RE.finditer(content):
+        start_line = int(match.group(2)) if match.group(2) else None
+        end_line = int(match.group(3)) if match.group(3) else None
+        line = line_of(match.start())
+        document.source_refs.append([match.group(1), start_line, end_line, line,
+                                     _reference_symbol(content, line_starts, line, match)])
+
+    return document
+
+
+def _reference_symbol(content: str, line_starts: List[int], line: int,
+                      match: re.Match) -> Optional[str]:
+    """Return the symbol named by the code span closest to a source reference.
+
+    ``es_service_create()`` in "`es_service_create()` in `src/es_service.c:89`"
+    and ``glwf_iir`` in "`src/glw_view_eval.c:4161` (`glwf_iir`)"; dotted
+    names keep their last part.
+    """
+    line_start = line_starts[line - 1]
+    line_end = line_starts[line] if line < len(line_starts) else len(content)
+
+    best = None
+    for candidate in REFERENCE_SYMBOL_RE.finditer(content, line_start, line_end):
+        name = candidate.group(1)
+        if SOURCE_REFERENCE_RE.fullmatch(name) or name.endswith(('.c', '.h', '.js', '.view')):
+            continue
+        distance = min(abs(candidate.start() - match.end()), abs(match.start() - candidate.end()))
+        if best is None or distance < best[0]:
+            best = (distance, name.rsplit('.', 1)[-1])
+    return best[1] if best else None
+
+
+def _parse_link_span(span: str, references: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    """Return ``(target, text)`` for a link or image span."""
+    offset = 1 if span.startswith('!') else 0
+    depth = 0
+    for index in range(offset, len(span)):
+        char = span[index]
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+            if depth == 0:
+                break
+    else:
+        return None
+
+    text = span[offset + 1:index]
+    rest = span[index + 1:]
+
+    if rest.startswith('('):
+        destination = rest[1:-1].strip()
+        if destination.startswith('<'):
+            target = destination[1:destination.find('>')] if '>' in destination else destination
+        else:
+            target = destination.split()[0] if destination else ''
+        return target, text
+
+    if rest.startswith('['):
+        label = rest[1:-1] or text
+        target = references.get(label.lower())
+        return (target, text) if target is not None else None
+
+    if not rest:
+        # Shortcut reference: [text] with a [text]: url definition
+        target = references.get(text.lower())
+        return (target, text) if target is not None else None
+
+    return None
+
+
+def _parse_code_block(block: str) -> Tuple[str, str]:
+    """Return ``(language, code)`` for a fenced or indented code block."""
+    lines = block.splitlines()
+    fence = FENCE_OPEN_RE.match(lines[0]) if lines else None
+
+    if fence:
+        marker = fence.group(1)
+        language = fence.group(2).lstrip('.')
+        indent = len(lines[0]) - len(lines[0].lstrip())
+        body = lines[1:]
+        if body and body[-1].strip().startswith(marker):
+            body = body[:-1]
+        code = '\n'.join(line[indent:] if not line[:indent].strip() else line.lstrip()
+                         for line in body)
+        return language, code
+
+    indent = min((len(line) - len(line.lstrip()) for line in lines if line.strip()), default=0)
+    return '', '\n'.join(line[indent:] for line in lines)
+
+
+class DocsCorpus:
+    """Parsed documentation tree with an on-disk cache.
+
+    Documents are parsed lazily the first time they are requested and at
+    most once per run.
+    """
+
+    def __init__(self, docs_root: Path, cache_path: Optional[Path] = None):
+        self.docs_root = docs_root
+        self.cache_path = cache_path
+        self._cached = {}     # relative path -> cache entry loaded from disk
+        self._documents = {}  # relative path -> Document parsed or validated this run
+        self._contents = {}   # relative path -> content read this run
+        self.files_read = 0
+        self.files_parsed = 0
+
+        if cache_path is not None:
+            self._load_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == CORPUS_VERSION:
+            self._cached = data.get('documents', {})
+
+    def save(self):
+        """Write parsed documents back to the cache (atomically)."""
+        if self.cache_path is None:
+            return
+
+        documents = dict(self._cached)
+        documents.update(
+            (key, document.to_dict()) for key, document in self._documents.items()
+        )
+        data = {'version': CORPUS_VERSION, 'documents': dict(sorted(documents.items()))}
+
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.cache_path)
+
+    def key(self, file_path: Path) -> str:
+        """Return the corpus key (docs-root relative POSIX path) of a file."""
+        return Path(os.path.relpath(file_path, self.docs_root)).as_posix()
+
+    def path(self, key: str) -> Path:
+        """Return the file path of a corpus key."""
+        return self.docs_root / key
+
+    def files(self) -> List[Path]:
+        """Return every markdown file in the corpus."""
+        return list(iter_markdown_files(self.docs_root))
+
+    def read(self, file_path: Path) -> str:
+        """Return file content, reading each file at most once per run."""
+        key = self.key(file_path)
+        content = self._contents.get(key)
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self._contents[key] = content
+            self.files_read += 1
+        return content
+
+    def invalidate(self, file_path: Path):
+        """Forget everything known about a file (e.g. after rewriting it)."""
+        key = self.key(file_path)
+        self._contents.pop(key, None)
+        self._documents.pop(key, None)
+        self._cached.pop(key, None)
+
+    def get(self, file_path: Path) -> Document:
+        """Return the parsed Document for a file, using the cache when valid."""
+        key = self.key(file_path)
+        document = self._documents.get(key)
+        if document is not None:
+            return document
+
+        stat = file_path.stat()
+        entry = self._cached.get(key)
+
+        if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns \
+                and entry['size'] == stat.st_size:
+            document = Document.from_dict(entry)
+        else:
+            content = self.read(file_path)
+            sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            if entry is not None and entry['sha256'] == sha256:
+                document = Document.from_dict(entry)
+            else:
+                document = parse_document(key, content)
+                self.files_parsed += 1
+            document.mtime_ns = stat.st_mtime_ns
+            document.size = stat.st_size
+
+        self._documents[key] = document
+        return document
+
+    def documents(self) -> Iterator[Document]:
+        """Yield the Document of every markdown file."""
+        for file_path in self.files():
+            yield self.get(file_path)
+
+    # Queries
+
+    def anchors(self, file_path: Path) -> Dict[str, int]:
+        """Return ``{anchor: line}`` for a file."""
+        return self.get(file_path).anchors
+
+    def links(self) -> Iterator[Tuple[str, List]]:
+        """Yield ``(document_path, [kind, target, text, line])`` for every link."""
+        for document in self.documents():
+            for link in document.links:
+                yield document.path, link
+
+    def code_blocks(self, language: Optional[str] = None) -> Iterator[Tuple[str, List]]:
+        """Yield ``(document_path, [language, line, code])``, optionally for one language."""
+        for document in self.documents():
+            for block in document.code_blocks:
+                if language is None or block[0] == language:
+                    yield document.path, block
+
+    def source_references(self) -> Iterator[Tuple[str, List]]:
+        """Yield ``(document_path, [file, start_line, end_line, line, symbol])``."""
+        for document in self.documents():
+            for reference in document.source_refs:
+                yield document.path, reference
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse the documentation into the corpus cache')
+    parser.add_argument('--docs-root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs',
+                        help='Root directory of documentation')
+    parser.add_argument('--cache', type=Path,
+                        default=Path(__file__).parent.parent / '.docs-corpus-cache.json',
+                        help='Corpus cache file')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every file without reading or writing the cache')
+    args = parser.parse_args()
+
+    if not args.docs_root.exists():
+        print(f"Error: Documentation root not found: {args.docs_root}")
+        return 1
+
+    corpus = DocsCorpus(args.docs_root, None if args.no_cache else args.cache)
+    totals = {'documents': 0, 'headings': 0, 'links': 0, 'code_blocks': 0, 'source_refs': 0}
+
+    for document in corpus.documents():
+        totals['documents'] += 1
+        totals['headings'] += len(document.headings)
+        totals['links'] += len(document.links)
+        totals['code_blocks'] += len(document.code_blocks)
+        totals['source_refs'] += len(document.source_refs)
+
+    corpus.save()
+
+    print(f"Documents:         {totals['documents']} "
+          f"({corpus.files_parsed} parsed, {corpus.files_read} read)")
+    print(f"Headings:          {totals['headings']}")
+    print(f"Links:             {totals['links']}")
+    print(f"Code blocks:       {totals['code_blocks']}")
+    print(f"Source references: {totals['source_refs']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
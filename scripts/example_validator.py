@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Code Example Validator
+
+Checks the fenced code blocks of the documentation, the Python counterpart
+of tools/test-examples.js:
+
+- javascript: must compile (``node``, CommonJS wrapper as with ``node --check``)
+- json: must parse
+- c: must have no syntax errors under ``gcc -fsyntax-only``; errors about
+  names the snippet does not declare (types, functions and headers from the
+  Movian source) are ignored; a failing snippet is tried again with its
+  unknown type names declared, and inside a function body
+- xml: must be well-formed (fragments may have several root elements)
+- view: must parse with scripts/glw_view.py
+- shell: no dangerous commands and no empty commands in ``&&``/``||`` chains
+
+Blocks are read from the shared documentation corpus (one pass per file) and
+deduplicated by content hash, so a snippet copied across pages is checked
+once. Unique blocks are checked in batches across a process pool: one
+``node`` process and one ``gcc`` run per batch instead of one per block.
+Results are cached on disk keyed by the content hash, the checker version
+and the compiler version, so unchanged examples are not checked again.
+
+Usage:
+    python scripts/example_validator.py [--docs-root docs] [--jobs 4] [--json report.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from docs_corpus import DocsCorpus
+from glw_view import parse_view
+
+CACHE_VERSION = 1
+
+# Fence language -> checker
+LANGUAGES = {
+    'javascript': 'javascript', 'js': 'javascript',
+    'json': 'json',
+    'c': 'c', 'h': 'c',
+    'xml': 'xml',
+    'view': 'view',
+    'bash': 'shell', 'shell': 'shell', 'sh': 'shell',
+}
+# Checker version; bump when a checker's rules change to invalidate cached results
+CHECKERS = {'javascript': 1, 'json': 1, 'c': 1, 'xml': 1, 'view': 1, 'shell': 1}
+# Blocks per batch; one compiler process per batch for javascript and c
+BATCH_SIZES = {'javascript': 100, 'c': 100}
+DEFAULT_BATCH_SIZE = 200
+
+DANGEROUS_COMMANDS = ('rm -rf /', 'format', 'del /f /s /q')
+
+# Compiles each block separately; prints a JSON array with an error (or null) per block
+NODE_CHECKER = r'''
+const vm = require('vm');
+const blocks = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const results = blocks.map(code => {
+  try {
+    new vm.Script('(function (exports, require, module, __filename, __dirname) {' +
+                  code + '\n})', { filename: 'example.js' });
+    return null;
+  } catch (error) {
+    const line = /example\.js:(\d+)/.exec(error.stack || '');
+    return (line ? line[1] + ': ' : '') + error.message;
+  }
+});
+process.stdout.write(JSON.stringify(results));
+'''
+
+# Headers most snippets assume; sys/queue.h provides the LIST_*/TAILQ_* macros
+C_PRELUDE = '''#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/queue.h>
+'''
+C_INCLUDE_RE = re.compile(r'^[ \t]*#[ \t]*include[ \t]*["<][^">\n]*[">]', re.MULTILINE)
+C_ELISION_RE = re.compile(r'^[ \t]*\.\.\.[ \t]*;?[ \t]*$', re.MULTILINE)
+C_DIAGNOSTIC_RE = re.compile(r'^(?:.*/)?(b\d+)\.c:(\d+):(?:\d+:)? (error|fatal error): (.*)$',
+                             re.MULTILINE)
+C_UNKNOWN_TYPE_RE = re.compile(r"unknown type name '(\w+)'")
+# Pointer casts, e.g. (event_openurl_t *)e: the name must be a type
+C_CAST_TYPE_RE = re.compile(r'\(\s*(?:const\s+)?([A-Za-z_]\w*)\s*\*+\s*\)')
+C_BUILTIN_TYPES = {'void', 'char', 'short', 'int', 'long', 'float', 'double', 'signed',
+                   'unsigned', 'const', 'struct', 'union', 'enum', 'size_t', 'FILE'}
+# Errors about what a snippet refers to rather than how it is written
+C_CONTEXT_ERROR_RE = re.compile(
+    r"undeclared|unknown type name|redefinition|conflicting types|redeclared|previous|"
+    r"has no member|request for member|not in record|initializer element|incomplete type|"
+    r"storage size|implicit declaration|invalid use|too (?:few|many) arguments|incompatible|"
+    r"lvalue|subscripted value|called object|invalid operands|void value|'return' with|"
+    r"return type|dereferencing|case label|statement not within|label '|duplicate|"
+    r"variably modified|"
+    r"size of array|array size|declared|static assertion|No such file")
+Result = List  # [status, message]; status is passed, failed or skipped
+
+
+# Checkers: each takes a list of blocks and returns one Result per block
+
+def check_json(blocks: List[str], tools: Dict) -> List[Result]:
+    results = []
+    for code in blocks:
+        try:
+            json.loads(code)
+        except ValueError as error:
+            results.append(['failed', f"Invalid JSON: {error}"])
+        else:
+            results.append(['passed', None])
+    return results
+
+
+def check_xml(blocks: List[str], tools: Dict) -> List[Result]:
+    results = []
+    for code in blocks:
+        # A fragment may have several top-level elements
+        text = code if code.lstrip().startswith('<?xml') else f"<fragment>{code}</fragment>"
+        try:
+            ET.fromstring(text)
+        except ET.ParseError as error:
+            results.append(['failed', f"Invalid XML: {error}"])
+        else:
+            results.append(['passed', None])
+    return results
+
+
+def check_view(blocks: List[str], tools: Dict) -> List[Result]:
+    results = []
+    for code in blocks:
+        view = parse_view(code)
+        results.append(['passed', None] if view.ok else ['failed', f"{view.error}"])
+    return results
+
+
+def check_shell(blocks: List[str], tools: Dict) -> List[Result]:
+    results = []
+    for code in blocks:
+        problem = None
+        for line in code.split('\n'):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            dangerous = next((command for command in DANGEROUS_COMMANDS
+                              if re.search(rf'(?<![\w-]){re.escape(command)}(?![\w-])', line)),
+                             None)
+            if dangerous:
+                problem = f"Dangerous command: {dangerous}"
+            elif re.search(r'(?:&&|\|\|)\s*(?:&&|\|\||$)|^(?:&&|\|\|)', line) and \
+                    not line.endswith('\\'):
+                problem = 'Empty command in chain'
+            if problem:
+                break
+        results.append(['failed', problem] if problem else ['passed', None])
+    return results
+
+
+def check_javascript(blocks: List[str], tools: Dict) -> List[Result]:
+    if not tools.get('node'):
+        return [['skipped', 'node not available']] * len(blocks)
+    process = subprocess.run(['node', '-e', NODE_CHECKER], input=json.dumps(blocks).encode(),
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        message = process.stderr.decode(errors='replace').strip().split('\n')[-1]
+        return [['skipped', f"node failed: {message}"]] * len(blocks)
+    return [['passed', None] if error is None else ['failed', error]
+            for error in json.loads(process.stdout)]
+
+
+def check_c(blocks: List[str], tools: Dict) -> List[Result]:
+    if not tools.get('gcc'):
+        return [['skipped', 'gcc not available']] * len(blocks)
+
+    # Include lines are dropped (their headers are not available), keeping line numbers
+    sources = [C_ELISION_RE.sub('', C_INCLUDE_RE.sub('', code)) for code in blocks]
+    prelude = tools.get('c_prelude')
+    errors = _gcc_syntax_errors([(source, set(), False) for source in sources], prelude)
+
+    # Retry failing blocks with their unknown types declared, both as they are
+    # and as a function body (with ``...`` elisions as expressions); unknown
+    # types count as failing, since gcc skips the code that uses them
+    retry, variants = [], []
+    for index, block_errors in enumerate(errors):
+        if not any(_is_syntax_error(message) or C_UNKNOWN_TYPE_RE.search(message)
+                   for _, message in block_errors):
+            continue
+        types = set(C_CAST_TYPE_RE.findall(sources[index])) - C_BUILTIN_TYPES
+        for _, message in block_errors:
+            types.update(C_UNKNOWN_TYPE_RE.findall(message))
+        retry.append(index)
+        variants.append([(sources[index], types, False),
+                         (sources[index].replace('...', '0'), types, True)])
+
+    flat = [variant for block_variants in variants for variant in block_variants]
+    retried = iter(_gcc_syntax_errors(flat, prelude))
+    for index, block_variants in zip(retry, variants):
+        attempts = [next(retried) for _ in block_variants]
+        best = min(attempts, key=lambda attempt: sum(_is_syntax_error(m) for _, m in attempt))
+        errors[index] = best
+
+    results = []
+    for block_errors in errors:
+        syntax = [(line, message) for line, message in block_errors if _is_syntax_error(message)]
+        if syntax:
+            line, message = syntax[0]
+            results.append(['failed', f"{line}: {message}"])
+        else:
+            results.append(['passed', None])
+    return results
+
+
+def _is_syntax_error(message: str) -> bool:
+    return not C_CONTEXT_ERROR_RE.search(message)
+
+
+def _gcc_syntax_errors(sources: List[Tuple[str, set, bool]],
+                       prelude: Optional[str] = None) -> List[List[Tuple[int, str]]]:
+    """Run one ``gcc -fsyntax-only`` over many snippets; return each one's errors.
+
+    Each snippet is ``(code, type names to declare, wrap in a function)``;
+    error lines are relative to the snippet. ``prelude`` is the path of a
+    header with C_PRELUDE (and its precompiled .gch) to include instead of
+    the text.
+    """
+    errors = [[] for _ in sources]
+    if not sources:
+        return errors
+    with tempfile.TemporaryDirectory(prefix='example-validator-') as directory:
+        names = []
+        for index, (code, types, wrap) in enumerate(sources):
+            declarations = ''.join(f"typedef struct {name} {name};\n" for name in sorted(types))
+            if wrap:
+                code = f"void example_body(void) {{\n#line 1\n{code}\n}}"
+            else:
+                code = f"#line 1\n{code}\n"
+            name = f"b{index}"
+            with open(os.path.join(directory, name + '.c'), 'w', encoding='utf-8') as f:
+                f.write((C_PRELUDE if prelude is None else '') + declarations + code)
+            names.append(name + '.c')
+        include = [] if prelude is None else ['-include', prelude]
+        process = subprocess.run(['gcc', '-fsyntax-only', '-w', '-fmax-errors=20'] + include + names,
+                                 cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                 env=dict(os.environ, LC_ALL='C'))
+    output = process.stderr.decode('utf-8', errors='replace')
+    for name, line, _, message in C_DIAGNOSTIC_RE.findall(output):
+        errors[int(name[1:])].append((int(line), message))
+    return errors
+
+
+CHECK_FUNCTIONS = {
+    'javascript': check_javascript,
+    'json': check_json,
+    'c': check_c,
+    'xml': check_xml,
+    'view': check_view,
+    'shell': check_shell,
+}
+
+
+def check_batch(checker: str, blocks: List[str], tools: Dict) -> List[Result]:
+    """Check a batch of blocks in a worker process."""
+    return CHECK_FUNCTIONS[checker](blocks, tools)
+
+
+def tool_versions() -> Dict[str, Optional[str]]:
+    """Return the first line of ``--version`` for the compilers used."""
+    versions = {}
+    for tool in ('node', 'gcc'):
+        if shutil.which(tool) is None:
+            versions[tool] = None
+            continue
+        process = subprocess.run([tool, '--version'], stdout=subprocess.PIPE,
+                                 stderr=subprocess.DEVNULL)
+        versions[tool] = process.stdout.decode(errors='replace').split('\n')[0].strip() or None
+    return versions
+
+
+class ExampleValidator:
+    """Validates documentation code blocks, deduplicated and cached by content hash."""
+
+    def __init__(self, cache_path: Optional[Path] = None, jobs: Optional[int] = None):
+        self.cache_path = cache_path
+        self.jobs = jobs
+        self.tools = tool_versions()
+        self._cache = self._load_cache()
+        self._used = set()
+        self.issues: List[Dict] = []
+        self.counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+        self.total = 0
+        self.unique = 0
+        self.checked = 0
+        self.cache_hits = 0
+
+    def _load_cache(self) -> Dict[str, Result]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('results', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def save_cache(self):
+        """Write the results of blocks seen this run (atomically)."""
+        if self.cache_path is None:
+            return
+
+        results = {key: result for key, result in self._cache.items() if key in self._used}
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'results': results}, f)
+        os.replace(temp_path, self.cache_path)
+
+    def key(self, checker: str, code: str) -> str:
+        tool = {'javascript': self.tools['node'], 'c': self.tools['gcc']}.get(checker)
+        identity = f"{checker}:{CHECKERS[checker]}:{tool}\0"
+        return hashlib.sha256((identity + code).encode('utf-8')).hexdigest()
+
+    def validate(self, blocks: Iterable[Tuple[str, List]]) -> List[Dict]:
+        """Check ``(document_path, [language, line, code])`` blocks."""
+        sites: Dict[str, List[Tuple[str, int]]] = {}
+        pending: Dict[str, Dict[str, str]] = {}  # checker -> key -> code
+        checkers = {}
+        for document_path, (language, line, code) in blocks:
+            checker = LANGUAGES.get(language.lower())
+            if checker is None or not code.strip():
+                continue
+            self.total += 1
+            key = self.key(checker, code)
+            if key not in sites:
+                sites[key] = []
+                checkers[key] = checker
+                self._used.add(key)
+                if key in self._cache:
+                    self.cache_hits += 1
+                else:
+                    pending.setdefault(checker, {})[key] = code
+            sites[key].append((document_path, line))
+        self.unique = len(sites)
+
+        self._check(pending)
+
+        for key, uses in sites.items():
+            status, message = self._cache[key]
+            self.counts[status] += len(uses)
+            if status != 'failed':
+                continue
+            for document_path, line in uses:
+                self.issues.append({'file': document_path, 'line': _error_line(line, message),
+                                    'block': line, 'language': checkers[key],
+                                    'severity': 'error', 'message': message})
+        self.issues.sort(key=lambda issue: (issue['file'], issue['line']))
+        return self.issues
+
+    def _check(self, pending: Dict[str, Dict[str, str]]):
+        batches = []
+        for checker, codes in pending.items():
+            keys = list(codes)
+            size = BATCH_SIZES.get(checker, DEFAULT_BATCH_SIZE)
+            for start in range(0, len(keys), size):
+                batches.append((checker, keys[start:start + size]))
+        if not batches:
+            return
+
+        self.checked = sum(len(keys) for _, keys in batches)
+        with tempfile.TemporaryDirectory(prefix='example-validator-') as directory:
+            tools = dict(self.tools)
+            if 'c' in pending and tools['gcc']:
+                tools['c_prelude'] = _precompile_prelude(Path(directory))
+            arguments = [(checker, [pending[checker][key] for key in keys], tools)
+                         for checker, keys in batches]
+            if self.jobs == 1 or len(batches) == 1:
+                outcomes = [check_batch(*args) for args in arguments]
+            else:
+                with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                    outcomes = list(executor.map(check_batch, *zip(*arguments)))
+
+        for (checker, keys), results in zip(batches, outcomes):
+            for key, result in zip(keys, results):
+                self._cache[key] = result
+                if result[0] == 'skipped':
+                    # Not saved: the tool may be available next time
+                    self._used.discard(key)
+
+
+def _precompile_prelude(directory: Path) -> Optional[str]:
+    """Write C_PRELUDE as a header with a precompiled .gch next to it, so the
+    standard headers are parsed once per run instead of once per snippet."""
+    header = directory / 'prelude.h'
+    header.write_text(C_PRELUDE, encoding='utf-8')
+    process = subprocess.run(['gcc', '-x', 'c-header', '-w', str(header), '-o', str(header) + '.gch'],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return str(header) if process.returncode == 0 else None
+
+
+def _error_line(fence_line: int, message: str) -> int:
+    """Return the document line of an error reported as ``line: message``."""
+    match = re.match(r'(\d+)[:]', message or '')
+    return fence_line + int(match.group(1)) if match else fence_line
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate code examples in the documentation')
+    parser.add_argument('--docs-root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs',
+                        help='Root directory of documentation')
+    parser.add_argument('--language', action='append', choices=sorted(CHECKERS),
+                        help='Only check blocks of this kind (repeatable)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes (default: CPU count, 1 = no pool)')
+    parser.add_argument('--cache', type=Path,
+                        default=Path(__file__).parent.parent / '.example-validation-cache.json',
+                        help='Validation result cache')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Check every block and do not write the cache')
+    parser.add_argument('--json', type=Path, help='Save issues to a JSON file')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args()
+
+    if not args.docs_root.exists():
+        print(f"Error: Documentation root not found: {args.docs_root}")
+        return 1
+
+    corpus = DocsCorpus(args.docs_root, Path(__file__).parent.parent / '.docs-corpus-cache.json')
+    validator = ExampleValidator(None if args.no_cache else args.cache, jobs=args.jobs)
+    blocks = corpus.code_blocks()
+    if args.language:
+        blocks = ((path, block) for path, block in blocks
+                  if LANGUAGES.get(block[0].lower()) in args.language)
+
+    start = time.perf_counter()
+    issues = validator.validate(blocks)
+    elapsed = time.perf_counter() - start
+    corpus.save()
+    validator.save_cache()
+
+    if not args.quiet:
+        for issue in issues:
+            print(f"{issue['file']}:{issue['line']}: {issue['language']}: {issue['message']}")
+        if issues:
+            print()
+
+    counts = validator.counts
+    print(f"Checked {validator.total} examples ({validator.unique} unique) in {elapsed:.2f}s: "
+          f"{counts['passed']} passed, {counts['failed']} failed, {counts['skipped']} skipped")
+    print(f"Unique examples: {validator.checked} checked, {validator.cache_hits} cached")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'total': validator.total, 'counts': counts, 'issues': issues}, f, indent=2)
+
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
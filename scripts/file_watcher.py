@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Markdown File Watcher
+
+Reports changed markdown files under a docs root in debounced batches.
+
+On Linux the watcher uses inotify directly (through ctypes, no extra
+packages), watching every directory of the tree and picking up new ones as
+they appear. Elsewhere it falls back to polling file modification times.
+
+Editors often produce several events for one save (truncate, write,
+rename). Events are collected until no new event has arrived for the
+debounce interval and then reported together as one set of paths.
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from docs_corpus import SKIP_DIRS, iter_markdown_files
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF)
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, name length
+
+
+class FileWatcher(abc.ABC):
+    """Base class: subclasses implement _wait() returning changed paths."""
+
+    def __init__(self, root: Path, debounce: float = 0.025):
+        self.root = root
+        self.debounce = debounce
+
+    def batches(self) -> Iterator[Set[Path]]:
+        """Yield sets of changed markdown files, one set per burst of events."""
+        while True:
+            changed = set(self._wait(None))
+            if not changed:
+                continue
+
+            # Keep collecting until the tree has been quiet for the debounce interval
+            while True:
+                more = self._wait(self.debounce)
+                if not more:
+                    break
+                changed.update(more)
+
+            yield changed
+
+    @abc.abstractmethod
+    def _wait(self, timeout: Optional[float]) -> List[Path]:
+        """Block until changes arrive (or the timeout expires) and return them."""
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher(FileWatcher):
+    """Watches the docs tree with Linux inotify."""
+
+    def __init__(self, root: Path, debounce: float = 0.025):
+        super().__init__(root, debounce)
+        self._libc = _load_inotify()
+        if self._libc is None:
+            raise OSError("inotify is not available")
+
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._directories: Dict[int, Path] = {}  # watch descriptor -> directory
+        self._watch_tree(root)
+
+    def _watch_tree(self, root: Path) -> List[Path]:
+        """Watch root and its subdirectories, returning markdown files found in them."""
+        found = []
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._directories[wd] = Path(directory)
+            found.extend(Path(directory) / name for name in filenames if name.endswith('.md'))
+        return found
+
+    def _wait(self, timeout: Optional[float]) -> List[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        data = os.read(self._fd, 64 * 1024)
+        changed = []
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length]
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: report every file
+                changed.extend(iter_markdown_files(self.root))
+                continue
+            if mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name.rstrip(b'\0'))
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.name not in SKIP_DIRS:
+                    changed.extend(self._watch_tree(path))
+            elif path.suffix == '.md':
+                changed.append(path)
+
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher(FileWatcher):
+    """Watches the docs tree by comparing file modification times."""
+
+    def __init__(self, root: Path, debounce: float = 0.025, interval: float = 0.25):
+        super().__init__(root, debounce)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in iter_markdown_files(self.root):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _wait(self, timeout: Optional[float]) -> List[Path]:
+        while True:
+            time.sleep(self.interval if timeout is None else max(timeout, self.interval))
+
+            snapshot = self._scan()
+            changed = [path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)]
+            self._snapshot = snapshot
+
+            if changed or timeout is not None:
+                return changed
+
+
+def _load_inotify():
+    if not sys.platform.startswith('linux'):
+        return None
+
+    libc_name = ctypes.util.find_library('c')
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def create_watcher(root: Path, debounce: float = 0.025) -> FileWatcher:
+    """Return an inotify watcher where supported, a polling watcher otherwise."""
+    try:
+        return InotifyWatcher(root, debounce)
+    except OSError:
+        return PollingWatcher(root, debounce)
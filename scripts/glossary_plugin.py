@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Glossary Linking MkDocs Plugin
+
+Adds glossary links to pages while MkDocs builds the site, using the same
+``GlossaryLinker`` as scripts/link-glossary-terms.py but without touching
+the source markdown files.
+
+The glossary is loaded and its term matcher compiled once in ``on_config``,
+and compiled again only when the glossary file changes. Pages are linked in
+``on_page_markdown``; the linked markdown of every page is kept in memory,
+keyed by a hash of the page markdown, so a ``mkdocs serve`` rebuild after
+saving one page only relinks that page.
+
+The module is listed under ``hooks:`` in mkdocs.yml. MkDocs loads a hook
+module once per process and calls its event functions, which here are the
+events of a single ``GlossaryLinkPlugin`` instance.
+"""
+
+import importlib.util
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Tuple
+
+from mkdocs.plugins import BasePlugin
+
+from link_manifest import hash_content, hash_terms
+
+log = logging.getLogger('mkdocs.plugins.glossary')
+
+
+def _load_linker_module():
+    """Import scripts/link-glossary-terms.py (not importable by name)."""
+    spec = importlib.util.spec_from_file_location(
+        'link_glossary_terms', Path(__file__).parent / 'link-glossary-terms.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_linker_module = _load_linker_module()
+GlossaryLinker = _linker_module.GlossaryLinker
+TermMatcher = _linker_module.TermMatcher
+
+
+class GlossaryLinkPlugin(BasePlugin):
+    """Link glossary terms in page markdown at build time."""
+
+    def __init__(self):
+        super().__init__()
+        self.linker = None  # GlossaryLinker for the current docs_dir
+        self.glossary_signature = None  # (mtime_ns, size) the terms were loaded from
+        self.terms_hash = None
+        self.pages = {}  # src_uri -> (markdown hash, linked markdown, links)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.pages_linked = 0
+        self.pages_cached = 0
+        self.links_added = 0
+        self.link_time = 0.0
+
+    def on_config(self, config):
+        """Load the glossary and compile the term matcher if it changed."""
+        self.reset_stats()
+        docs_root = Path(config['docs_dir'])
+        if self.linker is None or self.linker.docs_root != docs_root:
+            self.linker = GlossaryLinker(docs_root)
+            self.glossary_signature = None
+            self.terms_hash = None
+            self.pages = {}
+
+        start = time.perf_counter()
+        try:
+            stat = self.linker.glossary_path.stat()
+        except OSError:
+            log.warning(f"Glossary not found at {self.linker.glossary_path}; "
+                        f"glossary terms will not be linked")
+            self.linker.terms = {}
+            self.linker.matcher = None
+            self.glossary_signature = None
+            return config
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self.glossary_signature:
+            terms = self.linker.load_glossary_terms()
+            terms_hash = hash_terms(terms)
+            if terms_hash != self.terms_hash:
+                self.linker.terms = terms
+                self.linker.matcher = TermMatcher(terms)
+                self.terms_hash = terms_hash
+                # Every cached page was linked against the old terms
+                self.pages = {}
+            self.glossary_signature = signature
+        self.link_time += time.perf_counter() - start
+        return config
+
+    def on_page_markdown(self, markdown: str, page, config, files) -> str:
+        """Return the page markdown with glossary links added."""
+        if self.linker is None or self.linker.matcher is None:
+            return markdown
+        file_path = Path(page.file.abs_src_path)
+        if not self.linker.should_process_file(file_path):
+            return markdown
+
+        start = time.perf_counter()
+        linked, links = self._link_page(page.file.src_uri, markdown, file_path)
+        self.links_added += links
+        self.link_time += time.perf_counter() - start
+        return linked
+
+    def _link_page(self, src_uri: str, markdown: str, file_path: Path) -> Tuple[str, int]:
+        content_hash = hash_content(markdown)
+        cached = self.pages.get(src_uri)
+        if cached is not None and cached[0] == content_hash:
+            self.pages_cached += 1
+            return cached[1], cached[2]
+
+        linked, links = self.linker.link_content(markdown, file_path)
+        self.pages[src_uri] = (content_hash, linked, links)
+        self.pages_linked += 1
+        return linked, links
+
+    def on_post_build(self, config):
+        if self.linker is None or self.linker.matcher is None:
+            return
+        log.info(f"Glossary: {self.links_added} links in "
+                 f"{self.pages_linked + self.pages_cached} pages "
+                 f"({self.pages_linked} linked, {self.pages_cached} cached) "
+                 f"in {self.link_time * 1000:.1f} ms")
+
+
+# MkDocs calls these as the events of the hook module
+plugin = GlossaryLinkPlugin()
+on_config = plugin.on_config
+on_page_markdown = plugin.on_page_markdown
+on_post_build = plugin.on_post_build
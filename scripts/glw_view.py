@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+"""
+GLW View Parser
+
+Lexer and recursive-descent parser for Movian GLW ``.view`` files, as
+described in docs/ui/view-files/syntax-reference.md:
+
+- Lexical elements: ``//`` and ``/* */`` comments, double-quoted and
+  single-quoted (rich text) strings, integers, floats (``3.14f``), hex
+  numbers, ``em`` units, identifiers, ``$property`` references and
+  ``#directives``. A backslash at the end of a line continues it.
+- Statements: widgets (``label { ... }``), attribute assignments with
+  ``=``, ``?=``, ``<-``, ``:=``, ``_=_`` or ``:``, property assignments
+  (``$view.x = 1;``) and macro or function calls (``widget(quad, {...});``,
+  ``onEvent(activate, navOpen($self.url))``), with named arguments.
+- Expressions, with the documented precedence: ternary, ``??``, ``||``,
+  ``&&``, ``^^``, comparisons, ``+ -``, ``* /``, ``%``, unary ``! - + &``,
+  vectors, blocks and calls.
+- Preprocessor directives: ``#include``/``#import "path"`` and ``#define``
+  with parameters, defaults and a block (or expression) body.
+
+Each file is lexed in one linear pass and parsed into a tree of Node
+objects; the first syntax error is reported with its line and column.
+ViewCache memoizes parsed files by content hash, so any number of checks
+on the same file query one tree.
+
+Usage:
+    python scripts/glw_view.py [PATH ...]    (default: every .view under docs/)
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r'''
+    (?P<space>(?:[ \t\r\n\f]|\\\r?\n)+)
+  | (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+  | (?P<unterminated>/\*)
+  | (?P<string>"(?:[^"\\\n]|\\.)*")
+  | (?P<rich_string>'(?:[^'\\\n]|\\.)*')
+  | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?f?)
+  | (?P<directive>\#[A-Za-z_]\w*)
+  | (?P<property>\$[A-Za-z_]\w*)
+  | (?P<op>_=_|\?\?|\?=|<-|:=|==|!=|<=|>=|&&|\|\||\^\^|[=?:<>+\-*/%!&(){}\[\],;.])
+  | (?P<identifier>[A-Za-z_]\w*)
+''', re.VERBOSE)
+
+ASSIGNMENT_OPS = frozenset(('=', '?=', '<-', ':=', '_=_', ':'))
+CONSTANTS = frozenset(('true', 'false', 'void'))
+
+# Binary operators from lowest to highest precedence (all left-associative)
+BINARY_LEVELS = (
+    ('??',),
+    ('||',),
+    ('&&',),
+    ('^^',),
+    ('==', '!=', '<', '>', '<=', '>='),
+    ('+', '-'),
+    ('*', '/'),
+    ('%',),
+)
+BINARY_PRECEDENCE = {op: level for level, ops in enumerate(BINARY_LEVELS) for op in ops}
+UNARY_OPS = frozenset(('!', '-', '+', '&'))
+
+Token = Tuple[str, str, int]  # (kind, text, offset); kind 'eof' ends the stream
+
+
+class ViewSyntaxError(ValueError):
+    """A lexical or syntax error at a line and column (both 1-based)."""
+
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(f"{line}:{column}: {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+
+
+class Node:
+    """A syntax tree node.
+
+    ``kind`` is one of: view, widget, assign, call, include, import, define,
+    param, named, block, vector, ternary, binary, unary, number, em, string,
+    rich_string, constant, identifier, property. ``value`` holds the name,
+    operator, literal or path (a tuple of names for properties), and
+    ``children`` the sub-nodes in source order.
+    """
+
+    __slots__ = ('kind', 'value', 'children', 'line', 'column')
+
+    def __init__(self, kind: str, value=None, children: Optional[List['Node']] = None,
+                 line: int = 0, column: int = 0):
+        self.kind = kind
+        self.value = value
+        self.children = children if children is not None else []
+        self.line = line
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"Node({self.kind!r}, {self.value!r}, {len(self.children)} children, " \
+               f"{self.line}:{self.column})"
+
+    def walk(self) -> Iterator['Node']:
+        """Yield this node and all its descendants, depth first in source order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def find(self, kind: str, value=None) -> Iterator['Node']:
+        """Yield descendants of a kind (and value, if given)."""
+        for node in self.walk():
+            if node.kind == kind and (value is None or node.value == value):
+                yield node
+
+
+class ParsedView:
+    """The tree (or syntax error) of one view file."""
+
+    def __init__(self, name: str, digest: str, tree: Optional[Node],
+                 error: Optional[ViewSyntaxError], comments: Optional[List[str]] = None):
+        self.name = name
+        self.digest = digest
+        self.tree = tree
+        self.error = error
+        self.comments = comments or []
+        self._kinds = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def nodes(self, kind: str) -> List[Node]:
+        """Return every node of a kind, from a per-kind index built on first use."""
+        if self._kinds is None:
+            self._kinds = {}
+            if self.tree is not None:
+                for node in self.tree.walk():
+                    self._kinds.setdefault(node.kind, []).append(node)
+        return self._kinds.get(kind, [])
+
+    def widgets(self, name: Optional[str] = None) -> List[Node]:
+        """Widgets written as ``name { ... }`` or ``widget(name, { ... })``."""
+        found = [node for node in self.nodes('widget') if name is None or node.value == name]
+        for call in self.nodes('call'):
+            if call.value == 'widget' and call.children and \
+                    call.children[0].kind == 'identifier' and \
+                    (name is None or call.children[0].value == name):
+                found.append(call)
+        return found
+
+    def assignments(self, name: Optional[str] = None) -> List[Node]:
+        """Attribute assignments (to ``name``, if given)."""
+        return [node for node in self.nodes('assign')
+                if name is None or (node.children[0].kind == 'identifier' and
+                                    node.children[0].value == name)]
+
+    def properties(self) -> List[Node]:
+        return self.nodes('property')
+
+    def calls(self, name: Optional[str] = None) -> List[Node]:
+        return [node for node in self.nodes('call') if name is None or node.value == name]
+
+    def defines(self) -> List[Node]:
+        return self.nodes('define')
+
+    def includes(self) -> List[Node]:
+        """``#include`` and ``#import`` directives, in source order."""
+        return sorted(self.nodes('include') + self.nodes('import'),
+                      key=lambda node: (node.line, node.column))
+
+
+def tokenize(text: str, comments: Optional[List[Token]] = None) -> List[Token]:
+    """Split view source into tokens, dropping whitespace.
+
+    Comments are dropped too, or collected into ``comments`` if it is given.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    position = 0
+    length = len(text)
+
+    for found in TOKEN_RE.finditer(text):
+        # finditer skips text no alternative matches: that gap is the error
+        if found.start() != position:
+            raise _lex_error(text, position)
+        kind = found.lastgroup
+        if kind == 'unterminated':
+            raise _lex_error(text, position)
+        if kind == 'comment':
+            if comments is not None:
+                comments.append((kind, found.group(), position))
+        elif kind != 'space':
+            append((kind, found.group(), position))
+        position = found.end()
+
+    if position != length:
+        raise _lex_error(text, position)
+    append(('eof', '', length))
+    return tokens
+
+
+def _lex_error(text: str, position: int) -> ViewSyntaxError:
+    line, column = _location(text, position)
+    char = text[position]
+    if text.startswith('/*', position):
+        message = "unterminated comment"
+    elif char in '"\'':
+        message = "unterminated string"
+    elif char == '#':
+        message = "'#' must start a directive such as #include or #define"
+    else:
+        message = f"unexpected character {char!r}"
+    return ViewSyntaxError(message, line, column)
+
+
+def _location(text: str, offset: int, line_starts: Optional[List[int]] = None) -> Tuple[int, int]:
+    if line_starts is None:
+        line = text.count('\n', 0, offset) + 1
+        return line, offset - (text.rfind('\n', 0, offset) + 1) + 1
+    line = bisect_right(line_starts, offset)
+    return line, offset - line_starts[line - 1] + 1
+
+
+class Parser:
+    """Recursive-descent parser over the token list of one file."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.comments: List[Token] = []
+        self.tokens = tokenize(text, self.comments)
+        self.index = 0
+        self.line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+
+    # Token helpers
+
+    def peek(self, ahead: int = 0) -> Token:
+        if ahead:
+            return self.tokens[min(self.index + ahead, len(self.tokens) - 1)]
+        return self.tokens[self.index]
+
+    def at(self, text: str) -> bool:
+        kind, value, _ = self.tokens[self.index]
+        return value == text and kind == 'op'
+
+    def advance(self) -> Token:
+        token = self.tokens[self.index]
+        if token[0] != 'eof':
+            self.index += 1
+        return token
+
+    def expect(self, text: str, context: str) -> Token:
+        if not self.at(text):
+            raise self.error(f"expected '{text}' {context}, found {self.describe(self.peek())}")
+        return self.advance()
+
+    def location(self, token: Token) -> Tuple[int, int]:
+        return _location(self.text, token[2], self.line_starts)
+
+    def node(self, kind: str, token: Token, value=None,
+             children: Optional[List[Node]] = None) -> Node:
+        line, column = self.location(token)
+        return Node(kind, value, children, line, column)
+
+    def error(self, message: str, token: Optional[Token] = None) -> ViewSyntaxError:
+        line, column = self.location(token or self.peek())
+        return ViewSyntaxError(message, line, column)
+
+    @staticmethod
+    def describe(token: Token) -> str:
+        kind, value, _ = token
+        if kind == 'eof':
+            return 'end of file'
+        if kind in ('string', 'rich_string', 'number'):
+            return f"{kind.replace('_', ' ')} {value}"
+        return f"'{value}'"
+
+    # Statements
+
+    def parse(self) -> Node:
+        root = Node('view', None, self.statements(None), 1, 1)
+        if self.peek()[0] != 'eof':
+            raise self.error(f"unexpected '{self.peek()[1]}' with no matching opening brace")
+        return root
+
+    def statements(self, opener: Optional[Token]) -> List[Node]:
+        """Parse statements up to the '}' closing ``opener`` (or end of file)."""
+        statements = []
+        while True:
+            kind, value, _ = self.peek()
+            if kind == 'eof':
+                if opener is not None:
+                    line, column = self.location(opener)
+                    raise self.error(f"'{{' opened at {line}:{column} is never closed")
+                return statements
+            if kind == 'op' and value == '}':
+                if opener is None:
+                    raise self.error("unexpected '}' with no matching opening brace")
+                return statements
+            if kind == 'op' and value == ';':
+                self.advance()
+                continue
+            statements.append(self.statement())
+
+    def statement(self) -> Node:
+        token = self.peek()
+        kind, value, _ = token
+
+        if kind == 'directive':
+            return self.directive()
+
+        if kind == 'identifier':
+            name = self.dotted_name()
+            following = self.peek()
+            if following[0] == 'op' and following[1] == '{' and name == value:
+                return self.node('widget', token, name, self.block().children)
+            if following[0] == 'op' and following[1] == '(':
+                call = self.call(token, name)
+                self.optional_semicolon()
+                return call
+            if following[0] == 'op' and following[1] in ASSIGNMENT_OPS:
+                return self.assignment(self.node('identifier', token, name))
+            if following[0] == 'eof' or (following[0] == 'op' and following[1] in ';}'):
+                # A bare name on its own: a macro parameter or simple macro expansion
+                self.optional_semicolon()
+                return self.node('identifier', token, name)
+            raise self.error(f"expected '=', '{{' or '(' after '{name}', "
+                             f"found {self.describe(following)}", following)
+
+        if kind == 'property':
+            target = self.property()
+            if not (self.peek()[0] == 'op' and self.peek()[1] in ASSIGNMENT_OPS):
+                raise self.error(f"expected an assignment to {value}, "
+                                 f"found {self.describe(self.peek())}")
+            return self.assignment(target)
+
+        raise self.error(f"expected a widget, assignment or macro call, found {self.describe(token)}")
+
+    def assignment(self, target: Node) -> Node:
+        op_token = self.advance()
+        value = self.expression()
+        node = Node('assign', op_token[1], [target, value], target.line, target.column)
+        if self.at(';'):
+            self.advance()
+        elif not (self.at('}') or self.peek()[0] == 'eof'):
+            raise self.error(f"expected ';' after the value of {_target_name(target)}, "
+                             f"found {self.describe(self.peek())}")
+        return node
+
+    def optional_semicolon(self):
+        if self.at(';'):
+            self.advance()
+
+    def block(self) -> Node:
+        opener = self.expect('{', 'to open a block')
+        children = self.statements(opener)
+        self.advance()  # '}'
+        return self.node('block', opener, None, children)
+
+    def directive(self) -> Node:
+        token = self.advance()
+        name = token[1][1:]
+
+        if name in ('include', 'import'):
+            path = self.advance()
+            if path[0] != 'string':
+                raise self.error(f"expected a quoted path after #{name}, "
+                                 f"found {self.describe(path)}", path)
+            return self.node(name, token, _unquote(path[1]))
+
+        if name == 'define':
+            macro = self.advance()
+            if macro[0] != 'identifier':
+                raise self.error(f"expected a macro name after #define, "
+                                 f"found {self.describe(macro)}", macro)
+            params = []
+            if self.at('('):
+                opener = self.advance()
+                while not self.at(')'):
+                    if self.peek()[0] == 'eof':
+                        line, column = self.location(opener)
+                        raise self.error(f"'(' opened at {line}:{column} is never closed")
+                    param = self.advance()
+                    if param[0] != 'identifier':
+                        raise self.error(f"expected a parameter name, found {self.describe(param)}",
+                                         param)
+                    default = []
+                    if self.at('='):
+                        self.advance()
+                        default.append(self.expression())
+                    params.append(self.node('param', param, param[1], default))
+                    if not self.at(')'):
+                        self.expect(',', 'between macro parameters')
+                self.advance()
+            # Parameterized macros have a block body; simple ones may be any expression
+            body = self.block() if self.at('{') else self.expression()
+            self.optional_semicolon()
+            return self.node('define', token, macro[1], params + [body])
+
+        raise self.error(f"unknown preprocessor directive #{name}", token)
+
+    # Expressions
+
+    def expression(self) -> Node:
+        condition = self.binary(0)
+        if self.at('?'):
+            token = self.advance()
+            if_true = self.expression()
+            self.expect(':', 'in the ternary expression')
+            if_false = self.expression()
+            return Node('ternary', '?', [condition, if_true, if_false],
+                        condition.line, condition.column)
+        return condition
+
+    def binary(self, min_level: int) -> Node:
+        """Precedence climbing over BINARY_LEVELS (left-associative)."""
+        left = self.unary()
+        while True:
+            kind, value, _ = self.tokens[self.index]
+            level = BINARY_PRECEDENCE.get(value) if kind == 'op' else None
+            if level is None or level < min_level:
+                return left
+            self.index += 1
+            right = self.binary(level + 1)
+            left = Node('binary', value, [left, right], left.line, left.column)
+
+    def unary(self) -> Node:
+        token = self.peek()
+        if token[0] == 'op' and token[1] in UNARY_OPS:
+            self.advance()
+            return self.node('unary', token, token[1], [self.unary()])
+        return self.primary()
+
+    def primary(self) -> Node:
+        token = self.peek()
+        kind, value, _ = token
+
+        if kind == 'number':
+            self.advance()
+            number = self.node('number', token, _number(value))
+            following = self.peek()
+            if following[0] == 'identifier' and following[1] == 'em':
+                self.advance()
+                return self.node('em', token, number.value)
+            return number
+        if kind in ('string', 'rich_string'):
+            self.advance()
+            return self.node(kind, token, _unquote(value))
+        if kind == 'property':
+            return self.property()
+        if kind == 'identifier':
+            name = self.dotted_name()
+            if self.at('('):
+                return self.call(token, name)
+            return self.node('constant' if name in CONSTANTS else 'identifier', token, name)
+        if kind == 'op':
+            if value == '(':
+                self.advance()
+                inner = self.expression()
+                if not self.at(')'):
+                    line, column = self.location(token)
+                    raise self.error(f"expected ')' to close '(' at {line}:{column}, "
+                                     f"found {self.describe(self.peek())}")
+                self.advance()
+                return inner
+            if value == '[':
+                self.advance()
+                items = self.arguments(token, ']', named=False)
+                return self.node('vector', token, None, items)
+            if value == '{':
+                return self.block()
+        raise self.error(f"expected an expression, found {self.describe(token)}")
+
+    def property(self) -> Node:
+        token = self.advance()
+        path = [token[1][1:]]
+        while self.at('.'):
+            self.advance()
+            part = self.advance()
+            if part[0] not in ('identifier', 'property'):
+                raise self.error(f"expected a property name after '.', "
+                                 f"found {self.describe(part)}", part)
+            path.append(part[1].lstrip('$'))
+        return self.node('property', token, tuple(path))
+
+    def dotted_name(self) -> str:
+        """Consume an identifier and any ``.member`` parts (``ITEM.url``)."""
+        parts = [self.advance()[1]]
+        while self.at('.') and self.peek(1)[0] == 'identifier':
+            self.advance()
+            parts.append(self.advance()[1])
+        return '.'.join(parts)
+
+    def call(self, token: Token, name: str) -> Node:
+        opener = self.advance()  # '('
+        return self.node('call', token, name, self.arguments(opener, ')', named=True))
+
+    def arguments(self, opener: Token, closer: str, named: bool) -> List[Node]:
+        items = []
+        while not self.at(closer):
+            if self.peek()[0] == 'eof':
+                line, column = self.location(opener)
+                raise self.error(f"'{opener[1]}' opened at {line}:{column} is never closed")
+            token = self.peek()
+            following = self.peek(1)
+            if named and token[0] == 'identifier' and following[0] == 'op' and following[1] == '=':
+                self.index += 2
+                items.append(self.node('named', token, token[1], [self.expression()]))
+            else:
+                items.append(self.expression())
+            if not self.at(closer):
+                if not self.at(','):
+                    line, column = self.location(opener)
+                    raise self.error(f"expected ',' or '{closer}' to close '{opener[1]}' at "
+                                     f"{line}:{column}, found {self.describe(self.peek())}")
+                self.advance()
+        self.advance()
+        return items
+
+
+def _target_name(target: Node) -> str:
+    if target.kind == 'property':
+        return '$' + '.'.join(target.value)
+    return f"'{target.value}'"
+
+
+def _unquote(literal: str) -> str:
+    return re.sub(r'\\(.)', lambda match: {'n': '\n', 't': '\t'}.get(match.group(1),
+                                                                     match.group(1)),
+                  literal[1:-1])
+
+
+def _number(text: str):
+    if text[:2] in ('0x', '0X'):
+        return int(text, 16)
+    text = text.rstrip('f')
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+
+def parse_view(text: str, name: str = '<view>') -> ParsedView:
+    """Parse view source; syntax errors are returned on the result, not raised."""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    try:
+        parser = Parser(text)
+        tree = parser.parse()
+    except ViewSyntaxError as error:
+        return ParsedView(name, digest, None, error)
+    return ParsedView(name, digest, tree, None, [comment for _, comment, _ in parser.comments])
+
+
+class ViewCache:
+    """Parsed views memoized by content hash."""
+
+    def __init__(self):
+        self._views: Dict[str, ParsedView] = {}
+        self.parsed = 0
+        self.hits = 0
+
+    def parse_text(self, text: str, name: str = '<view>') -> ParsedView:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        view = self._views.get(digest)
+        if view is not None:
+            self.hits += 1
+            if view.name == name:
+                return view
+            # Same content under another name: share the tree, keep the name
+            return ParsedView(name, digest, view.tree, view.error, view.comments)
+        self.parsed += 1
+        view = parse_view(text, name)
+        self._views[digest] = view
+        return view
+
+    def parse_file(self, path: Path) -> ParsedView:
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.parse_text(f.read(), str(path))
+
+
+def iter_view_files(root: Path) -> Iterator[Path]:
+    """Yield .view files under root in sorted order."""
+    yield from sorted(path for path in root.rglob('*.view') if path.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse GLW view files and report syntax errors')
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help='View files or directories (default: docs/)')
+    parser.add_argument('--quiet', action='store_true', help='Only print errors')
+    args = parser.parse_args()
+
+    paths = args.paths or [Path(__file__).parent.parent / 'docs']
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(iter_view_files(path))
+        elif path.exists():
+            files.append(path)
+        else:
+            print(f"Error: Not found: {path}")
+            return 1
+
+    cache = ViewCache()
+    errors = 0
+    for path in files:
+        view = cache.parse_file(path)
+        if view.error is not None:
+            errors += 1
+            print(f"{path}:{view.error}")
+        elif not args.quiet:
+            print(f"{path}: ok ({len(view.widgets())} widgets, {len(view.defines())} macros)")
+
+    print(f"\n{len(files)} view files, {errors} with syntax errors")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
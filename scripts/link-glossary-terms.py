@@ -6,7 +6,9 @@ This script automatically creates links to glossary terms throughout the documen
 It scans markdown files and creates links to the glossary for defined technical terms.
 
 Usage:
-    python scripts/link-glossary-terms.py [--dry-run] [--verbose]
+    python scripts/link-glossary-terms.py [--dry-run] [--verbose] [--jobs N] [--no-cache]
+                                          [--profile FILE] [--top N] [--no-index]
+                                          [--watch [--debounce SECONDS]]
 
 Features:
 - Identifies technical terms defined in the glossary
@@ -14,20 +16,43 @@ Features:
 - Avoids linking terms that are already linked
 - Preserves existing formatting and links
 - Supports case-insensitive matching with proper capitalization
+- Optionally processes files in parallel worker processes
+- Optionally reports per-stage and per-file timings (--profile, --top)
+- Records where each glossary term is used in a term index (see term_index.py)
+- Optionally keeps running and relinks files as they are saved (--watch)
 """
 
 import os
 import re
 import argparse
+import bisect
+import cProfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from docs_corpus import extract_headings, iter_markdown_files
+from file_watcher import create_watcher
+from link_manifest import LinkManifest, hash_content
+from markdown_lexer import iter_sections
+from stage_profiler import StageProfiler
+from term_index import Occurrence, TermIndex
+from term_matcher import TermMatcher
+from text_edits import apply_edits
+
+GLOSSARY_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)#\s]*glossary\.md#([\w-]+)')
 
 class GlossaryLinker:
     def __init__(self, docs_root: Path):
         self.docs_root = docs_root
         self.glossary_path = docs_root / "reference" / "glossary.md"
         self.terms = {}  # term -> (anchor, display_name)
+        self.matcher = None  # TermMatcher compiled from self.terms
         self.processed_files = set()
+        self.profiler = StageProfiler()  # Disabled unless profiling was requested
+        self.collect_occurrences = False  # Add term occurrences to scans for the term index
         
     def load_glossary_terms(self) -> Dict[str, Tuple[str, str]]:
         """Load technical terms from the glossary file."""
@@ -39,15 +64,13 @@ class GlossaryLinker:
         with open(self.glossary_path, 'r', encoding='utf-8') as f:
             content = f.read()
             
-        # Find all term definitions (### Term Name)
-        term_pattern = r'^### (.+?)$'
-        matches = re.finditer(term_pattern, content, re.MULTILINE)
-        
-        for match in matches:
-            term_name = match.group(1).strip()
-            
-            # Create anchor from term name
-            anchor = self._create_anchor(term_name)
+        # Term definitions are the level 3 headings (### Term Name). Their
+        # anchors come from the same toc-compatible extraction as the anchor
+        # index, so every generated link target is an id of the rendered page.
+        for level, text, anchor, _ in extract_headings(content):
+            if level != 3:
+                continue
+            term_name = text.strip()
             
             # Store both the full term and common variations
             terms[term_name.lower()] = (anchor, term_name)
@@ -60,13 +83,6 @@ class GlossaryLinker:
                     
         return terms
     
-    def _create_anchor(self, term_name: str) -> str:
-        """Create a URL anchor from a term name."""
-        # Convert to lowercase, replace spaces and special chars with hyphens
-        anchor = re.sub(r'[^\w\s-]', '', term_name.lower())
-        anchor = re.sub(r'[-\s]+', '-', anchor)
-        return anchor.strip('-')
-    
     def _get_term_variations(self, term_name: str) -> List[str]:
         """Get common variations of a term name."""
         variations = []
@@ -107,145 +123,248 @@ class GlossaryLinker:
     
     def find_linkable_terms(self, content: str) -> List[Tuple[str, int, int, str, str]]:
         """Find terms in content that should be linked to glossary."""
+        return self._find_terms(content)[0]
+    
+    def _find_terms(self, content: str, glossary_links: bool = False
+                    ) -> Tuple[List[Tuple[str, int, int, str, str]], List[Tuple[str, str, int]]]:
+        """Find linkable terms and, if requested, existing glossary links.
+        
+        Existing links are returned as ``(anchor, link text, offset)``.
+        """
         linkable_terms = []
+        existing_links = []
         
         # Split content into sections to avoid linking inside code blocks and existing links
         sections = self._split_content_sections(content)
+        if self.profiler.enabled:
+            # Splitting is lazy; materialize it so it is timed on its own
+            with self.profiler.stage('split'):
+                sections = list(sections)
         
-        current_pos = 0
-        for section_type, section_content in sections:
-            if section_type == 'text':
-                # Look for terms in regular text sections
-                for term_lower, (anchor, display_name) in self.terms.items():
-                    # Create pattern for whole word matching
-                    pattern = r'\b' + re.escape(term_lower) + r'\b'
-                    
-                    for match in re.finditer(pattern, section_content, re.IGNORECASE):
-                        start_pos = current_pos + match.start()
-                        end_pos = current_pos + match.end()
-                        matched_text = match.group()
-                        
+        if self.matcher is None:
+            self.matcher = TermMatcher(self.terms)
+
+        with self.profiler.stage('match'):
+            current_pos = 0
+            for section_type, section_content in sections:
+                if section_type == 'text':
+                    # Look for all terms in regular text sections in a single scan
+                    for start, end, term_lower in self.matcher.finditer(section_content):
+                        anchor, display_name = self.terms[term_lower]
+                        matched_text = section_content[start:end]
+
                         linkable_terms.append((
-                            matched_text, start_pos, end_pos, anchor, display_name
+                            matched_text, current_pos + start, current_pos + end,
+                            anchor, display_name
                         ))
+                elif glossary_links and section_type == 'link':
+                    match = GLOSSARY_LINK_RE.match(section_content)
+                    if match:
+                        existing_links.append((match.group(2), match.group(1), current_pos))
+                
+                current_pos += len(section_content)
             
-            current_pos += len(section_content)
-            
-        # Sort by position (reverse order for safe replacement)
-        linkable_terms.sort(key=lambda x: x[1], reverse=True)
+        with self.profiler.stage('overlap'):
+            return self._remove_overlaps(linkable_terms), existing_links
+    
+    def _remove_overlaps(self, linkable_terms: List[Tuple[str, int, int, str, str]]
+                         ) -> List[Tuple[str, int, int, str, str]]:
+        """Resolve overlapping matches, longest match wins.
         
-        # Remove overlapping matches (keep the first/longest match)
-        filtered_terms = []
-        used_ranges = set()
+        Candidates are considered longest first (earliest first among equal
+        lengths) and accepted unless they intersect an already accepted
+        match, so a term contained in a longer term ("API" in "Storage API")
+        never wins over it. Accepted characters are marked in a bytearray,
+        so each check and mark costs the length of the match: O(n log n)
+        for the sort plus the total match length. The result is in offset
+        order.
+        """
+        if not linkable_terms:
+            return []
+        ordered = sorted(linkable_terms, key=lambda x: (x[1] - x[2], x[1]))
+        
+        taken = bytearray(max(term_data[2] for term_data in linkable_terms))
+        accepted = []
         
-        for term_data in linkable_terms:
+        for term_data in ordered:
             _, start, end, _, _ = term_data
-            range_overlap = any(
-                (start < used_end and end > used_start) 
-                for used_start, used_end in used_ranges
-            )
-            
-            if not range_overlap:
-                filtered_terms.append(term_data)
-                used_ranges.add((start, end))
+            if taken.find(1, start, end) != -1:
+                continue
+            taken[start:end] = b'\x01' * (end - start)
+            accepted.append(term_data)
                 
-        return filtered_terms
+        accepted.sort(key=lambda x: x[1])
+        return accepted
     
-    def _split_content_sections(self, content: str) -> List[Tuple[str, str]]:
-        """Split content into sections: text, code_block, inline_code, link."""
-        sections = []
-        current_pos = 0
-        
-        # Patterns for different content types
-        patterns = [
-            ('code_block', r'```[\s\S]*?```'),
-            ('inline_code', r'`[^`]+`'),
-            ('link', r'\[([^\]]+)\]\([^)]+\)'),
-            ('image', r'!\[([^\]]*)\]\([^)]+\)'),
-        ]
+    def _split_content_sections(self, content: str) -> Iterator[Tuple[str, str]]:
+        """Lazily split content into typed sections (text, code_block, inline_code, link, ...).
         
-        # Find all special sections
-        special_sections = []
-        for section_type, pattern in patterns:
-            for match in re.finditer(pattern, content):
-                special_sections.append((match.start(), match.end(), section_type))
-                
-        # Sort by position
-        special_sections.sort()
-        
-        # Build sections list
-        for start, end, section_type in special_sections:
-            # Add text before this section
-            if current_pos < start:
-                sections.append(('text', content[current_pos:start]))
-            
-            # Add the special section
-            sections.append((section_type, content[start:end]))
-            current_pos = end
-            
-        # Add remaining text
-        if current_pos < len(content):
-            sections.append(('text', content[current_pos:]))
-            
-        return sections
+        Sections never overlap and cover the content in order, so their
+        lengths can be summed to recover offsets.
+        """
+        return iter_sections(content)
     
     def create_glossary_link(self, term: str, anchor: str, file_path: Path) -> str:
         """Create a markdown link to the glossary term."""
+        return f"[{term}]({self._glossary_target(file_path)}#{anchor})"
+    
+    def _glossary_target(self, file_path: Path) -> str:
+        """Return the path of the glossary relative to file_path, for links."""
         # Calculate relative path from current file to glossary
         try:
             rel_path = os.path.relpath(self.glossary_path, file_path.parent)
             # Normalize path separators for URLs
-            rel_path = rel_path.replace('\\', '/')
-            return f"[{term}]({rel_path}#{anchor})"
+            return rel_path.replace('\\', '/')
         except ValueError:
             # Fallback to absolute path if relative path calculation fails
-            return f"[{term}](../reference/glossary.md#{anchor})"
+            return "../reference/glossary.md"
     
     def process_file(self, file_path: Path, dry_run: bool = False) -> Tuple[bool, int]:
         """Process a single file to add glossary links."""
+        was_modified, links_added, _ = self._process_file_scan(file_path, dry_run)
+        return was_modified, links_added
+    
+    def _process_file_scan(self, file_path: Path, dry_run: bool = False
+                           ) -> Tuple[bool, int, Optional[Dict]]:
+        """Process a single file and describe the content that was scanned.
+        
+        The scan record holds what the link manifest stores (stat signature,
+        content hash, link count and linked terms) and, when collecting them,
+        the term occurrences for the term index. It is None when the file
+        could not be read. ``rewritten`` is set when links were written; the
+        record then describes the written content (stat signature after the
+        write, hash of what was written, no pending links), which is what a
+        rescan of the file would find.
+        """
         if not self.should_process_file(file_path):
-            return False, 0
+            return False, 0, None
             
+        with self.profiler.file(self._relative_path(file_path)):
+            return self._scan_file(file_path, dry_run)
+    
+    def _scan_file(self, file_path: Path, dry_run: bool) -> Tuple[bool, int, Optional[Dict]]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            with self.profiler.stage('read'):
+                stat = file_path.stat()
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    original_content = f.read()
         except UnicodeDecodeError:
             print(f"Warning: Could not read {file_path} (encoding issue)")
-            return False, 0
+            return False, 0, None
             
         # Find terms to link
-        linkable_terms = self.find_linkable_terms(original_content)
+        linkable_terms, existing_links = self._find_terms(original_content,
+                                                          self.collect_occurrences)
         
-        if not linkable_terms:
-            return False, 0
-            
-        # Apply links (in reverse order to preserve positions)
-        modified_content = original_content
-        links_added = 0
+        with self.profiler.stage('hash'):
+            scan = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': hash_content(original_content),
+                'links': len(linkable_terms),
+                # Matched text lowercases to the glossary table key it matched
+                'terms': {term_data[0].lower() for term_data in linkable_terms},
+                'rewritten': False,
+            }
+        
+        if self.collect_occurrences:
+            with self.profiler.stage('index'):
+                scan['occurrences'] = self._occurrences(
+                    original_content, linkable_terms, existing_links, linked=not dry_run
+                )
         
-        for matched_text, start_pos, end_pos, anchor, display_name in linkable_terms:
-            # Create the link
-            link = self.create_glossary_link(matched_text, anchor, file_path)
+        if not linkable_terms:
+            return False, 0, scan
             
-            # Replace the term with the link
-            modified_content = (
-                modified_content[:start_pos] + 
-                link + 
-                modified_content[end_pos:]
-            )
-            links_added += 1
+        # Build all links, then rewrite the content in a single pass
+        with self.profiler.stage('rewrite'):
+            modified_content = self._apply_links(original_content, linkable_terms, file_path)
+        links_added = len(linkable_terms)
             
         # Write the modified content
         if not dry_run and modified_content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+            with self.profiler.stage('write'):
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(modified_content)
+                stat = file_path.stat()
+            # Linking is idempotent, so the written content has no pending links
+            scan.update({
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': hash_content(modified_content),
+                'links': 0,
+                'rewritten': True,
+            })
                 
-        return True, links_added
+        return True, links_added, scan
+    
+    def link_content(self, content: str, file_path: Path) -> Tuple[str, int]:
+        """Return content with glossary links added, and the number of links.
+        
+        Nothing is read or written; file_path only decides the relative link
+        target. Used by the MkDocs plugin to link pages in memory.
+        """
+        linkable_terms = self.find_linkable_terms(content)
+        if not linkable_terms:
+            return content, 0
+        return self._apply_links(content, linkable_terms, file_path), len(linkable_terms)
+    
+    def _apply_links(self, content: str, linkable_terms: List[Tuple[str, int, int, str, str]],
+                     file_path: Path) -> str:
+        """Replace each linkable term in content with its glossary link."""
+        # Every link of a file has the same target path, only the anchor differs
+        target = self._glossary_target(file_path)
+        edits = [
+            (start_pos, end_pos, f"[{matched_text}]({target}#{anchor})")
+            for matched_text, start_pos, end_pos, anchor, display_name in linkable_terms
+        ]
+        return apply_edits(content, edits)
+    
+    @staticmethod
+    def _occurrences(content: str, linkable_terms: List[Tuple[str, int, int, str, str]],
+                     existing_links: List[Tuple[str, str, int]], linked: bool
+                     ) -> List[Occurrence]:
+        """Describe term uses as term index rows.
+        
+        Adding links never adds lines, so line numbers stay valid after the
+        file is rewritten; linked tells whether the new links were written.
+        """
+        if not linkable_terms and not existing_links:
+            return []
+        
+        line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+        
+        def line_of(offset: int) -> int:
+            return bisect.bisect_right(line_starts, offset)
+        
+        occurrences = [
+            (anchor, text, line_of(offset), True)
+            for anchor, text, offset in existing_links
+        ]
+        occurrences.extend(
+            (anchor, matched_text, line_of(start), linked)
+            for matched_text, start, end, anchor, display_name in linkable_terms
+        )
+        return occurrences
     
-    def process_all_files(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, int]:
-        """Process all markdown files in the documentation."""
+    def process_all_files(self, dry_run: bool = False, verbose: bool = False,
+                          jobs: int = 1, cache_path: Optional[Path] = None,
+                          index_path: Optional[Path] = None) -> Dict[str, int]:
+        """Process all markdown files in the documentation.
+        
+        With jobs > 1 files are fanned out over a process pool. Results are
+        merged in file order, so output is the same as a sequential run.
+        
+        With a cache_path, a link manifest is used to skip files whose content
+        and relevant glossary terms are unchanged since the previous run.
+        
+        With an index_path, the term index is updated with the term uses of
+        every scanned file.
+        """
         # Load glossary terms
-        self.terms = self.load_glossary_terms()
+        with self.profiler.stage('glossary'):
+            self.terms = self.load_glossary_terms()
+            self.matcher = TermMatcher(self.terms)
         
         if verbose:
             print(f"Loaded {len(self.terms)} glossary terms")
@@ -253,14 +372,78 @@ class GlossaryLinker:
         results = {
             'files_processed': 0,
             'files_modified': 0,
+            'files_cached': 0,
             'total_links_added': 0
         }
         
         # Find all markdown files
-        for file_path in self.docs_root.rglob('*.md'):
-            if self.should_process_file(file_path):
-                was_modified, links_added = self.process_file(file_path, dry_run)
-                
+        files = [
+            file_path for file_path in iter_markdown_files(self.docs_root)
+            if self.should_process_file(file_path)
+        ]
+        
+        term_index = None
+        indexed_paths = set()
+        self.collect_occurrences = index_path is not None
+        if index_path is not None:
+            term_index = TermIndex(index_path)
+            term_index.set_terms(self.terms)
+            term_index.retain_documents(self._relative_path(file_path) for file_path in files)
+            indexed_paths = term_index.indexed_paths()
+        
+        # Use cached results for unchanged files
+        manifest = None
+        cached = {}
+        if cache_path is not None:
+            with self.profiler.stage('manifest'):
+                manifest = LinkManifest.load(cache_path, self.docs_root)
+                manifest.set_glossary(self.terms)
+                for file_path in files:
+                    links = manifest.lookup(file_path)
+                    # Files with pending links still need processing unless nothing is written
+                    if links is not None and (links == 0 or dry_run):
+                        # The term index also needs a scan of files it has not seen
+                        if term_index is None or self._relative_path(file_path) in indexed_paths:
+                            cached[file_path] = links
+                    
+        pending = [file_path for file_path in files if file_path not in cached]
+        
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+            
+        if jobs > 1 and len(pending) > 1:
+            # Each worker receives the term table once and compiles its own matcher
+            executor = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self.docs_root, self.terms, self.profiler.enabled,
+                          self.profiler.trace_memory, self.collect_occurrences)
+            )
+            chunksize = max(1, len(pending) // (jobs * 4))
+            outcomes = self._merge_worker_profiles(executor.map(
+                _process_file_in_worker, pending, repeat(dry_run), chunksize=chunksize
+            ))
+        else:
+            executor = None
+            outcomes = (self._process_file_scan(file_path, dry_run) for file_path in pending)
+            
+        try:
+            for file_path in files:
+                if file_path in cached:
+                    links_added = cached[file_path]
+                    was_modified = links_added > 0
+                    results['files_cached'] += 1
+                else:
+                    was_modified, links_added, scan = next(outcomes)
+                    if manifest is not None:
+                        if scan is not None:
+                            manifest.record(file_path, scan)
+                        else:
+                            manifest.forget(file_path)
+                    if term_index is not None and scan is not None:
+                        term_index.replace_document(self._relative_path(file_path),
+                                                    scan['occurrences'])
+                            
                 results['files_processed'] += 1
                 if was_modified:
                     results['files_modified'] += 1
@@ -269,8 +452,166 @@ class GlossaryLinker:
                     if verbose:
                         action = "Would modify" if dry_run else "Modified"
                         print(f"{action} {file_path}: {links_added} links added")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if term_index is not None:
+                term_index.commit()
+                term_index.close()
+                
+        if manifest is not None:
+            with self.profiler.stage('manifest'):
+                manifest.save()
                         
         return results
+    
+    def watch(self, dry_run: bool = False, verbose: bool = False, jobs: int = 1,
+              cache_path: Optional[Path] = None, index_path: Optional[Path] = None,
+              debounce: float = 0.025):
+        """Link all files, then relink files as they change until interrupted.
+        
+        The compiled matcher, link manifest and term index stay open between
+        events, so a saved page is relinked on its own. A glossary change
+        goes through process_all_files, which uses the manifest to relink only
+        files containing added, removed or re-anchored terms (every file when
+        running without a manifest).
+        """
+        results = self.process_all_files(dry_run, verbose, jobs, cache_path, index_path)
+        print(f"Linked {results['files_processed']} files, "
+              f"added {results['total_links_added']} glossary links")
+        
+        watcher = create_watcher(self.docs_root, debounce)
+        print(f"Watching {self.docs_root} for changes ({type(watcher).__name__}), "
+              f"press Ctrl+C to stop")
+        
+        manifest = None
+        if cache_path is not None:
+            manifest = LinkManifest.load(cache_path, self.docs_root)
+            manifest.set_glossary(self.terms)
+        term_index = TermIndex(index_path) if index_path is not None else None
+        self.collect_occurrences = term_index is not None
+        
+        # Signatures of files this process wrote, to ignore the events they cause
+        written = {}
+        
+        try:
+            for changed in watcher.batches():
+                if self.glossary_path in changed:
+                    start = time.perf_counter()
+                    if term_index is not None:
+                        term_index.close()
+                    try:
+                        results = self.process_all_files(dry_run, verbose, jobs,
+                                                         cache_path, index_path)
+                    except FileNotFoundError as e:
+                        # Deleted or renamed: keep linking with the loaded terms
+                        results = None
+                        print(f"Error: {e}; keeping the previous glossary terms")
+                    if manifest is not None:
+                        manifest = LinkManifest.load(cache_path, self.docs_root)
+                        manifest.set_glossary(self.terms)
+                    if term_index is not None:
+                        term_index = TermIndex(index_path)
+                    if results is None:
+                        continue
+                    elapsed = (time.perf_counter() - start) * 1000
+                    print(f"Glossary changed: {results['files_processed'] - results['files_cached']} "
+                          f"files relinked, {results['total_links_added']} links added "
+                          f"({elapsed:.1f} ms)")
+                    continue
+                    
+                for file_path in sorted(changed):
+                    if self.should_process_file(file_path):
+                        self._relink_changed_file(file_path, dry_run, manifest,
+                                                  term_index, written)
+                    
+                if manifest is not None:
+                    # Only changed files were visited; deleted ones were forgotten
+                    manifest.save(prune=False)
+                if term_index is not None:
+                    term_index.commit()
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            watcher.close()
+            if term_index is not None:
+                term_index.commit()
+                term_index.close()
+    
+    def _relink_changed_file(self, file_path: Path, dry_run: bool,
+                             manifest: Optional[LinkManifest], term_index: Optional[TermIndex],
+                             written: Dict[Path, Tuple[int, int]]):
+        """Relink one file reported by the watcher and update manifest and index."""
+        start = time.perf_counter()
+        relative_path = self._relative_path(file_path)
+        
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Deleted (or moved away)
+            written.pop(file_path, None)
+            if manifest is not None:
+                manifest.forget(file_path)
+            if term_index is not None:
+                term_index.remove_document(relative_path)
+            print(f"Removed {relative_path}")
+            return
+        
+        if written.get(file_path) == (stat.st_mtime_ns, stat.st_size):
+            return
+        
+        was_modified, links_added, scan = self._process_file_scan(file_path, dry_run)
+        if scan is None:
+            return
+        
+        if scan['rewritten']:
+            written[file_path] = (scan['mtime_ns'], scan['size'])
+        if manifest is not None:
+            manifest.record(file_path, scan)
+        if term_index is not None:
+            term_index.replace_document(relative_path, scan['occurrences'])
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        if was_modified:
+            action = "would add" if dry_run else "added"
+            print(f"{relative_path}: {action} {links_added} links ({elapsed:.1f} ms)")
+        else:
+            print(f"{relative_path}: no new links ({elapsed:.1f} ms)")
+    
+    def _relative_path(self, file_path: Path) -> str:
+        return Path(os.path.relpath(file_path, self.docs_root)).as_posix()
+    
+    def _merge_worker_profiles(self, outcomes: Iterator[Tuple[Tuple, Optional[Dict]]]
+                               ) -> Iterator[Tuple[bool, int, Optional[Dict]]]:
+        """Collect worker file records into this linker's profiler."""
+        for outcome, record in outcomes:
+            if record is not None:
+                self.profiler.add_file_record(record)
+            yield outcome
+
+# Per-process linker used by --jobs workers
+_worker_linker = None
+
+def _init_worker(docs_root: Path, terms: Dict[str, Tuple[str, str]],
+                 profile: bool = False, trace_memory: bool = False,
+                 collect_occurrences: bool = False):
+    """Set up the linker of a worker process."""
+    global _worker_linker
+    _worker_linker = GlossaryLinker(docs_root)
+    _worker_linker.terms = terms
+    _worker_linker.collect_occurrences = collect_occurrences
+    _worker_linker.matcher = TermMatcher(terms)
+    _worker_linker.profiler = StageProfiler(profile, trace_memory)
+    _worker_linker.profiler.start()
+
+def _process_file_in_worker(file_path: Path, dry_run: bool
+                            ) -> Tuple[Tuple[bool, int, Optional[Dict]], Optional[Dict]]:
+    """Process a single file in a worker process.
+    
+    Returns the scan outcome and, when profiling, the file's timing record.
+    """
+    outcome = _worker_linker._process_file_scan(file_path, dry_run)
+    return outcome, _worker_linker.profiler.take_file_record()
 
 def main():
     parser = argparse.ArgumentParser(description='Add automatic links to glossary terms')
@@ -281,6 +622,29 @@ def main():
     parser.add_argument('--docs-root', type=Path, 
                        default=Path(__file__).parent.parent / 'docs',
                        help='Root directory of documentation')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes (0 = one per CPU)')
+    parser.add_argument('--cache', type=Path,
+                       default=Path(__file__).parent.parent / '.glossary-link-cache.json',
+                       help='Link manifest used to skip unchanged files')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Rescan every file and leave the link manifest untouched')
+    parser.add_argument('--index', type=Path,
+                       default=Path(__file__).parent.parent / '.glossary-term-index.sqlite',
+                       help='Term index recording where each glossary term is used')
+    parser.add_argument('--no-index', action='store_true',
+                       help='Do not update the term index')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and relink files as they are saved')
+    parser.add_argument('--debounce', type=float, default=0.025, metavar='SECONDS',
+                       help='Quiet period that ends a burst of file events (--watch)')
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                       help='Write stage and per-file timings as JSON, or cProfile '
+                            'stats if FILE ends in .prof or .pstats')
+    parser.add_argument('--top', type=int, default=0, metavar='N',
+                       help='Report stage timings and the N slowest files')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Also record peak allocations per stage (slow)')
     
     args = parser.parse_args()
     
@@ -292,18 +656,57 @@ def main():
     # Create linker and process files
     linker = GlossaryLinker(args.docs_root)
     
+    if args.watch:
+        try:
+            linker.watch(args.dry_run, args.verbose, args.jobs,
+                         cache_path=None if args.no_cache else args.cache,
+                         index_path=None if args.no_index else args.index,
+                         debounce=args.debounce)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+    
+    profile_stats = args.profile is not None and args.profile.suffix in ('.prof', '.pstats')
+    if args.profile is not None or args.top > 0 or args.trace_memory:
+        linker.profiler = StageProfiler(enabled=True, trace_memory=args.trace_memory)
+    
     try:
-        results = linker.process_all_files(args.dry_run, args.verbose)
+        profiler = cProfile.Profile() if profile_stats else None
+        linker.profiler.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            results = linker.process_all_files(
+                args.dry_run, args.verbose, args.jobs,
+                cache_path=None if args.no_cache else args.cache,
+                index_path=None if args.no_index else args.index
+            )
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            linker.profiler.stop()
         
         # Print summary
         action = "Would process" if args.dry_run else "Processed"
         print(f"\n{action} {results['files_processed']} files")
         print(f"Modified {results['files_modified']} files")
+        if results['files_cached']:
+            print(f"Reused cached results for {results['files_cached']} unchanged files")
         print(f"Added {results['total_links_added']} glossary links")
         
         if args.dry_run and results['files_modified'] > 0:
             print("\nRun without --dry-run to apply changes")
             
+        if linker.profiler.enabled:
+            linker.profiler.print_report(args.top)
+        if profiler is not None:
+            profiler.dump_stats(args.profile)
+            print(f"\nWrote cProfile stats to {args.profile}")
+        elif args.profile is not None:
+            linker.profiler.dump(args.profile)
+            print(f"\nWrote stage timings to {args.profile}")
+            
     except FileNotFoundError as e:
         print(f"Error: {e}")
         return 1
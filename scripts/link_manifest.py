@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Glossary Link Manifest
+
+Persistent record of glossary linking results, used to skip files that
+have not changed since the previous run.
+
+For every file the manifest stores its stat signature (mtime and size), a
+SHA-256 of its content, the number of links the linker found and the terms
+those links are for. The glossary term table is stored once, so a changed
+glossary can be diffed against it and only files containing affected terms
+are rescanned.
+
+The manifest also records a hash of the code that decides what gets linked
+(linker, markdown lexer, term matcher, edit application). A manifest written
+by different linking code is discarded, so its results are never reused.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from term_matcher import TermMatcher
+
+MANIFEST_VERSION = 2
+
+# Modules whose code decides which links a file gets
+LINKER_SOURCES = ('link-glossary-terms.py', 'markdown_lexer.py', 'term_matcher.py',
+                  'text_edits.py')
+
+_linker_version = None
+
+
+def hash_content(content: str) -> str:
+    """Return the SHA-256 hex digest of text content."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def hash_terms(terms: Dict[str, Tuple[str, str]]) -> str:
+    """Return a stable hash of a ``term -> (anchor, display_name)`` table."""
+    encoded = json.dumps(sorted(terms.items()), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def linker_version() -> str:
+    """Return a hash of the linking code in LINKER_SOURCES."""
+    global _linker_version
+    if _linker_version is None:
+        digest = hashlib.sha256()
+        for name in LINKER_SOURCES:
+            digest.update(name.encode('utf-8') + b'\0')
+            digest.update((Path(__file__).parent / name).read_bytes())
+        _linker_version = digest.hexdigest()
+    return _linker_version
+
+
+class LinkManifest:
+    """Per-file linking results keyed by path relative to the docs root."""
+
+    def __init__(self, path: Path, docs_root: Path):
+        self.path = path
+        self.docs_root = docs_root
+        self.glossary_hash = None
+        self.terms = {}  # Term table the file entries were computed with
+        self.files = {}  # relative path -> entry
+        self._affected_terms = None
+        self._affected_matcher = None
+        self._seen = set()
+
+    @classmethod
+    def load(cls, path: Path, docs_root: Path) -> 'LinkManifest':
+        """Load a manifest, starting empty if it is missing or unreadable."""
+        manifest = cls(path, docs_root)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+
+        if data.get('version') != MANIFEST_VERSION or data.get('linker') != linker_version():
+            return manifest
+
+        manifest.glossary_hash = data.get('glossary_hash')
+        manifest.terms = {
+            term: tuple(value) for term, value in data.get('terms', {}).items()
+        }
+        manifest.files = data.get('files', {})
+        return manifest
+
+    def save(self, prune: bool = True):
+        """Write the manifest atomically.
+
+        With prune, files not looked up or recorded since loading are
+        dropped, as they are no longer part of the docs tree.
+        """
+        data = {
+            'version': MANIFEST_VERSION,
+            'linker': linker_version(),
+            'glossary_hash': self.glossary_hash,
+            'terms': self.terms,
+            'files': {
+                key: entry for key, entry in sorted(self.files.items())
+                if not prune or key in self._seen
+            },
+        }
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def set_glossary(self, terms: Dict[str, Tuple[str, str]]):
+        """Switch to the current glossary and work out which terms changed."""
+        glossary_hash = hash_terms(terms)
+
+        if glossary_hash == self.glossary_hash:
+            self._affected_terms = set()
+        elif self.glossary_hash is None:
+            # Nothing to diff against: every existing entry is stale
+            self.files = {}
+            self._affected_terms = set()
+        else:
+            old_terms = self.terms
+            self._affected_terms = {
+                term for term in set(old_terms) | set(terms)
+                if old_terms.get(term) != terms.get(term)
+            }
+
+        # Terms that may now produce links where there were none
+        new_terms = [term for term in self._affected_terms if term in terms]
+        self._affected_matcher = TermMatcher(new_terms) if new_terms else None
+
+        self.glossary_hash = glossary_hash
+        self.terms = dict(terms)
+
+    def _key(self, file_path: Path) -> str:
+        return Path(os.path.relpath(file_path, self.docs_root)).as_posix()
+
+    def lookup(self, file_path: Path) -> Optional[int]:
+        """Return the cached link count for a file, or None if it must be rescanned.
+
+        Unchanged stat signatures are trusted without reading the file. When
+        the signature changed, the content hash decides.
+        """
+        key = self._key(file_path)
+        self._seen.add(key)
+
+        entry = self.files.get(key)
+        if entry is None:
+            return None
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        content = None
+        if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            content = self._read(file_path)
+            if content is None or hash_content(content) != entry['sha256']:
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+
+        if self._affected_terms:
+            if self._affected_terms.intersection(entry['terms']):
+                return None
+            if self._affected_matcher is not None:
+                if content is None:
+                    content = self._read(file_path)
+                if content is None or next(self._affected_matcher.finditer(content), None):
+                    return None
+
+        return entry['links']
+
+    def record(self, file_path: Path, scan: Dict):
+        """Store a linker scan result (stat signature, hash, links, terms)."""
+        key = self._key(file_path)
+        self._seen.add(key)
+        self.files[key] = {
+            'mtime_ns': scan['mtime_ns'],
+            'size': scan['size'],
+            'sha256': scan['sha256'],
+            'links': scan['links'],
+            'terms': sorted(scan['terms']),
+        }
+
+    def forget(self, file_path: Path):
+        """Drop a file's entry (e.g. after it was deleted)."""
+        key = self._key(file_path)
+        self._seen.add(key)
+        self.files.pop(key, None)
+
+    @staticmethod
+    def _read(file_path: Path) -> Optional[str]:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
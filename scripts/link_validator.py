@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Link Validator
+
+Checks the links of every markdown file in the documentation:
+
+- internal links must point to an existing file inside the docs tree, and
+  ``#anchors`` must match a heading of the target page
+- ``mailto:`` links must contain a plausible address
+- external ``http(s)`` links (with --external) must answer with a 2xx status
+
+Links come from the shared documentation corpus (see docs_corpus.py), which
+uses the same markdown lexer as the glossary linker, so code blocks and
+inline code are never mistaken for links. Anchors are looked up in the
+precomputed heading anchor index (see anchor_index.py), whose anchors match
+the ids MkDocs generates.
+
+External URLs are checked concurrently with asyncio over pooled keep-alive
+connections, with a limit per host, HEAD requests falling back to GET, and
+an on-disk cache whose entries expire after a TTL.
+
+Usage:
+    python scripts/link_validator.py [--external] [--per-host 4] [--json report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import ssl
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+from anchor_index import AnchorIndex
+from docs_corpus import DocsCorpus
+
+CACHE_VERSION = 1
+
+EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1'}
+INDEX_FILES = ('index.md', 'README.md')
+
+# Response bodies larger than this are not drained; the connection is dropped instead
+MAX_DRAIN_BYTES = 1024 * 1024
+
+
+class _HostPool:
+    """Idle keep-alive connections and a concurrency limit for one host."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+
+class ExternalLinkChecker:
+    """Checks HTTP(S) URLs concurrently, with per-host pools and a TTL cache."""
+
+    def __init__(self, cache_path: Optional[Path] = None, ttl: float = 24 * 3600,
+                 per_host: int = 4, concurrency: int = 32, timeout: float = 10.0,
+                 max_redirects: int = 5, user_agent: str = 'movian-docs-link-validator'):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.per_host = per_host
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self.requests = 0
+        self.connections = 0
+        self.cache_hits = 0
+        self._cache = self._load_cache()
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._ssl_context = None
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('urls', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def save_cache(self):
+        """Write unexpired results atomically."""
+        if self.cache_path is None:
+            return
+        now = time.time()
+        urls = {url: result for url, result in sorted(self._cache.items())
+                if now - result['checked_at'] < self.ttl}
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'urls': urls}, f, indent=1)
+        os.replace(temp_path, self.cache_path)
+
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Check URLs and return ``{url: {'ok', 'status', 'message', 'checked_at'}}``.
+
+        Fragments are ignored, so URLs differing only in their ``#part``
+        are requested once.
+        """
+        targets = {url: url.split('#', 1)[0] for url in urls}
+        now = time.time()
+
+        pending = []
+        for target in dict.fromkeys(targets.values()):
+            cached = self._cache.get(target)
+            if cached is not None and now - cached['checked_at'] < self.ttl:
+                self.cache_hits += 1
+            else:
+                pending.append(target)
+
+        if pending:
+            results = asyncio.run(self._check_all(pending))
+            self._cache.update(zip(pending, results))
+
+        return {url: self._cache[target] for url, target in targets.items()}
+
+    async def _check_all(self, urls: List[str]) -> List[Dict]:
+        self._pools = {}
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def check_one(url: str) -> Dict:
+            async with limit:
+                return await self._check_url(url)
+
+        try:
+            return await asyncio.gather(*(check_one(url) for url in urls))
+        finally:
+            for pool in self._pools.values():
+                for _, writer in pool.idle:
+                    writer.close()
+
+    async def _check_url(self, url: str) -> Dict:
+        result = {'ok': False, 'status': None, 'message': '', 'checked_at': time.time()}
+        current = url
+
+        try:
+            for _ in range(self.max_redirects + 1):
+                status, headers = await self._request('HEAD', current)
+                if status >= 400 and status not in REDIRECT_STATUSES:
+                    # Plenty of servers reject or mishandle HEAD
+                    status, headers = await self._request('GET', current)
+
+                if status in REDIRECT_STATUSES and 'location' in headers:
+                    current = urljoin(current, headers['location'])
+                    continue
+                break
+            else:
+                result['message'] = f"Too many redirects (> {self.max_redirects})"
+                return result
+        except asyncio.TimeoutError:
+            result['message'] = f"Timed out after {self.timeout:g}s"
+            return result
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            result['message'] = f"Request failed: {e}"
+            return result
+
+        result['status'] = status
+        result['ok'] = 200 <= status < 300
+        if not result['ok']:
+            result['message'] = f"HTTP {status}"
+        elif current != url:
+            result['message'] = f"Redirects to {current}"
+        return result
+
+    def _pool(self, key: Tuple[str, str, int]) -> _HostPool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(self.per_host)
+        return pool
+
+    async def _request(self, method: str, url: str) -> Tuple[int, Dict[str, str]]:
+        """Send one request over a pooled connection and return status and headers."""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"unsupported URL {url}")
+
+        default_port = 443 if parts.scheme == 'https' else 80
+        port = parts.port or default_port
+        key = (parts.scheme, parts.hostname, port)
+        pool = self._pool(key)
+
+        path = quote(parts.path or '/', safe="/%:@!$&'()*+,;=~-._")
+        if parts.query:
+            path += '?' + parts.query
+        host = parts.hostname if port == default_port else f"{parts.hostname}:{port}"
+        request = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                   f"User-Agent: {self.user_agent}\r\nAccept: */*\r\n"
+                   f"Connection: keep-alive\r\n\r\n").encode('latin-1')
+
+        async with pool.semaphore:
+            # A reused connection may have been closed by the server meanwhile
+            while pool.idle:
+                reader, writer = pool.idle.pop()
+                try:
+                    return await self._exchange(pool, reader, writer, request, method)
+                except asyncio.TimeoutError:
+                    # A slow server, not a stale connection (TimeoutError is an OSError)
+                    raise
+                except (OSError, asyncio.IncompleteReadError):
+                    writer.close()
+
+            reader, writer = await asyncio.wait_for(self._connect(key), self.timeout)
+            return await self._exchange(pool, reader, writer, request, method)
+
+    async def _connect(self, key: Tuple[str, str, int]):
+        scheme, hostname, port = key
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            connection = await asyncio.open_connection(hostname, port, ssl=self._ssl_context,
+                                                       server_hostname=hostname)
+        else:
+            connection = await asyncio.open_connection(hostname, port)
+        self.connections += 1
+        return connection
+
+    async def _exchange(self, pool: _HostPool, reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter, request: bytes,
+                        method: str) -> Tuple[int, Dict[str, str]]:
+        self.requests += 1
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, headers, reusable = await asyncio.wait_for(
+                self._read_response(reader, method), self.timeout
+            )
+        except BaseException:
+            writer.close()
+            raise
+
+        if reusable:
+            pool.idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, headers
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader,
+                             method: str) -> Tuple[int, Dict[str, str], bool]:
+        """Read status and headers, and drain the body if the connection can be reused."""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+
+        version, status_text = status_line.decode('latin-1').split(None, 2)[:2]
+        status = int(status_text)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+        if method == 'HEAD' or status < 200 or status in (204, 304):
+            return status, headers, reusable
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            drained = 0
+            while True:
+                size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                drained += size
+                if drained > MAX_DRAIN_BYTES:
+                    return status, headers, False
+                await reader.readexactly(size + 2)
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+            if length > MAX_DRAIN_BYTES:
+                return status, headers, False
+            await reader.readexactly(length)
+        else:
+            # Body runs until the server closes the connection
+            return status, headers, False
+
+        return status, headers, reusable
+
+
+class LinkValidator:
+    """Validates the links of a documentation corpus."""
+
+    def __init__(self, corpus: DocsCorpus, external: Optional[ExternalLinkChecker] = None,
+                 anchors: Optional[AnchorIndex] = None):
+        self.corpus = corpus
+        # Anything with anchors(path) -> {anchor: line}; the corpus itself by default
+        self.anchors = anchors if anchors is not None else corpus
+        self.docs_root = corpus.docs_root.resolve()
+        self.external = external
+        self.issues: List[Dict] = []
+        self.total = 0
+
+    def validate(self) -> List[Dict]:
+        """Check every link and return the issues found."""
+        external_links = []
+
+        for document in self.corpus.documents():
+            for kind, target, text, line in document.links:
+                self.total += 1
+                target = target.strip()
+                if target.startswith(('http://', 'https://')):
+                    external_links.append((document.path, line, target))
+                    if urlsplit(target).hostname in LOCAL_HOSTS:
+                        self._report(document.path, line, target, 'warning',
+                                     "Link to localhost may not be accessible to readers")
+                elif target.startswith('mailto:'):
+                    if not EMAIL_RE.match(target[len('mailto:'):]):
+                        self._report(document.path, line, target, 'error',
+                                     f"Invalid email address: {target[len('mailto:'):]}")
+                elif not target:
+                    self._report(document.path, line, target, 'error', "Empty URL")
+                elif not urlsplit(target).scheme:
+                    self._check_internal(document.path, line, target)
+
+        if self.external is not None and external_links:
+            results = self.external.check(url for _, _, url in external_links)
+            for path, line, url in external_links:
+                result = results[url]
+                if not result['ok']:
+                    severity = 'warning' if result['status'] == 429 else 'error'
+                    self._report(path, line, url, severity, result['message'])
+
+        return self.issues
+
+    def _check_internal(self, document_path: str, line: int, target: str):
+        file_part, _, anchor = target.partition('#')
+        file_part = file_part.split('?', 1)[0]
+
+        if not file_part:
+            target_path = self.docs_root / document_path
+        else:
+            target_path = Path(os.path.normpath(
+                self.docs_root / Path(document_path).parent / file_part
+            ))
+            if self.docs_root != target_path and self.docs_root not in target_path.parents:
+                self._report(document_path, line, target, 'error',
+                             f"Link points outside documentation directory: {target}")
+                return
+            if not target_path.exists():
+                self._report(document_path, line, target, 'error',
+                             f"File not found: {file_part}")
+                return
+            if target_path.is_dir():
+                index = next((target_path / name for name in INDEX_FILES
+                              if (target_path / name).exists()), None)
+                if index is None:
+                    self._report(document_path, line, target, 'warning',
+                                 f"Directory link without index file: {file_part}")
+                    return
+                target_path = index
+
+        if anchor and target_path.suffix == '.md':
+            if anchor not in self.anchors.anchors(target_path):
+                self._report(document_path, line, target, 'error',
+                             f"Anchor not found: #{anchor}")
+
+    def _report(self, path: str, line: int, target: str, severity: str, message: str):
+        self.issues.append({'file': path, 'line': line, 'target': target,
+                            'severity': severity, 'message': message})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate documentation links')
+    parser.add_argument('--docs-root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs',
+                        help='Root directory of documentation')
+    parser.add_argument('--external', action='store_true',
+                        help='Also check external http(s) links')
+    parser.add_argument('--per-host', type=int, default=4,
+                        help='Concurrent connections per host (default: 4)')
+    parser.add_argument('--concurrency', type=int, default=32,
+                        help='Concurrent requests in total (default: 32)')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='Seconds to wait for a connection or response')
+    parser.add_argument('--cache', type=Path,
+                        default=Path(__file__).parent.parent / '.link-check-cache.json',
+                        help='External link results cache')
+    parser.add_argument('--anchor-index', type=Path,
+                        default=Path(__file__).parent.parent / '.docs-anchor-index.json',
+                        help='Heading anchor index (see anchor_index.py)')
+    parser.add_argument('--cache-ttl', type=float, default=24.0,
+                        help='Hours before a cached external result is rechecked')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Check every external link and do not read or write caches')
+    parser.add_argument('--json', type=Path, help='Save issues to a JSON file')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args()
+
+    if not args.docs_root.exists():
+        print(f"Error: Documentation root not found: {args.docs_root}")
+        return 1
+
+    corpus = DocsCorpus(args.docs_root)
+    anchors = AnchorIndex(args.docs_root, None if args.no_cache else args.anchor_index)
+    anchors.update()
+    anchors.save()
+    external = None
+    if args.external:
+        external = ExternalLinkChecker(
+            cache_path=None if args.no_cache else args.cache, ttl=args.cache_ttl * 3600,
+            per_host=args.per_host, concurrency=args.concurrency, timeout=args.timeout
+        )
+
+    start = time.perf_counter()
+    validator = LinkValidator(corpus, external, anchors)
+    issues = validator.validate()
+    elapsed = time.perf_counter() - start
+    if external is not None:
+        external.save_cache()
+
+    errors = [issue for issue in issues if issue['severity'] == 'error']
+    warnings = [issue for issue in issues if issue['severity'] == 'warning']
+
+    if not args.quiet:
+        for issue in errors + warnings:
+            print(f"{issue['file']}:{issue['line']}: {issue['severity']}: "
+                  f"{issue['message']} ({issue['target']})")
+        if issues:
+            print()
+
+    print(f"Checked {validator.total} links in {elapsed:.2f}s: "
+          f"{len(errors)} errors, {len(warnings)} warnings")
+    if external is not None:
+        print(f"External: {external.requests} requests over {external.connections} "
+              f"connections, {external.cache_hits} cached")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'total': validator.total, 'issues': issues}, f, indent=2)
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Macro Index
+
+Global symbol table of the ``#define`` macros in a tree of GLW view files,
+with an inverted index of where each macro is invoked, built from the
+syntax trees of scripts/glw_view.py.
+
+For every file the index records its ``#include``/``#import`` directives,
+macro definitions (name, parameters and defaults, line) and calls. A call
+resolves against the macros visible in its file: those defined in the file
+itself and in everything it includes, transitively (``skin://`` paths are
+relative to the skin root, the nearest directory with a theme.view or
+universe.view). With the tables in memory, each check is a dictionary
+lookup:
+
+- undefined macro: a PascalCase call with no visible definition (lower
+  case calls are treated as built-in functions unless a macro of that name
+  is visible)
+- arity mismatch: too many arguments, unknown named arguments or missing
+  required parameters
+- unused macro: a definition that is never called or referenced
+- included file not found
+
+The index is saved as JSON. Files are re-parsed only when their content
+hash changes (modification time and size are checked first), and
+revalidating one edited file re-parses only that file and re-checks it and
+the files that call the macros it defines.
+
+Usage:
+    python scripts/macro_index.py [--root docs/ui/theming/examples]
+    python scripts/macro_index.py --where ListItemBevel
+    python scripts/macro_index.py --revalidate docs/ui/theming/examples/minimal-skin/pages/home.view
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from glw_view import iter_view_files, parse_view
+
+INDEX_VERSION = 1
+
+SKIN_ROOT_MARKERS = ('theme.view', 'universe.view')
+EXTERNAL_PATH_RE = re.compile(r'^[a-z]+://')
+
+# Definition: (file, line, params) with params a list of [name, has_default],
+# or None for a simple macro (#define NAME value)
+Definition = Tuple[str, int, Optional[List[List]]]
+# Call: [name, line, column, positional argument count, named arguments]
+Call = List
+
+
+def scan_view(text: str) -> Dict:
+    """Return the includes, definitions, calls and names of one view file."""
+    view = parse_view(text)
+    if view.error is not None:
+        error = view.error
+        return {'error': [error.line, error.column, error.message],
+                'includes': [], 'defines': [], 'calls': [], 'names': []}
+
+    defines = []
+    parameter_calls = set()  # a parameter called inside its macro, e.g. ON_SUBMIT(...)
+    for node in view.defines():
+        params = [child for child in node.children if child.kind == 'param']
+        names = {param.value for param in params}
+        parameter_calls.update(id(call) for call in node.children[-1].find('call')
+                               if call.value in names)
+        simple = not params and node.children[-1].kind != 'block'
+        defines.append([node.value, node.line,
+                        None if simple else [[param.value, bool(param.children)]
+                                             for param in params]])
+
+    calls = []
+    for node in view.calls():
+        if id(node) in parameter_calls:
+            continue
+        named = [child.value for child in node.children if child.kind == 'named']
+        calls.append([node.value, node.line, node.column,
+                      len(node.children) - len(named), named])
+
+    return {
+        'error': None,
+        'includes': [[node.kind, node.value, node.line] for node in view.includes()],
+        'defines': defines,
+        'calls': calls,
+        'names': sorted({node.value for node in view.nodes('identifier')}),
+    }
+
+
+class MacroIndex:
+    """Macro definitions and invocation sites of every view file under a root."""
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        self.root = root
+        self.path = path
+        self._entries: Dict[str, Dict] = {}  # relative path -> scan_view() result + stat
+        self.definitions: Dict[str, List[Definition]] = {}
+        self.sites: Dict[str, Dict[str, List[Call]]] = {}  # name -> file -> calls
+        self.references: Dict[str, Set[str]] = {}  # identifier -> files using it
+        self._scopes: Dict[str, Set[str]] = {}
+        self.files_parsed = 0
+
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == INDEX_VERSION:
+            for key, entry in data.get('files', {}).items():
+                self._add(key, entry)
+
+    def save(self):
+        """Write the index (atomically)."""
+        if self.path is None:
+            return
+
+        data = {'version': INDEX_VERSION, 'files': dict(sorted(self._entries.items()))}
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+    def key(self, file_path: Path) -> str:
+        return Path(os.path.relpath(file_path, self.root)).as_posix()
+
+    # Keeping the tables up to date
+
+    def update(self) -> int:
+        """Bring the index up to date with the tree; return files re-parsed."""
+        before = self.files_parsed
+        seen = set()
+        for file_path in iter_view_files(self.root):
+            seen.add(self.update_file(file_path)[0])
+        for key in self._entries.keys() - seen:
+            self._remove(key)
+        return self.files_parsed - before
+
+    def update_file(self, file_path: Path) -> Tuple[str, Set[str]]:
+        """Re-scan one file if its content changed.
+
+        Returns the file's key and the names of the macros whose definitions
+        in it were added, removed or changed.
+        """
+        key = self.key(file_path)
+        old = self._entries.get(key)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            if old is None:
+                return key, set()
+            self._remove(key)
+            return key, {define[0] for define in old['defines']}
+
+        if old is not None and old['mtime_ns'] == stat.st_mtime_ns and \
+                old['size'] == stat.st_size:
+            return key, set()
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if old is not None and old['sha256'] == digest:
+            old['mtime_ns'], old['size'] = stat.st_mtime_ns, stat.st_size
+            return key, set()
+
+        entry = scan_view(data.decode('utf-8'))
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=digest)
+        self.files_parsed += 1
+
+        changed = set()
+        if old is not None:
+            self._remove(key)
+            changed = {define[0] for define in old['defines']
+                       if define not in entry['defines']}
+        changed |= {define[0] for define in entry['defines']
+                    if old is None or define not in old['defines']}
+        self._add(key, entry)
+        return key, changed
+
+    def _add(self, key: str, entry: Dict):
+        self._entries[key] = entry
+        for name, line, params in entry['defines']:
+            self.definitions.setdefault(name, []).append((key, line, params))
+        for call in entry['calls']:
+            self.sites.setdefault(call[0], {}).setdefault(key, []).append(call)
+        for name in entry['names']:
+            self.references.setdefault(name, set()).add(key)
+        if entry['includes']:
+            self._scopes.clear()
+        else:
+            self._scopes.pop(key, None)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        for name, _, _ in entry['defines']:
+            remaining = [d for d in self.definitions[name] if d[0] != key]
+            if remaining:
+                self.definitions[name] = remaining
+            else:
+                del self.definitions[name]
+        for name in {call[0] for call in entry['calls']}:
+            files = self.sites[name]
+            del files[key]
+            if not files:
+                del self.sites[name]
+        for name in entry['names']:
+            files = self.references[name]
+            files.discard(key)
+            if not files:
+                del self.references[name]
+        self._scopes.clear()
+
+    # Include resolution
+
+    def resolve_include(self, key: str, include: str) -> Optional[str]:
+        """Return the index key an include path refers to, '' if it is outside
+        the tree (other URL schemes), or None if the file does not exist."""
+        if include.startswith('skin://'):
+            target = self._skin_root(key) / include[len('skin://'):]
+        elif EXTERNAL_PATH_RE.match(include) or include.startswith('/'):
+            return ''
+        else:
+            target = (self.root / key).parent / include
+        target_key = self.key(Path(os.path.normpath(target)))
+        return target_key if target_key in self._entries else None
+
+    def _skin_root(self, key: str) -> Path:
+        directory = (self.root / key).parent
+        while True:
+            if any((directory / marker).exists() for marker in SKIN_ROOT_MARKERS):
+                return directory
+            if directory == self.root or directory == directory.parent:
+                return (self.root / key).parent
+            directory = directory.parent
+
+    def scope(self, key: str) -> Set[str]:
+        """Return the file and everything it includes, transitively."""
+        scope = self._scopes.get(key)
+        if scope is None:
+            scope = set()
+            stack = [key]
+            while stack:
+                current = stack.pop()
+                if current in scope or current not in self._entries:
+                    continue
+                scope.add(current)
+                for _, include, _ in self._entries[current]['includes']:
+                    target = self.resolve_include(current, include)
+                    if target:
+                        stack.append(target)
+            self._scopes[key] = scope
+        return scope
+
+    # Queries
+
+    def visible_definition(self, key: str, name: str) -> Optional[Definition]:
+        """Return the definition a call to ``name`` in a file resolves to."""
+        definitions = self.definitions.get(name)
+        if not definitions:
+            return None
+        scope = self.scope(key)
+        visible = [definition for definition in definitions if definition[0] in scope]
+        if not visible:
+            return None
+        # A definition in the file itself wins over included ones
+        return next((d for d in visible if d[0] == key), visible[0])
+
+    def is_used(self, name: str) -> bool:
+        return name in self.sites or name in self.references
+
+    def unused(self) -> List[Tuple[str, int, str]]:
+        """Return (file, line, name) of every macro that is never used."""
+        return sorted((key, line, name) for name, definitions in self.definitions.items()
+                      if not self.is_used(name) for key, line, _ in definitions)
+
+    def check_file(self, key: str) -> List[Dict]:
+        """Return the issues of one file."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return []
+        issues = []
+
+        def issue(line, severity, message, macro=None, column=None):
+            issues.append({'file': key, 'line': line, 'column': column, 'macro': macro,
+                           'severity': severity, 'message': message})
+
+        if entry['error'] is not None:
+            line, column, message = entry['error']
+            issue(line, 'error', f"Syntax error: {message}", column=column)
+
+        for kind, include, line in entry['includes']:
+            if self.resolve_include(key, include) is None:
+                issue(line, 'warning', f"#{kind} file not found: {include}")
+
+        for name, line, column, positional, named in entry['calls']:
+            definition = self.visible_definition(key, name)
+            if definition is None:
+                if name[:1].isupper():
+                    issue(line, 'error', f"Undefined macro {name}()", name, column)
+                continue
+            problem = arity_problem(definition[2], positional, named)
+            if problem:
+                issue(line, 'error', f"{name}(): {problem} (defined at "
+                                     f"{definition[0]}:{definition[1]})", name, column)
+        return issues
+
+    def validate(self, unused: bool = True) -> List[Dict]:
+        """Check every file (and report unused macros)."""
+        issues = []
+        for key in sorted(self._entries):
+            issues.extend(self.check_file(key))
+        if unused:
+            for key, line, name in self.unused():
+                issues.append({'file': key, 'line': line, 'column': None, 'macro': name,
+                               'severity': 'warning', 'message': f"Unused macro {name}"})
+        return issues
+
+    def revalidate(self, file_path: Path) -> List[Dict]:
+        """Re-scan one edited file; re-check it and the files affected by it."""
+        key, changed = self.update_file(file_path)
+        affected = {key}
+        for name in changed:
+            affected.update(self.sites.get(name, ()))
+        if changed:
+            # Files that include this one see its macros too
+            affected.update(other for other in self._entries
+                            if other != key and key in self.scope(other))
+        issues = []
+        for other in sorted(affected):
+            issues.extend(self.check_file(other))
+        return issues
+
+    def where(self, name: str) -> Tuple[List[Definition], List[Tuple[str, int]]]:
+        """Return the definitions and call sites of a macro."""
+        calls = [(key, call[1]) for key, file_calls in sorted(self.sites.get(name, {}).items())
+                 for call in file_calls]
+        return list(self.definitions.get(name, [])), calls
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def arity_problem(params: Optional[List[List]], positional: int,
+                  named: Iterable[str]) -> Optional[str]:
+    """Describe why a call does not match a macro's parameters (None if it does)."""
+    if params is None:
+        return "simple macro called with arguments" if positional or named else None
+    names = [name for name, _ in params]
+    required = sum(1 for _, has_default in params if not has_default)
+    if positional > len(params):
+        expected = f"{required}-{len(params)}" if required != len(params) else str(len(params))
+        return f"takes {expected} arguments, got {positional}"
+    named = list(named)
+    unknown = [name for name in named if name not in names]
+    if unknown:
+        return f"unknown parameter {unknown[0]}"
+    given = set(names[:positional]) | set(named)
+    missing = [name for name, has_default in params if not has_default and name not in given]
+    if missing:
+        return f"missing required parameter {missing[0]}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index and check GLW macro definitions and calls')
+    parser.add_argument('--root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs' / 'ui' / 'theming' / 'examples',
+                        help='Directory of view files (default: the example skins)')
+    parser.add_argument('--index', type=Path,
+                        default=Path(__file__).parent.parent / '.macro-index.json',
+                        help='Macro index file')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every file and do not write the index')
+    parser.add_argument('--no-unused', action='store_true', help='Do not report unused macros')
+    parser.add_argument('--where', metavar='MACRO', help='Show where a macro is defined and used')
+    parser.add_argument('--revalidate', type=Path, metavar='FILE',
+                        help='Re-check one edited file and the files it affects')
+    parser.add_argument('--json', type=Path, help='Save issues to a JSON file')
+    args = parser.parse_args()
+
+    if not args.root.is_dir():
+        print(f"Error: Directory not found: {args.root}")
+        return 1
+
+    index = MacroIndex(args.root, None if args.no_cache else args.index)
+    start = time.perf_counter()
+    # Revalidating one file trusts the saved index for the others
+    parsed = 0 if args.revalidate and len(index) else index.update()
+    update_time = time.perf_counter() - start
+
+    if args.where:
+        definitions, calls = index.where(args.where)
+        if not definitions and not calls:
+            print(f"Unknown macro: {args.where}")
+            return 1
+        for key, line, params in definitions:
+            signature = '' if params is None else \
+                '(' + ', '.join(name + ('=...' if default else '') for name, default in params) + ')'
+            print(f"defined: {key}:{line}: {args.where}{signature}")
+        for key, line in calls:
+            print(f"called:  {key}:{line}")
+        index.save()
+        return 0
+
+    start = time.perf_counter()
+    if args.revalidate:
+        issues = index.revalidate(args.revalidate)
+    else:
+        issues = index.validate(unused=not args.no_unused)
+    check_time = time.perf_counter() - start
+    index.save()
+
+    for issue in issues:
+        column = f"{issue['column']}:" if issue['column'] else ''
+        print(f"{issue['file']}:{issue['line']}:{column} {issue['severity']}: {issue['message']}")
+    if issues:
+        print()
+
+    errors = sum(1 for issue in issues if issue['severity'] == 'error')
+    print(f"Files: {len(index)} ({parsed} parsed in {update_time * 1000:.1f} ms), "
+          f"macros: {len(index.definitions)}, checked in {check_time * 1000:.1f} ms")
+    print(f"{errors} errors, {len(issues) - errors} warnings")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'files': len(index), 'issues': issues}, f, indent=2)
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
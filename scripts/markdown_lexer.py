@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Streaming Markdown Lexer
+
+Walks a markdown document once and yields non-overlapping, typed spans
+that together cover the whole document. Text transforms (such as glossary
+linking) only rewrite ``text`` spans and leave everything else untouched.
+
+Block-level constructs are recognised line by line, following the
+Python-Markdown extensions enabled in mkdocs.yml:
+- Front matter (``---`` at the top of the file)
+- Fenced code blocks (backticks or tildes, with info strings, at any
+  indentation as allowed by pymdownx.superfences)
+- Indented code blocks (relative to the enclosing list item or admonition)
+- Raw HTML blocks and HTML comments
+- Reference-style link definitions and snippet includes (``--8<--``)
+- Admonition, details and content tab markers (``!!!``, ``???``, ``===``);
+  their indented bodies are lexed as regular markdown
+
+Paragraph text is then split into inline spans: code spans, links and
+images (inline and reference-style, with nesting; shortcut references
+such as ``[text]`` only when the document defines ``[text]: url``),
+autolinks, bare URLs, inline HTML and attribute lists.
+
+Span types: text, front_matter, code_block, html, reference_definition,
+snippet, admonition, inline_code, link, image, autolink, attr_list.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+Span = Tuple[str, int, int]  # (span_type, start, end)
+
+FENCE_RE = re.compile(r'(`{3,})[^`]*$|(~{3,}).*$')
+ADMONITION_RE = re.compile(r'(?:!!!|\?\?\?\+?|===\+?)(?:\s|$)')
+LIST_ITEM_RE = re.compile(r'(?:[-*+]|\d+[.)])(?:\s|$)')
+REFERENCE_DEFINITION_RE = re.compile(r'\[(?!\^)[^\]]+\]:\s*\S')
+REFERENCE_LABEL_RE = re.compile(r'^[ \t]*\[(?!\^)([^\]]+)\]:[ \t]*\S', re.MULTILINE)
+HTML_BLOCK_RE = re.compile(
+    r'</?(address|article|aside|audio|blockquote|canvas|center|details|dialog|div|dl|'
+    r'fieldset|figcaption|figure|footer|form|h[1-6]|header|hr|iframe|li|main|nav|'
+    r'noscript|ol|p|pre|script|section|style|summary|table|tbody|td|textarea|tfoot|'
+    r'th|thead|tr|ul|video)(?=[\s/>]|$)',
+    re.IGNORECASE
+)
+MARKDOWN_ATTR_RE = re.compile(r'\smarkdown\s*=', re.IGNORECASE)
+
+INLINE_START_RE = re.compile(r'\\|`|!\[|\[|<|https?://|\{')
+BACKTICK_RUN_RE = re.compile(r'`+')
+AUTOLINK_RE = re.compile(r'<(?:[A-Za-z][A-Za-z0-9+.-]{1,31}:[^\s<>]*|[^\s<>@]+@[^\s<>@]+)>')
+HTML_TAG_RE = re.compile(
+    r'<!--[\s\S]*?-->|</?[A-Za-z][A-Za-z0-9-]*(?:\s+[^<>]*?)?/?>'
+)
+BARE_URL_RE = re.compile(r'https?://[^\s<>()\[\]`"]*[^\s<>()\[\]`".,;:!?\']')
+ATTR_LIST_RE = re.compile(r'\{:?[ \t]*[#.:A-Za-z][^{}\n]*\}')
+
+
+def iter_spans(content: str) -> Iterator[Span]:
+    """Yield ``(span_type, start, end)`` spans covering content, in order.
+
+    Adjacent text is merged into a single ``text`` span, so text spans are
+    always separated by a non-text span.
+    """
+    labels = _reference_labels(content)
+    return _coalesce(_iter_inline_spans(content, _iter_blocks(content), labels), len(content))
+
+
+def iter_sections(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(span_type, span_text)`` pairs for consumers that want the text."""
+    for span_type, start, end in iter_spans(content):
+        yield span_type, content[start:end]
+
+
+def _coalesce(spans: Iterable[Span], length: int) -> Iterator[Span]:
+    """Fill gaps between spans with text and merge adjacent text spans."""
+    text_start = 0
+
+    for span_type, start, end in spans:
+        if start == end:
+            continue
+
+        if text_start < start:
+            yield 'text', text_start, start
+        yield span_type, start, end
+        text_start = end
+
+    if text_start < length:
+        yield 'text', text_start, length
+
+
+def _indent_width(line: str) -> int:
+    """Return the indentation width of a line, with tabs stopping every 4 columns."""
+    width = 0
+    for char in line:
+        if char == ' ':
+            width += 1
+        elif char == '\t':
+            width += 4 - width % 4
+        else:
+            break
+    return width
+
+
+def _split_lines(content: str) -> List[Tuple[int, int, str]]:
+    """Return ``(start, end, text)`` per line; end includes the newline."""
+    lines = []
+    pos = 0
+    for line in content.splitlines(keepends=True):
+        end = pos + len(line)
+        lines.append((pos, end, line.rstrip('\r\n')))
+        pos = end
+    return lines
+
+
+def _iter_blocks(content: str) -> Iterator[Span]:
+    """Yield block spans; paragraph text is yielded as ``paragraph`` spans."""
+    lines = _split_lines(content)
+    line_count = len(lines)
+    containers = []  # Content indentation of enclosing list items / admonitions
+    paragraph_start = None
+    paragraph_end = None
+    index = 0
+
+    def close_paragraph():
+        nonlocal paragraph_start
+        if paragraph_start is None:
+            return None
+        span = ('paragraph', paragraph_start, paragraph_end)
+        paragraph_start = None
+        return span
+
+    # Front matter
+    if lines and lines[0][2] == '---':
+        for close in range(1, line_count):
+            if lines[close][2] in ('---', '...'):
+                yield 'front_matter', 0, lines[close][1]
+                index = close + 1
+                break
+
+    while index < line_count:
+        line_start, line_end, text = lines[index]
+        stripped = text.lstrip(' \t')
+
+        if not stripped:
+            span = close_paragraph()
+            if span:
+                yield span
+            index += 1
+            continue
+
+        indent = _indent_width(text)
+        while containers and indent < containers[-1]:
+            containers.pop()
+        relative = indent - (containers[-1] if containers else 0)
+        in_paragraph = paragraph_start is not None
+
+        # Fenced code block, closed by a fence of the same kind and at least the same length
+        fence = FENCE_RE.match(stripped)
+        if fence:
+            marker = fence.group(1) or fence.group(2)
+            close_re = re.compile(re.escape(marker[0]) + '{%d,}\\s*$' % len(marker))
+            close = index + 1
+            while close < line_count and not close_re.match(lines[close][2].lstrip(' \t')):
+                close += 1
+            close = min(close, line_count - 1)
+
+            span = close_paragraph()
+            if span:
+                yield span
+            yield 'code_block', line_start, lines[close][1]
+            index = close + 1
+            continue
+
+        # Indented code block (cannot interrupt a paragraph)
+        if relative >= 4 and not in_paragraph:
+            code_indent = indent - relative + 4
+            last = index
+            scan = index + 1
+            while scan < line_count:
+                scan_text = lines[scan][2]
+                if scan_text.strip():
+                    if _indent_width(scan_text) < code_indent:
+                        break
+                    last = scan
+                scan += 1
+
+            yield 'code_block', line_start, lines[last][1]
+            index = last + 1
+            continue
+
+        if relative <= 3:
+            block = None
+
+            if ADMONITION_RE.match(stripped):
+                containers.append(indent + 4)
+                block = ('admonition', line_start, line_end)
+            elif stripped.startswith('--8<--'):
+                block = ('snippet', line_start, line_end)
+            elif REFERENCE_DEFINITION_RE.match(stripped):
+                block = ('reference_definition', line_start, line_end)
+            elif stripped.startswith('<'):
+                block_end = _html_block_end(lines, index, stripped, in_paragraph)
+                if block_end is not None:
+                    block = ('html', line_start, block_end)
+
+            if block:
+                span = close_paragraph()
+                if span:
+                    yield span
+                yield block
+                while index < line_count and lines[index][1] <= block[2]:
+                    index += 1
+                continue
+
+            if stripped.startswith('#'):
+                # Headings are single-line paragraphs
+                span = close_paragraph()
+                if span:
+                    yield span
+                yield 'paragraph', line_start, line_end
+                index += 1
+                continue
+
+            if LIST_ITEM_RE.match(stripped):
+                span = close_paragraph()
+                if span:
+                    yield span
+                containers.append(indent + 4)
+
+        if paragraph_start is None:
+            paragraph_start = line_start
+        paragraph_end = line_end
+        index += 1
+
+    span = close_paragraph()
+    if span:
+        yield span
+
+
+def _html_block_end(lines: List[Tuple[int, int, str]], index: int, stripped: str,
+                    in_paragraph: bool) -> Optional[int]:
+    """Return the end offset of a raw HTML block starting at lines[index], if any."""
+    if stripped.startswith('<!--'):
+        for scan in range(index, len(lines)):
+            text = lines[scan][2]
+            search_from = text.find('<!--') + 4 if scan == index else 0
+            if text.find('-->', search_from) != -1:
+                return lines[scan][1]
+        return lines[-1][1]
+
+    block_tag = HTML_BLOCK_RE.match(stripped)
+    if not block_tag or in_paragraph:
+        return None
+
+    # md_in_html: only the tag line is raw HTML, its content is markdown
+    if MARKDOWN_ATTR_RE.search(stripped):
+        return lines[index][1]
+
+    # Raw until the matching closing tag, falling back to the next blank line
+    tag = block_tag.group(1).lower()
+    tag_re = re.compile(r'<(/?)' + tag + r'(?=[\s/>])[^>]*?(/?)>', re.IGNORECASE)
+    depth = 0
+    for scan in range(index, len(lines)):
+        for match in tag_re.finditer(lines[scan][2]):
+            if match.group(1):
+                depth -= 1
+            elif not match.group(2):
+                depth += 1
+        if depth <= 0:
+            return lines[scan][1]
+
+    for scan in range(index + 1, len(lines)):
+        if not lines[scan][2].strip():
+            return lines[scan - 1][1]
+    return lines[-1][1]
+
+
+def _reference_labels(content: str) -> Set[str]:
+    """Return the normalized labels of the reference definitions in content."""
+    return {_normalize_label(match.group(1)) for match in REFERENCE_LABEL_RE.finditer(content)}
+
+
+def _normalize_label(label: str) -> str:
+    """Normalize a link label as reference lookups do (case and whitespace)."""
+    return ' '.join(label.split()).lower()
+
+
+def _iter_inline_spans(content: str, blocks: Iterable[Span],
+                       labels: Set[str]) -> Iterator[Span]:
+    """Expand paragraph spans into inline spans; pass other blocks through."""
+    for span_type, start, end in blocks:
+        if span_type == 'paragraph':
+            yield from _iter_inline(content, start, end, labels)
+        else:
+            yield span_type, start, end
+
+
+def _iter_inline(content: str, start: int, end: int, labels: Set[str]) -> Iterator[Span]:
+    """Yield the non-text inline spans of content[start:end]."""
+    pos = start
+
+    while True:
+        match = INLINE_START_RE.search(content, pos, end)
+        if not match:
+            return
+
+        token_start = match.start()
+        token = match.group()
+        span = None
+
+        if token == '\\':
+            pos = token_start + 2
+            continue
+
+        if token == '`':
+            run = BACKTICK_RUN_RE.match(content, token_start, end)
+            close = _find_backtick_run(content, run.end(), end, len(run.group()))
+            if close is None:
+                pos = run.end()
+                continue
+            span = ('inline_code', token_start, close)
+        elif token in ('![', '['):
+            link_end = _parse_link(content, token_start + len(token) - 1, end, labels)
+            if link_end is not None:
+                span = ('image' if token == '![' else 'link', token_start, link_end)
+        elif token == '<':
+            tag = AUTOLINK_RE.match(content, token_start, end)
+            if tag:
+                span = ('autolink', token_start, tag.end())
+            else:
+                tag = HTML_TAG_RE.match(content, token_start, end)
+                if tag:
+                    span = ('html', token_start, tag.end())
+        elif token == '{':
+            attrs = ATTR_LIST_RE.match(content, token_start, end)
+            if attrs:
+                span = ('attr_list', token_start, attrs.end())
+        else:
+            url = BARE_URL_RE.match(content, token_start, end)
+            if url:
+                span = ('autolink', token_start, url.end())
+
+        if span is None:
+            pos = token_start + len(token)
+            continue
+
+        yield span
+        pos = span[2]
+
+
+def _find_backtick_run(content: str, pos: int, end: int, length: int) -> Optional[int]:
+    """Return the end of the next backtick run of exactly ``length``, if any."""
+    for run in BACKTICK_RUN_RE.finditer(content, pos, end):
+        if len(run.group()) == length:
+            return run.end()
+    return None
+
+
+def _parse_link(content: str, open_pos: int, end: int, labels: Set[str]) -> Optional[int]:
+    """Parse ``[text](dest)``, ``[text][ref]`` or ``[ref]`` at open_pos and return its end.
+
+    The shortcut form ``[ref]`` is only a link when ``ref`` is one of the
+    defined reference labels; otherwise it is plain bracketed text.
+    """
+    close = _match_delimiter(content, open_pos, end, '[', ']')
+    if close is None:
+        return None
+
+    following = content[close + 1] if close + 1 < end else ''
+    if following == '(':
+        paren_close = _match_delimiter(content, close + 1, end, '(', ')')
+        if paren_close is not None:
+            return paren_close + 1
+    elif following == '[':
+        ref_close = content.find(']', close + 2, end)
+        if ref_close != -1:
+            return ref_close + 1
+
+    if _normalize_label(content[open_pos + 1:close]) in labels:
+        return close + 1
+    return None
+
+
+def _match_delimiter(content: str, open_pos: int, end: int,
+                     opener: str, closer: str) -> Optional[int]:
+    """Return the position of the delimiter closing the one at open_pos."""
+    depth = 0
+    pos = open_pos
+
+    while pos < end:
+        char = content[pos]
+        if char == '\\':
+            pos += 2
+            continue
+        if char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return pos
+        pos += 1
+
+    return None
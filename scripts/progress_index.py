@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Progress Index
+
+Structured index of the completed-task entries in PROGRESS.md and of the
+reports in task-reports/, so questions like "what was completed in
+November?", "which 7.x tasks have no duration?" or "which entries link to a
+report that does not exist?" are answered with an indexed SQLite query
+instead of a full-text parse of both.
+
+A completed-task entry is a ``### Task <id> - <title>`` heading (or a
+``## <date>: Task <id> - <title>`` one) followed by ``- **Field**: value``
+lines; the indexed fields are the completion date, duration, deliverables
+(the top-level items of the Deliverables list) and the report link. Fields
+still holding a placeholder from create-task-report.py (``[UPDATE
+DURATION]``) count as missing. Report files contribute their task ID (from
+the file name), status, date and duration.
+
+Task IDs follow create-task-report.py: dotted numbers (``7.2``) or request
+IDs (``user-001``).
+
+Every query first brings the index up to date: files whose modification
+time and size are unchanged are not read again, so a query on an unchanged
+tree only costs a few ``stat`` calls.
+
+Usage:
+    python scripts/progress_index.py list [--since 2024-11-06] [--until 2024-11-07] [--prefix 7]
+    python scripts/progress_index.py missing duration
+    python scripts/progress_index.py show 7.2
+    python scripts/progress_index.py stats
+    python scripts/progress_index.py verify
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+INDEX_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    task_id TEXT NOT NULL,
+    sort_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT,
+    completed TEXT,
+    duration TEXT,
+    deliverable_count INTEGER NOT NULL,
+    report TEXT
+);
+CREATE TABLE IF NOT EXISTS deliverables (
+    task INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+    path TEXT PRIMARY KEY,
+    task_id TEXT,
+    title TEXT,
+    status TEXT,
+    date TEXT,
+    duration TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_date ON tasks(date);
+CREATE INDEX IF NOT EXISTS tasks_sort_key ON tasks(sort_key);
+CREATE INDEX IF NOT EXISTS tasks_source ON tasks(source);
+CREATE INDEX IF NOT EXISTS tasks_report ON tasks(report);
+CREATE INDEX IF NOT EXISTS deliverables_task ON deliverables(task);
+'''
+
+# The task ID grammar of create-task-report.py (TASK_ID_RE)
+TASK_ID = r'[A-Za-z0-9]+(?:[._-][A-Za-z0-9]+)*'
+
+TASK_HEADING_RE = re.compile(
+    r'^(#{2,3})\s+(?:(\d{4}-\d{2}-\d{2}):\s+)?Task\s+(' + TASK_ID + r')'
+    r'\s*(?:\([^)]*\))?\s*[-–—:]\s*(.+?)\s*$'
+)
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FIELD_RE = re.compile(r'^(?:[-*]\s+)?\*\*([^*]+?)\*\*:?\s*(.*)$')
+LIST_ITEM_RE = re.compile(r'^(\s*)[-*+]\s+(.+)$')
+DATE_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
+LINK_TARGET_RE = re.compile(r'\]\(([^)\s#]+)')
+# task-<id>-report.md, or task-<number>-<topic>...md for numbered tasks
+REPORT_TASK_RE = re.compile(r'^task-(\d+(?:\.\d+)*(?=-)|' + TASK_ID + r'(?=-report\.md$))')
+PLACEHOLDER_RE = re.compile(r'\[UPDATE [^\]]*\]')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+
+TASK_FIELDS = ('date', 'duration', 'deliverables', 'report')
+MISSING_FIELDS = TASK_FIELDS + ('report-file', 'entry')
+
+# (task_id, title, line, date, completed, duration, deliverables, report)
+TaskEntry = Tuple[str, str, int, Optional[str], Optional[str], Optional[str], List[str],
+                  Optional[str]]
+
+
+def sort_key(task_id: str) -> str:
+    """Return a key that orders dotted task IDs numerically (7.2 before 7.10).
+
+    ``.``, ``-`` and ``_`` all separate parts, so ``user-001`` sorts and
+    prefix-matches like ``user.1``. Non-numeric parts are kept as text after
+    a ``~``, which sorts after every number.
+    """
+    return '.'.join(f"{int(part):04d}" if part.isdigit() else f"~{part}"
+                    for part in re.split(r'[._-]', task_id))
+
+
+def _clean(text: str) -> str:
+    return text.replace('✅', '').strip()
+
+
+def _value(text: str) -> str:
+    """Clean a field value; an unfilled ``[UPDATE ...]`` placeholder is empty."""
+    text = _clean(text)
+    return '' if PLACEHOLDER_RE.fullmatch(text) else text
+
+
+def parse_progress(content: str) -> Iterator[TaskEntry]:
+    """Yield the completed-task entries of a PROGRESS.md document."""
+    entry = None
+    field = None
+    item_indent = None
+    in_fence = False
+
+    def finish():
+        if entry is None:
+            return None
+        fields = entry['fields']
+        completed = fields.get('completed') or None
+        date_match = DATE_RE.search(completed or '') or DATE_RE.search(entry['date'] or '')
+        report = LINK_TARGET_RE.search(fields.get('report', ''))
+        # Deliverables are a list, or occasionally a single inline value
+        deliverables = entry['lists'].get('deliverables')
+        if not deliverables:
+            deliverables = [fields['deliverables']] if fields.get('deliverables') else []
+        return (entry['task_id'], entry['title'], entry['line'],
+                date_match.group(1) if date_match else None, completed,
+                fields.get('duration') or None, deliverables,
+                report.group(1) if report else None)
+
+    for line_number, line in enumerate(content.splitlines(), 1):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            task = TASK_HEADING_RE.match(line)
+            level = len(heading.group(1))
+            if task or entry is None or level <= entry['level']:
+                done = finish()
+                if done:
+                    yield done
+                entry = None
+                if task:
+                    entry = {'level': level, 'date': task.group(2), 'task_id': task.group(3),
+                             'title': _clean(task.group(4)), 'line': line_number,
+                             'fields': {}, 'lists': {}}
+                field = None
+            else:
+                # A subsection inside an entry ("### Deliverables") acts as a field
+                field = _clean(heading.group(2)).lower()
+                entry['fields'].setdefault(field, '')
+                item_indent = None
+            continue
+
+        if entry is None or not line.strip():
+            continue
+
+        field_match = FIELD_RE.match(line.strip()) if not line.startswith((' ', '\t')) else None
+        if field_match:
+            field = field_match.group(1).strip().rstrip(':').lower()
+            entry['fields'].setdefault(field, _value(field_match.group(2)))
+            item_indent = None
+            continue
+
+        item = LIST_ITEM_RE.match(line)
+        if item and field is not None:
+            # Only the top-level items of a field's list; deeper ones are details
+            indent = len(item.group(1).expandtabs(4))
+            if item_indent is None:
+                item_indent = indent
+            if indent == item_indent and _value(item.group(2)):
+                entry['lists'].setdefault(field, []).append(_value(item.group(2)))
+
+    done = finish()
+    if done:
+        yield done
+
+
+def parse_report(name: str, content: str) -> Dict[str, Optional[str]]:
+    """Return the task ID, title, status, date and duration of a task report."""
+    task = REPORT_TASK_RE.match(name)
+    report = {'task_id': task.group(1) if task else None,
+              'title': None, 'status': None, 'date': None, 'duration': None}
+
+    for line in content.splitlines():
+        if report['title'] is None and line.startswith('# '):
+            report['title'] = _clean(line[2:])
+            continue
+        field = FIELD_RE.match(line.strip())
+        if field:
+            name = field.group(1).strip().rstrip(':').lower()
+            if name in ('status', 'date', 'duration') and report[name] is None:
+                value = _clean(field.group(2))
+                if name == 'date':
+                    date = DATE_RE.search(value)
+                    value = date.group(1) if date else None
+                report[name] = value or None
+    return report
+
+
+class ProgressIndex:
+    """SQLite index of PROGRESS.md entries and task-reports/ files."""
+
+    def __init__(self, root: Path, path: Path):
+        self.root = root
+        self.path = path
+        self.files_read = 0
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute('PRAGMA foreign_keys = ON')
+
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != INDEX_VERSION:
+            # Unknown or outdated layout: start over
+            self.connection.executescript(
+                'DROP TABLE IF EXISTS deliverables;'
+                'DROP TABLE IF EXISTS tasks;'
+                'DROP TABLE IF EXISTS reports;'
+                'DROP TABLE IF EXISTS files;'
+            )
+            self.connection.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> 'ProgressIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.connection.commit()
+        self.close()
+
+    def commit(self):
+        self.connection.commit()
+
+    def update(self) -> int:
+        """Re-read changed files and drop deleted ones; return the number of files read."""
+        indexed = {path: (mtime_ns, size) for path, mtime_ns, size in
+                   self.connection.execute('SELECT path, mtime_ns, size FROM files')}
+        files = []
+        progress = self.root / 'PROGRESS.md'
+        if progress.exists():
+            files.append(('PROGRESS.md', progress))
+        reports_dir = self.root / 'task-reports'
+        if reports_dir.is_dir():
+            files.extend((f"task-reports/{path.name}", path)
+                         for path in sorted(reports_dir.glob('*.md'))
+                         if path.name not in ('README.md', 'TEMPLATE.md'))
+
+        changed = []
+        for relative, path in files:
+            stat = path.stat()
+            if indexed.pop(relative, None) != (stat.st_mtime_ns, stat.st_size):
+                changed.append((relative, path, stat))
+
+        stale = [(path,) for path in indexed]
+        if not changed and not stale:
+            return 0
+
+        for relative, path, stat in changed:
+            content = path.read_text(encoding='utf-8')
+            if relative == 'PROGRESS.md':
+                self._index_progress(relative, content)
+            else:
+                self._index_report(relative, path.name, content)
+            self.connection.execute('INSERT OR REPLACE INTO files (path, mtime_ns, size) '
+                                    'VALUES (?, ?, ?)', (relative, stat.st_mtime_ns, stat.st_size))
+        self.connection.executemany('DELETE FROM tasks WHERE source = ?', stale)
+        self.connection.executemany('DELETE FROM reports WHERE path = ?', stale)
+        self.connection.executemany('DELETE FROM files WHERE path = ?', stale)
+        self.connection.commit()
+        self.files_read += len(changed)
+        return len(changed)
+
+    def _index_progress(self, source: str, content: str):
+        self.connection.execute('DELETE FROM tasks WHERE source = ?', (source,))
+        for task_id, title, line, date, completed, duration, deliverables, report in \
+                parse_progress(content):
+            row_id = self.connection.execute(
+                'INSERT INTO tasks (source, line, task_id, sort_key, title, date, completed, '
+                'duration, deliverable_count, report) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (source, line, task_id, sort_key(task_id), title, date, completed, duration,
+                 len(deliverables), report)
+            ).lastrowid
+            self.connection.executemany(
+                'INSERT INTO deliverables (task, position, text) VALUES (?, ?, ?)',
+                ((row_id, position, text) for position, text in enumerate(deliverables, 1))
+            )
+
+    def _index_report(self, relative: str, name: str, content: str):
+        report = parse_report(name, content)
+        self.connection.execute(
+            'INSERT OR REPLACE INTO reports (path, task_id, title, status, date, duration) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (relative, report['task_id'], report['title'], report['status'], report['date'],
+             report['duration'])
+        )
+
+    def tasks(self, since: Optional[str] = None, until: Optional[str] = None,
+              prefix: Optional[str] = None) -> List[sqlite3.Row]:
+        """List entries completed in ``[since, until]`` whose ID is ``prefix`` or below it."""
+        conditions, params = [], []
+        if since:
+            conditions.append('date >= ?')
+            params.append(since)
+        if until:
+            conditions.append('date <= ?')
+            params.append(until)
+        if prefix:
+            # "7" matches 7, 7.1 and 7.2.3 but not 70
+            key = sort_key(prefix.rstrip('._-'))
+            # The prefix is user input, so LIKE wildcards in it are escaped
+            pattern = re.sub(r'([\\%_])', r'\\\1', key) + '.%'
+            conditions.append("(sort_key = ? OR sort_key LIKE ? ESCAPE '\\')")
+            params.extend([key, pattern])
+        return self._select_tasks(conditions, params)
+
+    def missing(self, field: str) -> List[sqlite3.Row]:
+        """List entries without a field, or reports without an entry (``entry``)."""
+        if field == 'entry':
+            return self._query(
+                'SELECT r.path, r.task_id, r.title, r.status, r.date, r.duration FROM reports r '
+                'WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.report = r.path) '
+                'ORDER BY r.path'
+            )
+        conditions = {
+            'date': 'date IS NULL',
+            'duration': 'duration IS NULL',
+            'deliverables': 'deliverable_count = 0',
+            'report': 'report IS NULL',
+            'report-file': 'report IS NOT NULL AND report NOT IN (SELECT path FROM reports)',
+        }
+        if field not in conditions:
+            raise ValueError(f"Unknown field: {field} (expected one of {', '.join(MISSING_FIELDS)})")
+        return self._select_tasks([conditions[field]], [])
+
+    def show(self, task_id: str) -> List[Dict]:
+        """Return every entry for a task ID with its deliverables and report details."""
+        entries = []
+        for task in self._select_tasks(['task_id = ?'], [task_id]):
+            entry = dict(task)
+            entry['deliverables'] = [row[0] for row in self.connection.execute(
+                'SELECT text FROM deliverables WHERE task = ? ORDER BY position', (task['id'],)
+            )]
+            report = self._query('SELECT * FROM reports WHERE path = ?', [task['report']])
+            entry['report_file'] = dict(report[0]) if report else None
+            entries.append(entry)
+        return entries
+
+    def stats(self) -> Dict[str, int]:
+        def count(query: str) -> int:
+            return self.connection.execute(query).fetchone()[0]
+
+        return {
+            'entries': count('SELECT COUNT(*) FROM tasks'),
+            'tasks': count('SELECT COUNT(DISTINCT task_id) FROM tasks'),
+            'deliverables': count('SELECT COUNT(*) FROM deliverables'),
+            'reports': count('SELECT COUNT(*) FROM reports'),
+            'first date': count('SELECT MIN(date) FROM tasks'),
+            'last date': count('SELECT MAX(date) FROM tasks'),
+        }
+
+    def _select_tasks(self, conditions: List[str], params: List) -> List[sqlite3.Row]:
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
+        return self._query(
+            'SELECT id, task_id, title, date, completed, duration, deliverable_count, report, '
+            f'source, line FROM tasks {where}ORDER BY date IS NULL, date, sort_key, line', params
+        )
+
+    def _query(self, query: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        cursor = self.connection.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor.execute(query, params).fetchall()
+
+
+# A tree as create-task-report.py leaves it, for ``verify``
+VERIFY_PROGRESS = """# Progress
+
+## Completed Tasks
+
+### Task user-001 - Request one ✅
+- **Completed**: 2024-11-07
+- **Duration**: [UPDATE DURATION]
+- **Deliverables**: [UPDATE DELIVERABLES]
+- **Report**: [Task user-001 Report](task-reports/task-user-001-report.md)
+
+### Task 7.2 - Numbered task ✅
+- **Completed**: 2024-11-06
+- **Duration**: ~2 hours
+- **Deliverables**:
+  - docs/page.md
+- **Report**: [Task 7.2 Report](task-reports/task-7.2-page-report.md)
+"""
+VERIFY_REPORTS = {
+    'task-user-001-report.md': '# Task user-001 Completion Report\n- **Status**: Completed\n',
+    'task-user-002-report.md': '# Task user-002 Completion Report\n',
+    'task-7.2-page-report.md': '# Task 7.2 Completion Report\n',
+}
+
+
+def verify() -> List[str]:
+    """Index VERIFY_PROGRESS and VERIFY_REPORTS and check the queries; return failures."""
+    failures = []
+
+    def expect(what: str, actual, expected):
+        if actual != expected:
+            failures.append(f"{what}: got {actual!r}, expected {expected!r}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / 'PROGRESS.md').write_text(VERIFY_PROGRESS, encoding='utf-8')
+        (root / 'task-reports').mkdir()
+        for name, content in VERIFY_REPORTS.items():
+            (root / 'task-reports' / name).write_text(content, encoding='utf-8')
+
+        with ProgressIndex(root, root / 'progress-index.sqlite') as index:
+            index.update()
+            entries = index.show('user-001')
+            expect('show user-001 entries', len(entries), 1)
+            if entries:
+                expect('user-001 report status', (entries[0]['report_file'] or {}).get('status'),
+                       'Completed')
+            expect('list --prefix user', [row['task_id'] for row in index.tasks(prefix='user')],
+                   ['user-001'])
+            expect('list --prefix 7', [row['task_id'] for row in index.tasks(prefix='7')], ['7.2'])
+            for field in ('duration', 'deliverables'):
+                expect(f"missing {field}", [row['task_id'] for row in index.missing(field)],
+                       ['user-001'])
+            expect('missing entry', [(row['path'], row['task_id'])
+                                     for row in index.missing('entry')],
+                   [('task-reports/task-user-002-report.md', 'user-002')])
+    return failures
+
+
+def _print_tasks(rows: List[sqlite3.Row]):
+    for row in rows:
+        print(f"{row['task_id']:<9} {row['date'] or '?':<10}  {row['duration'] or '-':<22.22}  "
+              f"{row['title']}")
+    print(f"\n{len(rows)} entries")
+
+
+def main():
+    root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='Query completed tasks and task reports')
+    parser.add_argument('--root', type=Path, default=root,
+                        help='Directory containing PROGRESS.md and task-reports/')
+    parser.add_argument('--index', type=Path, default=root / '.progress-index.sqlite',
+                        help='Progress index file')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='List completed tasks')
+    list_parser.add_argument('--since', metavar='YYYY-MM-DD', help='Completed on or after')
+    list_parser.add_argument('--until', metavar='YYYY-MM-DD', help='Completed on or before')
+    list_parser.add_argument('--prefix', metavar='ID',
+                             help='Task ID or parent ID (7 matches 7, 7.1, 7.2.3)')
+    missing_parser = subparsers.add_parser(
+        'missing', help='List entries missing a field (entry: reports with no progress entry)')
+    missing_parser.add_argument('field', choices=MISSING_FIELDS)
+    show_parser = subparsers.add_parser('show', help='Show the entries of one task')
+    show_parser.add_argument('task_id')
+    subparsers.add_parser('stats', help='Show index size')
+    subparsers.add_parser('verify', help='Check parsing and queries on a built-in example tree')
+    args = parser.parse_args()
+
+    if args.command == 'verify':
+        failures = verify()
+        for failure in failures:
+            print(failure)
+        if failures:
+            print(f"{len(failures)} progress index checks failed")
+            return 1
+        print("All progress index checks pass")
+        return 0
+
+    if not (args.root / 'PROGRESS.md').exists():
+        print(f"Error: PROGRESS.md not found in {args.root}")
+        return 1
+
+    with ProgressIndex(args.root, args.index) as index:
+        index.update()
+
+        if args.command == 'stats':
+            results = index.stats()
+        elif args.command == 'show':
+            results = index.show(args.task_id)
+        elif args.command == 'list':
+            results = index.tasks(args.since, args.until, args.prefix)
+        else:
+            results = index.missing(args.field)
+
+        if args.json:
+            if isinstance(results, list):
+                results = [dict(row) for row in results]
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        elif args.command == 'stats':
+            for name, value in results.items():
+                print(f"{name.capitalize() + ':':<14} {value}")
+        elif args.command == 'show':
+            if not results:
+                print(f"No progress entry for task {args.task_id}")
+                return 1
+            for entry in results:
+                print(f"Task {entry['task_id']} - {entry['title']}")
+                print(f"  Entry:     {entry['source']}:{entry['line']}")
+                print(f"  Completed: {entry['completed'] or '-'}")
+                print(f"  Duration:  {entry['duration'] or '-'}")
+                report = entry['report_file']
+                status = '' if report is None else f" ({report['status'] or 'no status'})"
+                print(f"  Report:    {entry['report'] or '-'}{status}"
+                      f"{' (missing)' if entry['report'] and report is None else ''}")
+                for text in entry['deliverables']:
+                    print(f"  - {text}")
+                print()
+        elif args.command == 'missing' and args.field == 'entry':
+            for row in results:
+                print(f"{row['path']}  (task {row['task_id'] or '?'}, {row['date'] or 'no date'})")
+            print(f"\n{len(results)} reports without a progress entry")
+        else:
+            if args.command == 'missing' and args.field == 'report-file':
+                for row in results:
+                    print(f"{row['task_id']:<9} {row['report']}")
+                print(f"\n{len(results)} entries link to a missing report")
+            else:
+                _print_tasks(results)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Report Templates
+
+A small compiled template language for task reports (a subset of Mustache):
+
+- ``{{name}}`` inserts a field; dotted names (``{{task.id}}``) look into
+  nested dictionaries and ``{{.}}`` is the current list item. Missing fields
+  render as nothing.
+- ``{{#name}}...{{/name}}`` renders its body once for a true value, once per
+  item for a list (each item's fields become visible inside, along with its
+  1-based ``index``), and not at all for a false, empty or missing value.
+  Inside a list item only the item's fields and ``index`` are visible: a
+  field the item lacks renders as nothing rather than as the field of the
+  same name outside the loop (a file without a ``description`` must not
+  show the task description).
+- ``{{^name}}...{{/name}}`` renders its body only when ``name`` is false,
+  empty or missing, which gives fallbacks for optional sections.
+
+A section tag alone on its line removes the whole line, so loops over list
+items do not leave blank lines behind.
+
+A template is tokenized once by compile_template(); rendering a compiled
+template only walks its node list and joins the output, so it costs
+O(output) however many placeholders the template has.
+
+``--verify`` renders ``RENDER_CASES`` and exits with status 1 if any output
+differs from the expected one.
+
+Usage:
+    template = compile_template(text)
+    report = template.render({'task_id': '3.3', 'files_created': [...]})
+
+    python scripts/report_template.py --verify
+"""
+
+import argparse
+import re
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+TAG_RE = re.compile(r'\{\{\s*([#^/]?)\s*([\w.-]+)\s*\}\}')
+
+
+class TemplateError(ValueError):
+    """Raised for malformed templates (unbalanced or mismatched sections)."""
+
+
+# Compiled nodes: literal text, (FIELD, path) or (SECTION, path, inverted, children)
+FIELD = 0
+SECTION = 1
+Node = Union[str, Tuple]
+
+# (template, context, expected output)
+RENDER_CASES = [
+    ('{{#files}}{{index}}. {{path}} - {{description}}\n{{/files}}',
+     {'description': 'Task', 'files': [{'path': 'a.md', 'description': 'New'}, {'path': 'b.md'}]},
+     '1. a.md - New\n2. b.md - \n'),                      # no fallback to the outer field
+    ('{{#items}}[{{.}}]{{/items}}', {'items': ['x', 'y']}, '[x][y]'),
+    ('{{#items}}{{index}}{{/items}}', {'index': 9, 'items': [{'index': 'own'}, {}]}, 'own2'),
+    ('{{#status}}{{status}}{{/status}}{{^status}}TBD{{/status}}', {'status': 'Done'}, 'Done'),
+    ('{{#status}}{{status}}{{/status}}{{^status}}TBD{{/status}}', {}, 'TBD'),
+    ('{{#task}}{{task.id}} {{id}}{{/task}}', {'task': {'id': '3.3'}}, '3.3 3.3'),
+]
+
+
+class _ItemScope(dict):
+    """Holds the ``index`` of a list item, just below the item on the context
+    stack; lookups that reach it stop there instead of going on outwards."""
+
+
+class Template:
+    """A compiled template; render() it with any number of contexts."""
+
+    def __init__(self, nodes: List[Node]):
+        self.nodes = nodes
+
+    def render(self, context: Dict[str, Any]) -> str:
+        parts: List[str] = []
+        _render(self.nodes, [context], parts)
+        return ''.join(parts)
+
+
+def compile_template(text: str) -> Template:
+    """Tokenize template text into a Template."""
+    root: List[Node] = []
+    stack = [(None, root, 0)]  # (section name, children, line) of open sections
+    position = 0
+
+    for match in TAG_RE.finditer(text):
+        kind, name = match.group(1), match.group(2)
+        start, end = match.start(), match.end()
+
+        if kind:
+            # A section tag alone on its line takes the line with it
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', end)
+            line_end = len(text) if line_end == -1 else line_end + 1
+            if not text[line_start:start].strip() and not text[end:line_end].strip():
+                start, end = line_start, line_end
+
+        if start > position:
+            stack[-1][1].append(text[position:start])
+        position = max(position, end)
+
+        if not kind:
+            stack[-1][1].append((FIELD, _path(name)))
+        elif kind in '#^':
+            children: List[Node] = []
+            stack[-1][1].append((SECTION, _path(name), kind == '^', children))
+            stack.append((name, children, text.count('\n', 0, match.start()) + 1))
+        else:
+            open_name, _, line = stack[-1]
+            if open_name != name:
+                where = f"line {text.count(chr(10), 0, match.start()) + 1}"
+                if open_name is None:
+                    raise TemplateError(f"{where}: closing {{{{/{name}}}}} without an open section")
+                raise TemplateError(f"{where}: {{{{/{name}}}}} closes {{{{#{open_name}}}}} "
+                                    f"opened on line {line}")
+            stack.pop()
+
+    if len(stack) > 1:
+        name, _, line = stack[-1]
+        raise TemplateError(f"line {line}: section {{{{#{name}}}}} is never closed")
+
+    if position < len(text):
+        root.append(text[position:])
+    return Template(root)
+
+
+def _path(name: str) -> Tuple[str, ...]:
+    return ('.',) if name == '.' else tuple(name.split('.'))
+
+
+def _lookup(stack: List[Any], path: Tuple[str, ...]) -> Any:
+    """Find a (dotted) name in the innermost context that has its first part.
+
+    The search stops at the innermost list item, so a name the item lacks
+    is missing rather than taken from the enclosing contexts.
+    """
+    if path == ('.',):
+        return stack[-1]
+    for context in reversed(stack):
+        if isinstance(context, dict) and path[0] in context:
+            value = context[path[0]]
+            for part in path[1:]:
+                value = value.get(part) if isinstance(value, dict) else None
+            return value
+        if type(context) is _ItemScope:
+            return None
+    return None
+
+
+def _render(nodes: List[Node], stack: List[Any], parts: List[str]):
+    for node in nodes:
+        if isinstance(node, str):
+            parts.append(node)
+        elif node[0] == FIELD:
+            value = _lookup(stack, node[1])
+            if value is not None:
+                parts.append(str(value))
+        else:
+            _, path, inverted, children = node
+            value = _lookup(stack, path)
+            if inverted:
+                if not value:
+                    _render(children, stack, parts)
+            elif isinstance(value, (list, tuple)):
+                scope = _ItemScope()
+                stack.append(scope)
+                for index, item in enumerate(value, 1):
+                    scope['index'] = index
+                    stack.append(item)
+                    _render(children, stack, parts)
+                    stack.pop()
+                stack.pop()
+            elif value:
+                stack.append(value)
+                _render(children, stack, parts)
+                stack.pop()
+
+
+def verify() -> List[str]:
+    """Render RENDER_CASES; return failures."""
+    failures = []
+    for text, context, expected in RENDER_CASES:
+        output = compile_template(text).render(context)
+        if output != expected:
+            failures.append(f"{text!r}: rendered {output!r}, expected {expected!r}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report template engine')
+    parser.add_argument('--verify', action='store_true',
+                        help='Render the built-in cases and check their output')
+    args = parser.parse_args()
+
+    if not args.verify:
+        parser.print_help()
+        return 0
+
+    failures = verify()
+    for failure in failures:
+        print(failure)
+    if failures:
+        print(f"{len(failures)} render mismatches")
+        return 1
+    print(f"All {len(RENDER_CASES)} render cases match")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
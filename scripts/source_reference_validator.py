@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Source Reference Validator
+
+Checks the Movian source references of the documentation (``src/...c:123``,
+``res/ecmascript/...js:10-20``, ``glwskins/...view:3``) against a Movian
+checkout:
+
+- the referenced file must exist
+- referenced lines must lie within the file, and a range must not be reversed
+- when the reference names a symbol (``es_kvstore_set()`` in
+  `src/ecmascript/es_kvstore.c:80-95`), the symbol's definition must lie
+  within the referenced lines; otherwise the reference has drifted and the
+  warning says where the symbol is now
+
+References are read from the shared documentation corpus and validated in
+one batch, grouped by source file, so each referenced file is indexed once.
+A file's index holds its line start offsets (an ``array('I')`` built from a
+memory map of the file) and the lines where referenced symbols are defined.
+Indexes are cached on disk keyed by the file's git blob hash, so unchanged
+files are not read again on the next run; in a git checkout the hashes of
+unmodified files come from the git index without reading them either.
+
+Usage:
+    python scripts/source_reference_validator.py --movian-source ../movian [--json report.json]
+"""
+
+import argparse
+import base64
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import re
+import subprocess
+import sys
+import time
+from array import array
+from itertools import accumulate, islice, repeat
+from operator import add
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from docs_corpus import DocsCorpus
+
+CACHE_VERSION = 1
+
+# Definition lines by source file suffix; group 1 is the defined name
+DEFINITION_RES = {
+    '.c': re.compile(rb'(?:[A-Za-z_][\w \t*]*?[ \t*])?([A-Za-z_]\w*)[ \t]*\((?![^\n]*;[ \t]*$)'
+                     rb'|[ \t]*#[ \t]*define[ \t]+([A-Za-z_]\w*)'),
+    '.js': re.compile(rb'.*?(?:\bfunction[ \t]+([\w$]+)|\b([\w$]+)[ \t]*[:=][ \t]*function\b'
+                      rb'|\.([\w$]+)[ \t]*=(?!=)|^[ \t]*([\w$]+)[ \t]*\([^)\n]*\)[ \t]*\{)'),
+}
+DEFINITION_RES['.h'] = DEFINITION_RES['.c']
+
+# Bytes of a memory-mapped file copied at a time while finding line starts
+LINE_SCAN_CHUNK = 1 << 20
+
+IDENTIFIER_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$')
+
+
+class LineIndex:
+    """Line start offsets of one source file, read through a memory map."""
+
+    def __init__(self, path: Path, offsets: Optional[array] = None):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+        if offsets is None:
+            offsets = array('I', [0])
+            # The map is split a chunk at a time, so at most LINE_SCAN_CHUNK
+            # bytes of the file are copied at once. Each chunk starts inside
+            # the line begun by the previous one; its last piece continues in
+            # the next chunk, and every other piece starts a new line one byte
+            # after its end.
+            for base in range(0, self.size, LINE_SCAN_CHUNK):
+                pieces = self.data[base:base + LINE_SCAN_CHUNK].split(b'\n')
+                pieces.pop()
+                offsets.extend(islice(accumulate(map(add, map(len, pieces), repeat(1)),
+                                                 initial=base), 1, None))
+        self.offsets = offsets
+
+    @property
+    def line_count(self) -> int:
+        # A final newline ends the last line instead of starting a new one
+        count = len(self.offsets)
+        return count - 1 if self.offsets[-1] == self.size else count
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line containing a byte offset."""
+        return bisect.bisect_right(self.offsets, offset)
+
+    def definitions(self, symbol: str) -> List[int]:
+        """Return the lines defining symbol, or every line using it if none does."""
+        name = symbol.encode('utf-8')
+        definition_re = DEFINITION_RES.get(self.path.suffix)
+        uses = []
+        definitions = []
+
+        position = self.data.find(name)
+        while position >= 0:
+            end = position + len(name)
+            # Whole identifiers only
+            if (position == 0 or self.data[position - 1] not in IDENTIFIER_BYTES) and \
+                    (end == self.size or self.data[end] not in IDENTIFIER_BYTES):
+                line = self.line_of(position)
+                if not uses or uses[-1] != line:
+                    uses.append(line)
+                    if definition_re is not None:
+                        line_end = self.offsets[line] if line < len(self.offsets) else self.size
+                        match = definition_re.match(self.data[self.offsets[line - 1]:line_end])
+                        if match and name in match.groups():
+                            definitions.append(line)
+            position = self.data.find(name, end)
+
+        return definitions or uses
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+def _git(root: Path, *args: str, stdin: Optional[str] = None) -> Optional[str]:
+    """Run a git command in root and return its output, or None if it failed."""
+    try:
+        result = subprocess.run(['git', *args], cwd=root, capture_output=True,
+                                input=stdin, text=True, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def git_blob_hashes(root: Path, files: List[str]) -> Dict[str, str]:
+    """Return the git blob hash of each file.
+
+    In a git checkout, unmodified files take the hash recorded in the index
+    without being read; the rest are hashed by one ``git hash-object`` call.
+    """
+    hashes = {}
+    staged = _git(root, 'ls-files', '--stage', '-z')
+    modified = _git(root, 'ls-files', '--modified', '-z')
+    if staged is not None and modified is not None:
+        wanted = set(files)
+        changed = set(modified.split('\0'))
+        for record in staged.split('\0'):
+            info, _, path = record.partition('\t')
+            if path in wanted and path not in changed:
+                hashes[path] = info.split()[1]
+
+    remaining = [file for file in files if file not in hashes]
+    if remaining:
+        output = _git(root, 'hash-object', '--stdin-paths', stdin='\n'.join(remaining) + '\n')
+        if output is not None and len(output.split()) == len(remaining):
+            hashes.update(zip(remaining, output.split()))
+        else:
+            # No usable git: hash the blobs the same way
+            for file in remaining:
+                with open(root / file, 'rb') as f:
+                    data = f.read()
+                hashes[file] = hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+    return hashes
+
+
+class SourceReferenceValidator:
+    """Validates documentation source references against a Movian checkout."""
+
+    def __init__(self, source_root: Path, cache_path: Optional[Path] = None):
+        self.source_root = source_root
+        self.cache_path = cache_path
+        self._cache = self._load_cache()
+        self._used = set()  # blob hashes looked up this run
+        self.issues: List[Dict] = []
+        self.total = 0
+        self.files_indexed = 0
+        self.cache_hits = 0
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def save_cache(self):
+        """Write the indexes of files referenced this run (atomically)."""
+        if self.cache_path is None:
+            return
+
+        files = {blob: entry for blob, entry in self._cache.items() if blob in self._used}
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': files}, f)
+        os.replace(temp_path, self.cache_path)
+
+    def validate(self, references: Iterable[Tuple[str, List]]) -> List[Dict]:
+        """Check ``(document_path, [file, start_line, end_line, line, symbol])`` references."""
+        by_file: Dict[str, List[Tuple[str, List]]] = {}
+        for document_path, reference in references:
+            self.total += 1
+            by_file.setdefault(reference[0], []).append((document_path, reference))
+
+        existing = []
+        for file, uses in by_file.items():
+            if (self.source_root / file).is_file():
+                existing.append(file)
+            else:
+                for document_path, reference in uses:
+                    self._report(document_path, reference, 'error', f"File does not exist: {file}")
+
+        blobs = git_blob_hashes(self.source_root, existing)
+        for file in existing:
+            self._check_file(file, blobs[file], by_file[file])
+
+        return self.issues
+
+    def _check_file(self, file: str, blob: str, uses: List[Tuple[str, List]]):
+        self._used.add(blob)
+        entry = self._cache.get(blob)
+        if entry is not None:
+            self.cache_hits += 1
+
+        symbols = {reference[4] for _, reference in uses
+                   if reference[1] is not None and reference[4]}
+        if entry is None or not symbols <= entry['symbols'].keys():
+            # Scan the file (or just look up new symbols with the cached offsets)
+            offsets = None
+            if entry is not None:
+                offsets = array('I')
+                offsets.frombytes(base64.b64decode(entry['offsets']))
+            index = LineIndex(self.source_root / file, offsets)
+            if entry is None:
+                self.files_indexed += 1
+                entry = self._cache[blob] = {
+                    'lines': index.line_count,
+                    'offsets': base64.b64encode(index.offsets.tobytes()).decode('ascii'),
+                    'symbols': {},
+                }
+            for symbol in symbols - entry['symbols'].keys():
+                entry['symbols'][symbol] = index.definitions(symbol)
+            index.close()
+
+        for document_path, reference in uses:
+            self._check_reference(document_path, reference, entry)
+
+    def _check_reference(self, document_path: str, reference: List, entry: Dict):
+        _, start, end, _, symbol = reference
+        if start is None:
+            return
+
+        line_count = entry['lines']
+        if start > line_count:
+            self._report(document_path, reference, 'error',
+                         f"Start line {start} exceeds file length ({line_count} lines)")
+            return
+        if end is not None and end > line_count:
+            self._report(document_path, reference, 'error',
+                         f"End line {end} exceeds file length ({line_count} lines)")
+            return
+        if end is not None and start > end:
+            self._report(document_path, reference, 'error',
+                         f"Start line {start} is greater than end line {end}")
+            return
+
+        if not symbol:
+            return
+        lines = entry['symbols'].get(symbol)
+        if not lines:
+            self._report(document_path, reference, 'warning', f"Symbol not found: {symbol}")
+            return
+
+        last = end if end is not None else start
+        if any(start <= line <= last for line in lines):
+            return
+
+        # The closest definition tells how far the code has moved
+        now = min(lines, key=lambda line: abs(line - start))
+        self._report(document_path, reference, 'warning',
+                     f"Drifted: {symbol} is now at line {now} ({now - start:+d} lines)",
+                     drift=now - start, symbol_line=now)
+
+    def _report(self, document_path: str, reference: List, severity: str, message: str,
+                **details):
+        file, start, end = reference[:3]
+        target = file
+        if start is not None:
+            target += f":{start}" + (f"-{end}" if end is not None else '')
+        issue = {'file': document_path, 'line': reference[3], 'target': target,
+                 'severity': severity, 'message': message}
+        issue.update(details)
+        self.issues.append(issue)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate source references against Movian')
+    parser.add_argument('--docs-root', type=Path,
+                        default=Path(__file__).parent.parent / 'docs',
+                        help='Root directory of documentation')
+    parser.add_argument('--movian-source', type=Path, default=os.environ.get('MOVIAN_SOURCE'),
+                        help='Movian source checkout (default: $MOVIAN_SOURCE)')
+    parser.add_argument('--cache', type=Path,
+                        default=Path(__file__).parent.parent / '.source-reference-cache.json',
+                        help='Source file index cache')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Index every referenced file and do not write the cache')
+    parser.add_argument('--json', type=Path, help='Save issues to a JSON file')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args()
+
+    if not args.docs_root.exists():
+        print(f"Error: Documentation root not found: {args.docs_root}")
+        return 1
+    if args.movian_source is None or not args.movian_source.is_dir():
+        print(f"Error: Movian source not found: {args.movian_source}")
+        print("Pass --movian-source or set MOVIAN_SOURCE")
+        return 1
+
+    corpus = DocsCorpus(args.docs_root)
+    validator = SourceReferenceValidator(args.movian_source,
+                                         None if args.no_cache else args.cache)
+    start = time.perf_counter()
+    issues = validator.validate(corpus.source_references())
+    elapsed = time.perf_counter() - start
+    validator.save_cache()
+
+    errors = [issue for issue in issues if issue['severity'] == 'error']
+    warnings = [issue for issue in issues if issue['severity'] == 'warning']
+
+    if not args.quiet:
+        for issue in errors + warnings:
+            print(f"{issue['file']}:{issue['line']}: {issue['severity']}: "
+                  f"{issue['message']} ({issue['target']})")
+        if issues:
+            print()
+
+    print(f"Checked {validator.total} references in {elapsed:.2f}s: "
+          f"{len(errors)} errors, {len(warnings)} warnings")
+    print(f"Source files: {validator.files_indexed} indexed, {validator.cache_hits} cached")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'total': validator.total, 'issues': issues}, f, indent=2)
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler
+
+Lightweight wall-time and allocation accounting for the stages of a
+documentation script (load, read, match, write, ...), both in total and
+per file.
+
+A disabled profiler hands out one shared no-op context manager, so the
+stage hooks can stay in place on normal runs at the cost of a method call.
+When enabled, each stage records its wall time and, optionally, the peak
+memory allocated while it ran (via ``tracemalloc``).
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+_DISABLED = nullcontext()
+
+
+class StageProfiler:
+    """Collects per-stage and per-file timings."""
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.stages = {}  # stage -> {'calls', 'seconds', 'peak_bytes'}
+        self.files = []  # per-file records, in completion order
+        self._current = None  # record of the file being processed
+
+    def start(self):
+        """Begin allocation tracing if it was requested."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def stage(self, name: str) -> ContextManager:
+        """Time a stage; a shared no-op when the profiler is disabled."""
+        if not self.enabled:
+            return _DISABLED
+        return self._time_stage(name)
+
+    def file(self, path: Path) -> ContextManager:
+        """Attribute the stages run inside the block to one file."""
+        if not self.enabled:
+            return _DISABLED
+        return self._time_file(path)
+
+    @contextmanager
+    def _time_stage(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = 0
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(0, peak - base)
+
+            self._add_stage(name, 1, elapsed, peak)
+            if self._current is not None:
+                stages = self._current['stages']
+                stages[name] = stages.get(name, 0.0) + elapsed
+                self._current['peak_bytes'] = max(self._current['peak_bytes'], peak)
+
+    @contextmanager
+    def _time_file(self, path: Path) -> Iterator[None]:
+        record = {'path': str(path), 'seconds': 0.0, 'peak_bytes': 0, 'stages': {}}
+        self._current = record
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self._current = None
+            self.files.append(record)
+
+    def _add_stage(self, name: str, calls: int, seconds: float, peak: int):
+        totals = self.stages.get(name)
+        if totals is None:
+            totals = self.stages[name] = {'calls': 0, 'seconds': 0.0, 'peak_bytes': 0}
+        totals['calls'] += calls
+        totals['seconds'] += seconds
+        totals['peak_bytes'] = max(totals['peak_bytes'], peak)
+
+    def take_file_record(self) -> Optional[Dict]:
+        """Remove and return the most recent file record (used by worker processes)."""
+        return self.files.pop() if self.files else None
+
+    def add_file_record(self, record: Dict):
+        """Merge a file record produced by another profiler, e.g. in a worker."""
+        self.files.append(record)
+        for name, seconds in record['stages'].items():
+            self._add_stage(name, 1, seconds, record['peak_bytes'])
+
+    def slowest_files(self, count: int) -> List[Dict]:
+        return sorted(self.files, key=lambda record: record['seconds'], reverse=True)[:count]
+
+    def to_dict(self) -> Dict:
+        return {
+            'stages': self.stages,
+            'files': sorted(self.files, key=lambda record: record['path']),
+        }
+
+    def dump(self, path: Path):
+        """Write stage totals and per-file records as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def print_report(self, top: int = 0):
+        """Print stage totals and, if top > 0, the slowest files."""
+        total = sum(totals['seconds'] for totals in self.stages.values())
+
+        print(f"\n{'Stage':<16} {'Calls':>7} {'Time (s)':>10} {'Share':>7}"
+              + (f" {'Peak alloc':>12}" if self.trace_memory else ""))
+        for name, totals in sorted(self.stages.items(), key=lambda item: -item[1]['seconds']):
+            share = totals['seconds'] / total if total else 0.0
+            line = f"{name:<16} {totals['calls']:>7} {totals['seconds']:>10.3f} {share:>7.1%}"
+            if self.trace_memory:
+                line += f" {_format_bytes(totals['peak_bytes']):>12}"
+            print(line)
+
+        if top > 0 and self.files:
+            print(f"\nSlowest {min(top, len(self.files))} files:")
+            for record in self.slowest_files(top):
+                slowest_stage = max(record['stages'].items(), key=lambda item: item[1],
+                                    default=('-', 0.0))
+                print(f"  {record['seconds'] * 1000:8.1f} ms  {record['path']} "
+                      f"(mostly {slowest_stage[0]})")
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    for unit in ('KB', 'MB'):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GB"
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Glossary Term Index
+
+Persistent inverted index from glossary entries to the documents and lines
+where they are used, built from the scans link-glossary-terms.py already
+performs. Both unlinked mentions of a term (or one of its variations) and
+existing links to its glossary anchor are recorded.
+
+The index is a SQLite database, so questions like "where is Courier
+(Property) used?" or "which terms are never used?" are answered with an
+indexed query instead of a rescan of the documentation.
+
+Usage:
+    python scripts/term_index.py where "Courier (Property)"
+    python scripts/term_index.py unused
+    python scripts/term_index.py files TERM [TERM ...]
+    python scripts/term_index.py stats
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+INDEX_VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    anchor TEXT NOT NULL,
+    display_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    anchor TEXT NOT NULL,
+    text TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    linked INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS occurrences_anchor ON occurrences(anchor);
+CREATE INDEX IF NOT EXISTS occurrences_document ON occurrences(document_id);
+CREATE INDEX IF NOT EXISTS terms_anchor ON terms(anchor);
+'''
+
+# (anchor, matched text, line, already linked)
+Occurrence = Tuple[str, str, int, bool]
+
+
+class TermIndex:
+    """SQLite-backed map of glossary anchors to the lines that use them."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute('PRAGMA foreign_keys = ON')
+
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != INDEX_VERSION:
+            # Unknown or outdated layout: start over
+            self.connection.executescript(
+                'DROP TABLE IF EXISTS occurrences;'
+                'DROP TABLE IF EXISTS documents;'
+                'DROP TABLE IF EXISTS terms;'
+            )
+            self.connection.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> 'TermIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.connection.commit()
+        self.close()
+
+    def commit(self):
+        self.connection.commit()
+
+    def set_terms(self, terms: Dict[str, Tuple[str, str]]):
+        """Replace the ``term -> (anchor, display_name)`` table."""
+        self.connection.execute('DELETE FROM terms')
+        self.connection.executemany(
+            'INSERT INTO terms (term, anchor, display_name) VALUES (?, ?, ?)',
+            ((term, anchor, display_name) for term, (anchor, display_name) in terms.items())
+        )
+
+    def indexed_paths(self) -> Set[str]:
+        return {row[0] for row in self.connection.execute('SELECT path FROM documents')}
+
+    def replace_document(self, path: str, occurrences: Iterable[Occurrence]):
+        """Store the occurrences found by a fresh scan of one document."""
+        row = self.connection.execute('SELECT id FROM documents WHERE path = ?', (path,)).fetchone()
+        if row is None:
+            document_id = self.connection.execute(
+                'INSERT INTO documents (path) VALUES (?)', (path,)
+            ).lastrowid
+        else:
+            document_id = row[0]
+            self.connection.execute('DELETE FROM occurrences WHERE document_id = ?',
+                                    (document_id,))
+
+        self.connection.executemany(
+            'INSERT INTO occurrences (document_id, anchor, text, line, linked) '
+            'VALUES (?, ?, ?, ?, ?)',
+            ((document_id, anchor, text, line, int(linked))
+             for anchor, text, line, linked in occurrences)
+        )
+
+    def remove_document(self, path: str):
+        self.connection.execute('DELETE FROM documents WHERE path = ?', (path,))
+
+    def retain_documents(self, paths: Iterable[str]):
+        """Drop documents that are no longer part of the docs tree."""
+        keep = set(paths)
+        stale = [(path,) for path in self.indexed_paths() if path not in keep]
+        self.connection.executemany('DELETE FROM documents WHERE path = ?', stale)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Return the glossary anchor for a term, variation, display name or anchor."""
+        row = self.connection.execute(
+            'SELECT anchor FROM terms WHERE term = ? OR anchor = ? LIMIT 1',
+            (name.lower(), name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def where(self, name: str) -> List[Tuple[str, int, str, bool]]:
+        """List ``(path, line, text, linked)`` for every use of a glossary entry."""
+        anchor = self.resolve(name)
+        if anchor is None:
+            return []
+        return [
+            (path, line, text, bool(linked))
+            for path, line, text, linked in self.connection.execute(
+                'SELECT d.path, o.line, o.text, o.linked FROM occurrences o '
+                'JOIN documents d ON d.id = o.document_id '
+                'WHERE o.anchor = ? ORDER BY d.path, o.line', (anchor,)
+            )
+        ]
+
+    def files(self, names: Iterable[str]) -> List[str]:
+        """Return the documents that use any of the given glossary entries."""
+        anchors = {anchor for anchor in map(self.resolve, names) if anchor is not None}
+        if not anchors:
+            return []
+        placeholders = ', '.join('?' * len(anchors))
+        return [row[0] for row in self.connection.execute(
+            f'SELECT DISTINCT d.path FROM occurrences o JOIN documents d ON d.id = o.document_id '
+            f'WHERE o.anchor IN ({placeholders}) ORDER BY d.path', sorted(anchors)
+        )]
+
+    def unused(self) -> List[str]:
+        """Return display names of glossary entries used by no document."""
+        return [row[0] for row in self.connection.execute(
+            'SELECT DISTINCT t.display_name FROM terms t WHERE NOT EXISTS '
+            '(SELECT 1 FROM occurrences o WHERE o.anchor = t.anchor) '
+            'ORDER BY t.display_name'
+        )]
+
+    def stats(self) -> Dict[str, int]:
+        def count(query: str) -> int:
+            return self.connection.execute(query).fetchone()[0]
+
+        return {
+            'entries': count('SELECT COUNT(DISTINCT anchor) FROM terms'),
+            'terms': count('SELECT COUNT(*) FROM terms'),
+            'documents': count('SELECT COUNT(*) FROM documents'),
+            'occurrences': count('SELECT COUNT(*) FROM occurrences'),
+            'linked': count('SELECT COUNT(*) FROM occurrences WHERE linked'),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the glossary term index')
+    parser.add_argument('--index', type=Path,
+                        default=Path(__file__).parent.parent / '.glossary-term-index.sqlite',
+                        help='Term index built by link-glossary-terms.py')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    where_parser = subparsers.add_parser('where', help='List the lines that use a glossary term')
+    where_parser.add_argument('term')
+    files_parser = subparsers.add_parser('files', help='List the files that use any of the terms')
+    files_parser.add_argument('terms', nargs='+')
+    subparsers.add_parser('unused', help='List glossary entries no document uses')
+    subparsers.add_parser('stats', help='Show index size')
+    args = parser.parse_args()
+
+    if not args.index.exists():
+        print(f"Error: Term index not found: {args.index}")
+        print("Run scripts/link-glossary-terms.py to build it")
+        return 1
+
+    with TermIndex(args.index) as index:
+        if args.command == 'where':
+            uses = index.where(args.term)
+            if index.resolve(args.term) is None:
+                print(f"Unknown glossary term: {args.term}")
+                return 1
+            for path, line, text, linked in uses:
+                print(f"{path}:{line}: {text}{'' if linked else ' (unlinked)'}")
+            print(f"\n{len(uses)} uses in {len({use[0] for use in uses})} files")
+        elif args.command == 'files':
+            for path in index.files(args.terms):
+                print(path)
+        elif args.command == 'unused':
+            names = index.unused()
+            for name in names:
+                print(name)
+            print(f"\n{len(names)} unused glossary entries")
+        else:
+            for name, value in index.stats().items():
+                print(f"{name.capitalize() + ':':<13} {value}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
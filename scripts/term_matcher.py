@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern Term Matcher
+
+Finds every occurrence of a set of glossary terms in a single scan of the
+text, instead of running one regular expression per term.
+
+The terms are compiled into a trie. The trie is rendered once as a nested
+regular expression alternation (so candidate start positions are located by
+the C regex engine in one linear pass) and is also kept as a node graph used
+to enumerate every term that matches at a candidate position.
+
+Matching semantics are the same as running ``\\b<term>\\b`` with
+``re.IGNORECASE`` for each term separately:
+- Terms are matched case-insensitively
+- Both ends of a match must sit on a regex word boundary
+- Occurrences of the same term never overlap each other, while occurrences
+  of different terms may (overlap resolution is left to the caller)
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class _TrieNode:
+    """A single trie node keyed by lowercase characters."""
+
+    __slots__ = ('children', 'term', 'rank')
+
+    def __init__(self):
+        self.children = {}
+        self.term = None  # Lowercase term ending at this node
+        self.rank = 0     # Insertion order of that term
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by the regex ``\\w`` class."""
+    return char.isalnum() or char == '_'
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text without changing its length (offsets must stay valid)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters expand when lowercased; keep those as-is
+    return ''.join(
+        char.lower() if len(char.lower()) == 1 else char
+        for char in text
+    )
+
+
+class TermMatcher:
+    """Compiled matcher for a fixed set of terms.
+
+    Build it once per run and reuse it for every file.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._root = _TrieNode()
+        self.term_count = 0
+
+        for term in terms:
+            term = term.lower()
+            if term:
+                self._add_term(term)
+
+        self._scanner = self._compile_scanner()
+
+    def _add_term(self, term: str):
+        """Insert a lowercase term into the trie."""
+        node = self._root
+        for char in term:
+            child = node.children.get(char)
+            if child is None:
+                child = _TrieNode()
+                node.children[char] = child
+            node = child
+
+        if node.term is None:
+            node.term = term
+            node.rank = self.term_count
+            self.term_count += 1
+
+    def _compile_scanner(self) -> Optional['re.Pattern']:
+        """Compile the trie into a single zero-width lookahead pattern."""
+        if not self._root.children:
+            return None
+
+        trie_pattern = self._node_pattern(self._root)
+        return re.compile(r'\b(?=' + trie_pattern + r')', re.IGNORECASE)
+
+    def _node_pattern(self, node: _TrieNode) -> str:
+        """Render the subtree below a node as a regex alternation."""
+        branches = []
+        for char in sorted(node.children):
+            branches.append(re.escape(char) + self._node_pattern(node.children[char]))
+
+        if node.term is not None:
+            branches.append(r'\b')
+
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, term)`` for every term occurrence in text.
+
+        Matches are ordered by start position, then by term insertion order.
+        """
+        if self._scanner is None:
+            return
+
+        folded = _fold_case(text)
+        text_length = len(text)
+        last_end = {}  # term -> end of its previous occurrence
+
+        for candidate in self._scanner.finditer(text):
+            start = candidate.start()
+            hits = self._match_at(text, folded, start, text_length)
+
+            for rank, end, term in hits:
+                if last_end.get(term, 0) > start:
+                    continue
+                last_end[term] = end
+                yield start, end, term
+
+    def _match_at(self, text: str, folded: str, start: int,
+                  text_length: int) -> List[Tuple[int, int, str]]:
+        """Walk the trie from start and collect terms ending on a word boundary."""
+        hits = []
+        node = self._root
+        pos = start
+
+        while pos < text_length:
+            node = node.children.get(folded[pos])
+            if node is None:
+                break
+            pos += 1
+
+            if node.term is not None:
+                before = _is_word_char(text[pos - 1])
+                after = pos < text_length and _is_word_char(text[pos])
+                if before != after:
+                    hits.append((node.rank, pos, node.term))
+
+        hits.sort()
+        return hits
+
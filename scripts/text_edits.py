@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Text Edit Application
+
+Applies a batch of span replacements to a string in a single pass.
+
+Each edit is a ``(start, end, replacement)`` tuple addressing the original
+content. The output is assembled from the untouched segments and the
+replacements and joined once, so the cost is O(len(content) + total
+replacement length) no matter how many edits are applied.
+"""
+
+from typing import Iterable, List, Tuple
+
+Edit = Tuple[int, int, str]
+
+
+def apply_edits(content: str, edits: Iterable[Edit]) -> str:
+    """Return content with every ``(start, end, replacement)`` edit applied.
+
+    Edits may be given in any order but must not overlap. Offsets always
+    refer to the original content.
+    """
+    ordered = sorted(edits, key=lambda edit: (edit[0], edit[1]))
+    if not ordered:
+        return content
+
+    segments: List[str] = []
+    current_pos = 0
+
+    for start, end, replacement in ordered:
+        if start < current_pos:
+            raise ValueError(f"Overlapping edit at {start}-{end}")
+        if end < start or end > len(content):
+            raise ValueError(f"Edit {start}-{end} is outside the content")
+
+        segments.append(content[current_pos:start])
+        segments.append(replacement)
+        current_pos = end
+
+    segments.append(content[current_pos:])
+    return ''.join(segments)